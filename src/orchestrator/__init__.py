@@ -12,17 +12,39 @@ This package provides:
 __version__ = "0.1.0"
 __author__ = "Multi-LLM Orchestrator Contributors"
 
+from typing import TYPE_CHECKING, Any
+
 from .config import Config
 from .router import Router
 
+if TYPE_CHECKING:
+    from .langchain import MultiLLMOrchestrator
+
 # Backward compatibility
 LLMRouter = Router
 
-# Optional LangChain integration
-try:
-    from .langchain import MultiLLMOrchestrator
+# Optional LangChain integration, imported lazily by __getattr__ below.
+# Without langchain-core the class still imports but raises on instantiation.
+__all__ = ["Router", "LLMRouter", "Config", "MultiLLMOrchestrator"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the LangChain integration on first access (PEP 562).
+
+    Keeps ``import orchestrator`` from loading langchain-core, which is slow
+    to import, in pipelines that never use MultiLLMOrchestrator.
+
+    Args:
+        name: Attribute requested from the package
+
+    Returns:
+        The MultiLLMOrchestrator class
+
+    Raises:
+        AttributeError: If name is not a lazily exported attribute
+    """
+    if name == "MultiLLMOrchestrator":
+        from .langchain import MultiLLMOrchestrator
 
-    __all__ = ["Router", "LLMRouter", "Config", "MultiLLMOrchestrator"]
-except ImportError:
-    # langchain-core not installed, skip MultiLLMOrchestrator export
-    __all__ = ["Router", "LLMRouter", "Config"]
+        return MultiLLMOrchestrator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
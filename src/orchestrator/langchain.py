@@ -34,14 +34,18 @@ Example:
 """
 
 import asyncio
+from collections import OrderedDict
 from collections.abc import AsyncIterator, Iterator
-from typing import Any
+from typing import Any, ClassVar
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from .providers.base import GenerationParams
 from .router import Router
 
+# Default number of responses kept by the opt-in exact-match response cache
+DEFAULT_RESPONSE_CACHE_SIZE = 256
+
 # Conditional import for langchain-core
 try:
     from langchain_core.language_models.llms import BaseLLM
@@ -74,6 +78,10 @@ if LANGCHAIN_AVAILABLE:
 
         Attributes:
             router: Router instance for managing LLM provider selection and routing
+            cache_responses: Reuse responses for repeated (prompt, params) pairs
+                instead of routing them again (default: False)
+            response_cache_size: Maximum number of cached responses; the least
+                recently used entry is evicted first
 
         Example:
             ```python
@@ -100,11 +108,31 @@ if LANGCHAIN_AVAILABLE:
             ```
         """
 
+        # Identifier of this LLM type for LangChain. LangChain reads it on
+        # every call, so it is a plain class attribute rather than a property
+        # (ClassVar keeps Pydantic from turning it into a private attribute)
+        _llm_type: ClassVar[str] = "multi-llm-orchestrator"
+
         router: Router = Field(
             ...,
             description="Router instance for managing LLM provider selection and routing"
         )
 
+        # Exact-match response cache (opt-in). Unlike LangChain's `cache`
+        # field, the key includes per-call parameters such as temperature.
+        cache_responses: bool = Field(
+            default=False,
+            description="Reuse responses for repeated (prompt, params) pairs"
+        )
+        response_cache_size: int = Field(
+            default=DEFAULT_RESPONSE_CACHE_SIZE,
+            ge=1,
+            description="Maximum number of cached responses (LRU eviction)"
+        )
+        _response_cache: OrderedDict[tuple[Any, ...], str] = PrivateAttr(
+            default_factory=OrderedDict
+        )
+
         def __init__(self, router: Router, **kwargs: Any) -> None:
             """Initialize MultiLLMOrchestrator with a Router instance.
 
@@ -127,15 +155,6 @@ if LANGCHAIN_AVAILABLE:
             # BaseLLM doesn't accept router in signature, but Pydantic model requires it
             super().__init__(router=router, **kwargs)  # type: ignore[call-arg]
 
-        @property
-        def _llm_type(self) -> str:
-            """Return identifier for this LLM type.
-
-            Returns:
-                String identifier "multi-llm-orchestrator" for LangChain
-            """
-            return "multi-llm-orchestrator"
-
         def _map_params(
             self, stop: list[str] | None = None, **kwargs: Any
         ) -> GenerationParams:
@@ -170,6 +189,38 @@ if LANGCHAIN_AVAILABLE:
             # GenerationParams will use defaults for missing parameters
             return GenerationParams(**params_dict)
 
+        async def _route(self, prompt: str, params: GenerationParams) -> str:
+            """Route a prompt, serving repeats from the response cache if enabled.
+
+            Args:
+                prompt: Input text prompt
+                params: Mapped generation parameters
+
+            Returns:
+                Generated (or cached) text response from the Router
+            """
+            if not self.cache_responses:
+                return await self.router.route(prompt, params=params)
+
+            key = (
+                prompt,
+                params.max_tokens,
+                params.temperature,
+                params.top_p,
+                None if params.stop is None else tuple(params.stop),
+            )
+            cache = self._response_cache
+            cached = cache.get(key)
+            if cached is not None:
+                cache.move_to_end(key)
+                return cached
+
+            text = await self.router.route(prompt, params=params)
+            cache[key] = text
+            if len(cache) > self.response_cache_size:
+                cache.popitem(last=False)
+            return text
+
         def _generate(
             self,
             prompts: list[str],
@@ -203,7 +254,7 @@ if LANGCHAIN_AVAILABLE:
             generations = []
             for prompt in prompts:
                 # Call router.route() through asyncio.run() (creates isolated event loop)
-                text = asyncio.run(self.router.route(prompt, params=params))
+                text = asyncio.run(self._route(prompt, params))
                 generations.append([Generation(text=text)])
             return LLMResult(generations=generations)
 
@@ -234,7 +285,7 @@ if LANGCHAIN_AVAILABLE:
             # Map parameters (uses defaults from GenerationParams for missing params)
             params = self._map_params(stop, **kwargs)
             # Call router.route() through asyncio.run() (creates isolated event loop)
-            return asyncio.run(self.router.route(prompt, params=params))
+            return asyncio.run(self._route(prompt, params))
 
         async def _acall(
             self, prompt: str, stop: list[str] | None = None, **kwargs: Any
@@ -263,7 +314,7 @@ if LANGCHAIN_AVAILABLE:
             # Map parameters (uses defaults from GenerationParams for missing params)
             params = self._map_params(stop, **kwargs)
             # Direct async call to router.route()
-            return await self.router.route(prompt, params=params)
+            return await self._route(prompt, params)
 
         async def _astream(  # type: ignore[override]
             self,
@@ -5,8 +5,12 @@ performance metrics of LLM providers, including request counts, latency,
 error rates, and health status determination.
 """
 
+import math
+import time
 from collections import deque
-from datetime import datetime, timedelta
+from collections.abc import Sequence
+from datetime import datetime
+from itertools import islice
 from typing import Literal
 
 # ============================================================================
@@ -34,6 +38,18 @@ ERROR_RATE_THRESHOLD_UNHEALTHY = 0.6
 # Latency multiplier threshold for degraded status (2x average)
 LATENCY_THRESHOLD_FACTOR_DEGRADED = 2.0
 
+# Smoothing factor for the latency EWMA (weight of the newest sample)
+EWMA_ALPHA = 0.2
+
+# A failed request raises the EWMA to at least this multiple of its own
+# latency, so providers that time out sort last. The penalty does not
+# compound: repeated failures keep the EWMA at the same level
+EWMA_ERROR_PENALTY_FACTOR = 2.0
+
+# Upper bound for the EWMA (10 minutes), so a single huge latency cannot
+# push it out of reach of later successes
+EWMA_MAX_LATENCY_MS = 600_000.0
+
 # ============================================================================
 # TYPE DEFINITIONS
 # ============================================================================
@@ -57,6 +73,8 @@ class ProviderMetrics:
         successful_requests: Number of successful requests
         failed_requests: Number of failed requests
         total_latency_ms: Sum of latency for successful requests only (in milliseconds)
+        ewma_latency_ms: Exponentially weighted latency (in milliseconds) that
+            jumps up on failures, or None before the first request
 
     Example:
         ```python
@@ -73,6 +91,25 @@ class ProviderMetrics:
         ```
     """
 
+    # One instance per provider is updated on every request: a fixed layout
+    # keeps attribute access cheap. New attributes must be listed here.
+    __slots__ = (
+        "total_requests",
+        "successful_requests",
+        "failed_requests",
+        "total_latency_ms",
+        "_latency_window",
+        "_latency_window_sum",
+        "_error_timestamps",
+        "ewma_latency_ms",
+        "total_prompt_tokens",
+        "total_completion_tokens",
+        "total_cost",
+        "_cost_compensation",
+        "_gen",
+        "_cached_health",
+    )
+
     def __init__(self) -> None:
         """Initialize ProviderMetrics with zero counters and empty collections."""
         self.total_requests: int = 0
@@ -82,14 +119,26 @@ class ProviderMetrics:
 
         # Rolling window for latency (automatically limited to LATENCY_WINDOW_SIZE)
         self._latency_window: deque[float] = deque(maxlen=LATENCY_WINDOW_SIZE)
+        # Running sum of _latency_window, so the rolling average is O(1)
+        self._latency_window_sum: float = 0.0
 
-        # Error timestamps (manually cleaned up in record_error)
-        self._error_timestamps: deque[datetime] = deque()
+        # Error timestamps as POSIX seconds (manually cleaned up in
+        # record_error); floats keep the pruning loop to plain comparisons
+        self._error_timestamps: deque[float] = deque()
+
+        # Failure-penalized latency EWMA used to order fallback candidates
+        self.ewma_latency_ms: float | None = None
 
         # Token tracking and cost estimation (v0.7.0)
         self.total_prompt_tokens: int = 0
         self.total_completion_tokens: int = 0
         self.total_cost: float = 0.0
+        # Kahan compensation term: low-order bits lost from total_cost so far
+        self._cost_compensation: float = 0.0
+
+        # Bumped by every record_* call; health_status is cached per generation
+        self._gen: int = 0
+        self._cached_health: tuple[int, HealthStatus] | None = None
 
     def record_success(
         self,
@@ -124,18 +173,103 @@ class ProviderMetrics:
             )
             ```
         """
+        self._gen += 1
         self.total_requests += 1
         self.successful_requests += 1
         self.total_latency_ms += latency_ms
-        self._latency_window.append(latency_ms)
+        # The full deque drops its oldest sample on append; keep the sum in step.
+        # Window and EWMA are read once into locals (one attribute lookup each)
+        window = self._latency_window
+        evicted = window[0] if len(window) == LATENCY_WINDOW_SIZE else 0.0
+        window.append(latency_ms)
+        self._latency_window_sum += latency_ms - evicted
+        ewma = self.ewma_latency_ms
+        self.ewma_latency_ms = (
+            latency_ms
+            if ewma is None
+            else EWMA_ALPHA * latency_ms + (1 - EWMA_ALPHA) * ewma
+        )
 
         # Update token and cost tracking (v0.7.0+)
         self.total_prompt_tokens += prompt_tokens
         self.total_completion_tokens += completion_tokens
-        self.total_cost += cost
+        self._add_cost(cost)
+
+    def record_success_batch(
+        self,
+        latencies_ms: Sequence[float],
+        prompt_tokens: Sequence[int] = (),
+        completion_tokens: Sequence[int] = (),
+        costs: Sequence[float] = (),
+    ) -> None:
+        """Record many successful requests at once.
+
+        Equivalent to calling record_success() once per latency (in order),
+        but every counter is updated once. Useful for replaying or backfilling
+        metrics. The token and cost sequences may be shorter than
+        latencies_ms (or empty); missing values count as zero.
+
+        Args:
+            latencies_ms: Request latencies in milliseconds, oldest first
+            prompt_tokens: Prompt token counts per request
+            completion_tokens: Completion token counts per request
+            costs: Request costs in RUB
+
+        Example:
+            ```python
+            metrics.record_success_batch(
+                [120.0, 95.5, 143.2],
+                prompt_tokens=[50, 40, 60],
+                completion_tokens=[30, 25, 35],
+            )
+            ```
+        """
+        if not latencies_ms:
+            return
+
+        self._gen += 1
+        count = len(latencies_ms)
+        self.total_requests += count
+        self.successful_requests += count
+        self.total_latency_ms += math.fsum(latencies_ms)
+
+        # Only the newest LATENCY_WINDOW_SIZE samples can remain in the window
+        # (islice rather than slicing: a Sequence need not support slices)
+        self._latency_window.extend(
+            islice(latencies_ms, max(0, count - LATENCY_WINDOW_SIZE), None)
+        )
+        self._latency_window_sum = math.fsum(self._latency_window)
+
+        # The EWMA depends on sample order, so it is folded sequentially
+        ewma = self.ewma_latency_ms
+        for latency_ms in latencies_ms:
+            ewma = (
+                latency_ms
+                if ewma is None
+                else EWMA_ALPHA * latency_ms + (1 - EWMA_ALPHA) * ewma
+            )
+        self.ewma_latency_ms = ewma
+
+        self.total_prompt_tokens += sum(prompt_tokens)
+        self.total_completion_tokens += sum(completion_tokens)
+        self._add_cost(math.fsum(costs))
+
+    def _add_cost(self, cost: float) -> None:
+        """Add cost to total_cost with Kahan compensated summation.
+
+        Keeps total_cost accurate to about one rounding error over millions
+        of small additions, at the price of a few extra float operations.
+
+        Args:
+            cost: Cost in RUB to add
+        """
+        adjusted = cost - self._cost_compensation
+        total = self.total_cost + adjusted
+        self._cost_compensation = (total - self.total_cost) - adjusted
+        self.total_cost = total
 
     def record_error(
-        self, latency_ms: float, error_timestamp: datetime
+        self, latency_ms: float, error_timestamp: datetime | None = None
     ) -> None:
         """Record a failed request with its latency and timestamp.
 
@@ -145,23 +279,34 @@ class ProviderMetrics:
 
         Args:
             latency_ms: Request latency in milliseconds (even for failed requests)
-            error_timestamp: Timestamp when the error occurred (should be timezone-aware)
+            error_timestamp: Timestamp when the error occurred (should be
+                timezone-aware). Defaults to now, read as a POSIX float
+                without building a datetime.
 
         Example:
             ```python
             from datetime import UTC, datetime
 
+            metrics.record_error(50.0)  # Failed just now
             metrics.record_error(50.0, datetime.now(UTC))
             ```
         """
+        self._gen += 1
         self.total_requests += 1
         self.failed_requests += 1
         # Note: total_latency_ms is NOT updated here - avg_latency_ms
         # is calculated only from successful requests
-        self._error_timestamps.append(error_timestamp)
+        error_time = (
+            time.time() if error_timestamp is None else error_timestamp.timestamp()
+        )
+        self._error_timestamps.append(error_time)
+        self.ewma_latency_ms = min(
+            EWMA_MAX_LATENCY_MS,
+            max(self.ewma_latency_ms or 0.0, EWMA_ERROR_PENALTY_FACTOR * latency_ms),
+        )
 
         # Clean up old error timestamps (beyond ERROR_WINDOW_SECONDS)
-        cutoff = error_timestamp - timedelta(seconds=ERROR_WINDOW_SECONDS)
+        cutoff = error_time - ERROR_WINDOW_SECONDS
         while self._error_timestamps and self._error_timestamps[0] < cutoff:
             self._error_timestamps.popleft()
 
@@ -211,9 +356,9 @@ class ProviderMetrics:
             print(metrics.rolling_avg_latency_ms)  # ~104.5 (average of last 10)
             ```
         """
-        if len(self._latency_window) == 0:
+        if not self._latency_window:
             return None
-        return sum(self._latency_window) / len(self._latency_window)
+        return self._latency_window_sum / len(self._latency_window)
 
     @property
     def total_tokens(self) -> int:
@@ -265,6 +410,9 @@ class ProviderMetrics:
         5. Otherwise:
            → "healthy"
 
+        The result is cached until the next record_* call, so repeated reads
+        between requests cost a single integer comparison.
+
         Returns:
             Health status: "healthy", "degraded", or "unhealthy"
 
@@ -281,27 +429,42 @@ class ProviderMetrics:
             print(metrics.health_status)  # "healthy"
             ```
         """
+        cached = self._cached_health
+        if cached is not None and cached[0] == self._gen:
+            return cached[1]
+
+        status = self._compute_health_status()
+        self._cached_health = (self._gen, status)
+        return status
+
+    def _compute_health_status(self) -> HealthStatus:
+        """Evaluate the health rules of health_status against current counters.
+
+        Inlines recent_error_rate, rolling_avg_latency_ms and avg_latency_ms
+        so each counter is read once; results match the properties exactly.
+        """
+        total = self.total_requests
+
         # If insufficient data, return "healthy" (optimistic default)
-        if self.total_requests < MIN_REQUESTS_FOR_HEALTH:
+        if total < MIN_REQUESTS_FOR_HEALTH:
             return "healthy"
 
-        # Check error rate thresholds
-        error_rate = self.recent_error_rate
+        # Check error rate thresholds (recent_error_rate)
+        error_rate = len(self._error_timestamps) / total
         if error_rate >= ERROR_RATE_THRESHOLD_UNHEALTHY:
             return "unhealthy"
         if error_rate >= ERROR_RATE_THRESHOLD_DEGRADED:
             return "degraded"
 
         # Check latency degradation (only if enough data)
-        if self.total_requests >= MIN_REQUESTS_FOR_LATENCY_CHECK:
-            rolling_avg = self.rolling_avg_latency_ms
-            avg_latency = self.avg_latency_ms
-
+        window_len = len(self._latency_window)
+        successful = self.successful_requests
+        if total >= MIN_REQUESTS_FOR_LATENCY_CHECK and window_len and successful:
+            rolling_avg = self._latency_window_sum / window_len
+            avg_latency = self.total_latency_ms / successful
             if (
-                rolling_avg is not None
-                and avg_latency > 0
-                and rolling_avg
-                > LATENCY_THRESHOLD_FACTOR_DEGRADED * avg_latency
+                avg_latency > 0
+                and rolling_avg > LATENCY_THRESHOLD_FACTOR_DEGRADED * avg_latency
             ):
                 return "degraded"
 
@@ -47,6 +47,35 @@ PRICING: dict[str, dict[str, float]] = {
 }
 
 
+def _provider_pricing(provider_name: str) -> dict[str, float] | None:
+    """Find the pricing table for a provider name.
+
+    Looks the name up case-insensitively and falls back to prefix matching,
+    so variants like "mock-1" or "gigachat-prod" resolve to their base
+    provider.
+
+    Args:
+        provider_name: Provider name (case-insensitive)
+
+    Returns:
+        The provider's {model: price} table, or None for unknown providers
+    """
+    # Normalize provider name to lowercase for lookup
+    provider_key = provider_name.lower()
+
+    # Get provider pricing config
+    provider_pricing = PRICING.get(provider_key)
+
+    # If not found directly, check if it's a variant (e.g., "mock-1" → "mock")
+    if not provider_pricing:
+        # Try to match by prefix (e.g., "mock-1" → "mock", "gigachat-dev" → "gigachat")
+        for known_provider in PRICING.keys():
+            if provider_key.startswith(known_provider):
+                return PRICING[known_provider]
+
+    return provider_pricing
+
+
 def calculate_cost(
     provider_name: str, model: str | None, total_tokens: int
 ) -> float:
@@ -91,20 +120,7 @@ def calculate_cost(
         - Unknown models use provider's default price (with warning)
         - Unknown providers return 0.0 cost (with warning)
     """
-    # Normalize provider name to lowercase for lookup
-    provider_key = provider_name.lower()
-
-    # Get provider pricing config
-    provider_pricing = PRICING.get(provider_key)
-
-    # If not found directly, check if it's a variant (e.g., "mock-1" → "mock")
-    if not provider_pricing:
-        # Try to match by prefix (e.g., "mock-1" → "mock", "gigachat-dev" → "gigachat")
-        for known_provider in PRICING.keys():
-            if provider_key.startswith(known_provider):
-                provider_pricing = PRICING[known_provider]
-                break
-
+    provider_pricing = _provider_pricing(provider_name)
     if not provider_pricing:
         logger.warning(
             f"Unknown provider '{provider_name}', assuming zero cost. "
@@ -134,7 +150,8 @@ def get_price_per_1k(provider_name: str, model: str | None) -> float:
     cost for a specific token count.
 
     Args:
-        provider_name: Provider name (case-insensitive)
+        provider_name: Provider name (case-insensitive). Variants such as
+                      "gigachat-prod" resolve by prefix, as in calculate_cost().
         model: Model name (optional, uses default if None)
 
     Returns:
@@ -156,8 +173,7 @@ def get_price_per_1k(provider_name: str, model: str | None) -> float:
         # Returns: 0.0
         ```
     """
-    provider_key = provider_name.lower()
-    provider_pricing = PRICING.get(provider_key, {})
+    provider_pricing = _provider_pricing(provider_name) or {}
     return provider_pricing.get(
         model or "default", provider_pricing.get("default", 0.0)
     )
@@ -11,7 +11,7 @@ from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator, Callable
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 # ============================================================================
 # CONFIGURATION MODELS
@@ -112,6 +112,10 @@ class GenerationParams(BaseModel):
     These parameters allow fine-tuning the output characteristics of LLM
     text generation requests.
 
+    Instances are immutable, so a single params object can be shared safely
+    between concurrent requests (e.g., route_many() or hedged attempts).
+    Use model_copy(update=...) to derive modified parameters.
+
     Attributes:
         temperature: Controls randomness in generation (0.0 = deterministic, 2.0 = very random)
         max_tokens: Maximum number of tokens to generate in the response
@@ -129,6 +133,8 @@ class GenerationParams(BaseModel):
         ```
     """
 
+    model_config = ConfigDict(frozen=True)
+
     temperature: float = Field(
         0.7,
         ge=0.0,
@@ -38,14 +38,21 @@ Example:
 """
 
 import asyncio
+import hashlib
 import json
 import time
 import uuid
+import weakref
 from collections.abc import AsyncIterator
-from typing import Any, cast
+from typing import Any, ClassVar, cast
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None  # type: ignore[assignment]
+
 from .base import (
     AuthenticationError,
     BaseProvider,
@@ -57,6 +64,83 @@ from .base import (
     TimeoutError,
 )
 
+# HTTP status code -> (exception class, message prefix) for API error responses.
+# 5xx responses map to ProviderError("Server error") in _handle_error.
+_STATUS_TO_EXC: dict[int, tuple[type[ProviderError], str]] = {
+    400: (InvalidRequestError, "Bad request"),
+    401: (AuthenticationError, "Authentication failed"),
+    404: (InvalidRequestError, "Invalid model or endpoint"),
+    422: (InvalidRequestError, "Validation error"),
+    429: (RateLimitError, "Rate limit exceeded"),
+}
+
+
+def _loads(content: bytes | str) -> Any:
+    """Decode a JSON response body, using orjson when it is installed.
+
+    orjson comes with the optional "fast" extra
+    (pip install multi-llm-orchestrator[fast]).
+
+    Args:
+        content: Raw response body, or one SSE data payload
+
+    Returns:
+        Decoded JSON value
+
+    Raises:
+        ValueError: If the body is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+class _SharedToken:
+    """OAuth2 token state shared by providers with identical credentials.
+
+    Attributes:
+        access_token: Current OAuth2 access token, or None if not yet fetched
+        expires_at: Token expiration timestamp in seconds, or None
+        expires_at_monotonic: The same deadline on the time.monotonic() clock,
+            used for validity checks so wall-clock jumps cannot affect them
+    """
+
+    __slots__ = (
+        "access_token",
+        "expires_at",
+        "expires_at_monotonic",
+        "_locks",
+        "__weakref__",
+    )
+
+    def __init__(self) -> None:
+        self.access_token: str | None = None
+        self.expires_at: float | None = None
+        self.expires_at_monotonic: float | None = None
+        self._locks: dict[asyncio.AbstractEventLoop, asyncio.Lock] = {}
+
+    def lock(self) -> asyncio.Lock:
+        """Return the refresh lock for these credentials in the running loop.
+
+        An asyncio.Lock binds to the first loop that waits on it, while the
+        token may be used from several loops over the process lifetime
+        (e.g. one asyncio.run() per LangChain call). Each loop therefore
+        gets its own lock; locks of closed loops are dropped.
+
+        Returns:
+            Async lock serializing token refreshes within the running loop
+        """
+        loop = asyncio.get_running_loop()
+        lock = self._locks.get(loop)
+        if lock is None:
+            self._locks = {
+                other: other_lock
+                for other, other_lock in self._locks.items()
+                if not other.is_closed()
+            }
+            lock = self._locks[loop] = asyncio.Lock()
+        return lock
+
 
 class GigaChatProvider(BaseProvider):
     """GigaChat (Sber) LLM provider with OAuth2 authentication.
@@ -74,6 +158,15 @@ class GigaChatProvider(BaseProvider):
         _token_expires_at: Token expiration timestamp in seconds (internal)
         _token_lock: Async lock for thread-safe token updates (internal)
         _client: HTTPX async client for API requests (internal)
+        _chat_url: Chat completions endpoint URL (internal)
+        _model_name: Model name sent with every request (internal)
+
+    Token Sharing:
+        Providers created with the same authorization key and scope share a
+        single token (and a single refresh lock) via a process-wide cache, so
+        N provider instances issue one OAuth2 request per token lifetime
+        instead of N. The cache is keyed by a SHA-256 hash of the key, so the
+        secret itself is never stored as a dictionary key.
 
     OAuth2 Flow:
         1. Authorization key is used to obtain access_token via OAuth2 endpoint
@@ -109,7 +202,20 @@ class GigaChatProvider(BaseProvider):
     DEFAULT_SCOPE: str = "GIGACHAT_API_PERS"
     DEFAULT_MODEL: str = "GigaChat"
 
-    def __init__(self, config: ProviderConfig) -> None:
+    # Short timeout for the OAuth2 request made by health_check()
+    HEALTH_CHECK_TIMEOUT: httpx.Timeout = httpx.Timeout(5.0)
+
+    # Process-wide token cache: (sha256(api_key), scope, oauth_url) -> token.
+    # Entries are dropped once no provider with those credentials is alive.
+    _TOKEN_CACHE: ClassVar[
+        weakref.WeakValueDictionary[tuple[str, str, str], _SharedToken]
+    ] = weakref.WeakValueDictionary()
+
+    def __init__(
+        self,
+        config: ProviderConfig,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
         """Initialize GigaChat provider with configuration.
 
         Args:
@@ -121,6 +227,11 @@ class GigaChatProvider(BaseProvider):
                 - max_retries: Maximum retry attempts (default: 3)
                 - model: Model name (default: "GigaChat")
                 - scope: OAuth2 scope (default: "GIGACHAT_API_PERS")
+            http_client: Optional shared HTTPX client. Pass one client to
+                several providers to reuse a single connection pool. The
+                configured timeout is still applied per request, but SSL
+                verification is taken from the shared client (verify_ssl is
+                ignored). The caller owns the client and must close it.
 
         Raises:
             ValueError: If required configuration is missing
@@ -134,6 +245,10 @@ class GigaChatProvider(BaseProvider):
                 scope="GIGACHAT_API_CORP"
             )
             provider = GigaChatProvider(config)
+
+            # Share one connection pool between providers
+            client = httpx.AsyncClient()
+            provider = GigaChatProvider(config, http_client=client)
             ```
         """
         super().__init__(config)
@@ -142,39 +257,121 @@ class GigaChatProvider(BaseProvider):
         if not config.api_key:
             raise ValueError("api_key is required for GigaChatProvider")
 
-        # Token management state
-        self._access_token: str | None = None
-        self._token_expires_at: float | None = None  # timestamp in seconds
-        self._token_lock = asyncio.Lock()
+        # Token management state (shared with providers using the same credentials)
+        cache_key = (
+            hashlib.sha256(config.api_key.encode()).hexdigest(),
+            config.scope or self.DEFAULT_SCOPE,
+            self.OAUTH_URL,
+        )
+        self._token = self._TOKEN_CACHE.setdefault(cache_key, _SharedToken())
+
+        # Request constants, fixed for the lifetime of the provider
+        self._chat_url = (
+            f"{config.base_url or self.DEFAULT_BASE_URL}/chat/completions"
+        )
+        self._model_name = config.model or self.DEFAULT_MODEL
+
+        # Timeout is passed per request so it also applies to a shared client
+        self._timeout = httpx.Timeout(config.timeout)
 
         # HTTP client with configured timeout and SSL verification
-        self._client = httpx.AsyncClient(
-            timeout=config.timeout,
+        self._client = http_client or httpx.AsyncClient(
+            timeout=self._timeout,
             verify=config.verify_ssl
         )
 
         # Log security warning if SSL verification is disabled
-        if not config.verify_ssl:
+        if http_client is None and not config.verify_ssl:
             self.logger.warning(
                 f"SSL certificate verification is DISABLED for provider '{config.name}'. "
                 "This is insecure and should only be used in development."
             )
 
         self.logger.info(
-            f"GigaChatProvider initialized: model={config.model or self.DEFAULT_MODEL}, "
+            f"GigaChatProvider initialized: model={self._model_name}, "
             f"scope={config.scope or self.DEFAULT_SCOPE}"
         )
 
-    async def _ensure_access_token(self) -> str:
+    @property
+    def _access_token(self) -> str | None:
+        """Current OAuth2 access token from the shared token cache."""
+        return self._token.access_token
+
+    @_access_token.setter
+    def _access_token(self, value: str | None) -> None:
+        self._token.access_token = value
+
+    @property
+    def _token_expires_at(self) -> float | None:
+        """Token expiration timestamp in seconds from the shared token cache."""
+        return self._token.expires_at
+
+    @_token_expires_at.setter
+    def _token_expires_at(self, value: float | None) -> None:
+        # Translate the wall-clock deadline to the monotonic clock once, at
+        # refresh time; later validity checks never consult time.time()
+        self._token.expires_at = value
+        self._token.expires_at_monotonic = (
+            None if value is None else time.monotonic() + (value - time.time())
+        )
+
+    @property
+    def _token_lock(self) -> asyncio.Lock:
+        """Refresh lock shared by providers with the same credentials.
+
+        Must be called from a running event loop; see _SharedToken.lock().
+        """
+        return self._token.lock()
+
+    @classmethod
+    def clear_token_cache(cls) -> None:
+        """Drop all cached OAuth2 tokens shared between provider instances.
+
+        Providers created afterwards start with an empty token and fetch a
+        new one on first use. Existing providers keep their current token.
+
+        Example:
+            ```python
+            # Force fresh OAuth2 tokens, e.g. after rotating credentials
+            GigaChatProvider.clear_token_cache()
+            ```
+        """
+        cls._TOKEN_CACHE.clear()
+
+    def _valid_token(self) -> str | None:
+        """Return the shared access token if it is valid for at least 60s more.
+
+        Returns:
+            Access token string, or None if it is missing or about to expire
+        """
+        expires_at_monotonic = self._token.expires_at_monotonic
+        if (
+            self._access_token is not None
+            and expires_at_monotonic is not None
+            and time.monotonic() < expires_at_monotonic - 60
+        ):
+            return self._access_token
+        return None
+
+    async def _ensure_access_token(
+        self, timeout: httpx.Timeout | None = None
+    ) -> str:
         """Ensure valid access token, refresh if needed.
 
         This method implements thread-safe OAuth2 token management:
         1. Checks if current token is valid (with 60s buffer before expiration)
         2. If token is missing or expired, requests a new one via OAuth2 endpoint
-        3. Uses async lock to prevent concurrent token refresh requests
+        3. Uses async lock to prevent concurrent token refresh requests; the
+           validity check is repeated under the lock (double-checked), so
+           concurrent callers share a single OAuth2 request
 
         The token expiration time is stored in seconds (converted from milliseconds
-        in the API response) for easier comparison with time.time().
+        in the API response) and mirrored on the monotonic clock, which is what
+        the validity check compares against.
+
+        Args:
+            timeout: Optional timeout for the OAuth2 request (defaults to the
+                configured provider timeout)
 
         Returns:
             Valid access token string
@@ -190,16 +387,17 @@ class GigaChatProvider(BaseProvider):
             token = await provider._ensure_access_token()
             ```
         """
+        # Fast path: a valid token needs no lock
+        token = self._valid_token()
+        if token is not None:
+            return token
+
         async with self._token_lock:
-            # Check if token exists and is still valid (with 60s buffer)
-            current_time = time.time()
-            if (
-                self._access_token is not None
-                and self._token_expires_at is not None
-                and current_time < self._token_expires_at - 60
-            ):
-                # Token is valid, return it
-                return self._access_token
+            # Re-check: another request may have refreshed the token while
+            # we were waiting for the lock
+            token = self._valid_token()
+            if token is not None:
+                return token
 
             # Token is missing or expired, request new one
             self.logger.debug("Fetching new OAuth2 token...")
@@ -215,7 +413,10 @@ class GigaChatProvider(BaseProvider):
             try:
                 # Request access token
                 response = await self._client.post(
-                    self.OAUTH_URL, headers=headers, data=data
+                    self.OAUTH_URL,
+                    headers=headers,
+                    data=data,
+                    timeout=timeout or self._timeout,
                 )
 
                 # Handle authentication errors
@@ -226,17 +427,26 @@ class GigaChatProvider(BaseProvider):
                 response.raise_for_status()
 
                 # Parse token response
-                token_data = response.json()
-                self._access_token = token_data["access_token"]
-
-                # Convert expires_at from milliseconds to seconds
-                # expires_at is timestamp in milliseconds from API
-                expires_at_ms = token_data["expires_at"]
-                self._token_expires_at = expires_at_ms / 1000.0
+                token_data = _loads(response.content)
+                try:
+                    access_token = token_data["access_token"]
+                    # Convert expires_at from milliseconds to seconds
+                    # expires_at is timestamp in milliseconds from API
+                    expires_at = token_data["expires_at"] / 1000.0
+                except KeyError as e:
+                    raise ProviderError(f"OAuth2 response missing field: {e}") from e
+                except (TypeError, AttributeError) as e:
+                    # Valid JSON of the wrong shape (e.g. a list, or a string
+                    # expires_at); nothing is cached
+                    raise ProviderError(
+                        f"Invalid response format from GigaChat OAuth2: {e}"
+                    ) from e
+                self._access_token = access_token
+                self._token_expires_at = expires_at
 
                 self.logger.info(
                     f"OAuth2 token refreshed, expires at {self._token_expires_at:.0f} "
-                    f"(in {self._token_expires_at - current_time:.0f}s)"
+                    f"(in {self._token_expires_at - time.time():.0f}s)"
                 )
 
                 return self._access_token
@@ -247,12 +457,69 @@ class GigaChatProvider(BaseProvider):
                 raise ProviderError(f"OAuth2 connection error: {e}") from e
             except httpx.NetworkError as e:
                 raise ProviderError(f"OAuth2 network error: {e}") from e
-            except AuthenticationError:
-                # Re-raise authentication errors
-                raise
-            except Exception as e:
-                # Catch any other errors
+            except httpx.HTTPError as e:
+                # Non-2xx status or other transport failure
                 raise ProviderError(f"OAuth2 token request failed: {e}") from e
+            except ValueError as e:
+                raise ProviderError(f"OAuth2 response is not valid JSON: {e}") from e
+
+    async def _refresh_rejected_token(self, rejected_token: str) -> str:
+        """Replace an access token that the API rejected with 401.
+
+        The shared token is only invalidated if it is still the rejected one.
+        If a concurrent request has already refreshed it, the newer token is
+        reused instead of triggering another OAuth2 request.
+
+        Args:
+            rejected_token: Access token that was sent with the failed request
+
+        Returns:
+            Valid access token string
+
+        Raises:
+            AuthenticationError: If authorization key is invalid (401 response)
+            ProviderError: If OAuth2 request fails for other reasons
+        """
+        async with self._token_lock:
+            # 401 means token is invalid regardless of expiration time
+            if self._access_token == rejected_token:
+                self._access_token = None
+                self._token_expires_at = None
+        return await self._ensure_access_token()
+
+    def _chat_headers(self, access_token: str) -> dict[str, str]:
+        """Build chat completions request headers with a fresh RqUID.
+
+        Args:
+            access_token: OAuth2 access token to authorize the request with
+
+        Returns:
+            Request headers dictionary
+        """
+        return {
+            "Authorization": f"Bearer {access_token}",
+            "RqUID": str(uuid.uuid4()),
+            "Content-Type": "application/json",
+        }
+
+    async def _post_chat(
+        self, payload: dict[str, Any], access_token: str
+    ) -> httpx.Response:
+        """Send a non-streaming chat completions request.
+
+        Args:
+            payload: JSON request body
+            access_token: OAuth2 access token to authorize the request with
+
+        Returns:
+            HTTPX response object (status code is not checked)
+        """
+        return await self._client.post(
+            self._chat_url,
+            headers=self._chat_headers(access_token),
+            json=payload,
+            timeout=self._timeout,
+        )
 
     async def generate(
         self, prompt: str, params: GenerationParams | None = None
@@ -301,22 +568,11 @@ class GigaChatProvider(BaseProvider):
             ```
         """
         # Ensure valid access token before making request
-        await self._ensure_access_token()
-
-        # Prepare API endpoint URL
-        base_url = self.config.base_url or self.DEFAULT_BASE_URL
-        url = f"{base_url}/chat/completions"
-
-        # Prepare request headers
-        headers = {
-            "Authorization": f"Bearer {self._access_token}",
-            "RqUID": str(uuid.uuid4()),
-            "Content-Type": "application/json",
-        }
+        access_token = await self._ensure_access_token()
 
         # Prepare request payload
         payload: dict[str, Any] = {
-            "model": self.config.model or self.DEFAULT_MODEL,
+            "model": self._model_name,
             "messages": [{"role": "user", "content": prompt}],
         }
 
@@ -338,32 +594,23 @@ class GigaChatProvider(BaseProvider):
 
         try:
             # Make API request
-            response = await self._client.post(url, headers=headers, json=payload)
+            response = await self._post_chat(payload, access_token)
 
-            # Handle token expiration: refresh and retry once
+            # Handle token expiration: refresh and retry exactly once.
+            # A second 401 is reported by _handle_error as AuthenticationError.
             if response.status_code == 401:
                 self.logger.warning(
                     "Token expired during request, refreshing and retrying..."
                 )
-                # Force token refresh by clearing current token
-                # (401 means token is invalid regardless of expiration time)
-                async with self._token_lock:
-                    self._access_token = None
-                    self._token_expires_at = None
-                # Refresh token
-                await self._ensure_access_token()
-                # Update headers with new token and new RqUID
-                headers["Authorization"] = f"Bearer {self._access_token}"
-                headers["RqUID"] = str(uuid.uuid4())
-                # Retry request
-                response = await self._client.post(url, headers=headers, json=payload)
+                access_token = await self._refresh_rejected_token(access_token)
+                response = await self._post_chat(payload, access_token)
 
             # Handle other errors
             if response.status_code != 200:
                 self._handle_error(response)
 
             # Parse successful response
-            data: dict[str, Any] = cast(dict[str, Any], response.json())
+            data: dict[str, Any] = cast(dict[str, Any], _loads(response.content))
             response_text: str = cast(str, data["choices"][0]["message"]["content"])
 
             self.logger.debug(f"Received response: {len(response_text)} characters")
@@ -377,14 +624,11 @@ class GigaChatProvider(BaseProvider):
             raise ProviderError(f"Connection error to GigaChat API: {e}") from e
         except httpx.NetworkError as e:
             raise ProviderError(f"Network error to GigaChat API: {e}") from e
-        except (KeyError, IndexError) as e:
+        except httpx.HTTPError as e:
+            raise ProviderError(f"HTTP error from GigaChat API: {e}") from e
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            # Missing fields, unexpected structure or a body that is not JSON
             raise ProviderError(f"Invalid response format from GigaChat API: {e}") from e
-        except ProviderError:
-            # Re-raise provider errors (AuthenticationError, RateLimitError, etc.)
-            raise
-        except Exception as e:
-            # Catch any other unexpected errors
-            raise ProviderError(f"Unexpected error during generation: {e}") from e
 
     async def health_check(self) -> bool:
         """Check if the provider is healthy and available.
@@ -407,28 +651,17 @@ class GigaChatProvider(BaseProvider):
             ```
         """
         try:
-            # Save original timeout
-            old_timeout = self._client.timeout
-            # Use short timeout for health check (5 seconds)
-            self._client.timeout = httpx.Timeout(5.0, connect=5.0)
-
             # Try to get access token (validates OAuth2 and API availability)
-            await self._ensure_access_token()
-
-            # Restore original timeout
-            self._client.timeout = old_timeout
-
-            self.logger.debug("Health check passed: OAuth2 token obtained")
-            return True
-
-        except Exception as e:
-            # Restore timeout even on error
-            if hasattr(self, "_client"):
-                self._client.timeout = old_timeout
-
+            # with a short timeout; the client itself is left untouched since
+            # it may be shared with other providers
+            await self._ensure_access_token(timeout=self.HEALTH_CHECK_TIMEOUT)
+        except (httpx.HTTPError, ProviderError) as e:
             self.logger.warning(f"Health check failed: {e}")
             return False
 
+        self.logger.debug("Health check passed: OAuth2 token obtained")
+        return True
+
     def _handle_error(self, response: httpx.Response) -> None:
         """Handle API errors and map HTTP status codes to provider exceptions.
 
@@ -453,29 +686,27 @@ class GigaChatProvider(BaseProvider):
                 self._handle_error(response)
             ```
         """
-        # Extract error message from response
+        status_code = response.status_code
+
+        # Extract error message from response; the body is parsed whatever its
+        # content-type (which may be missing or e.g. application/problem+json)
+        error_message = response.text or f"HTTP {status_code}"
         try:
             error_data = response.json()
-            error_message = error_data.get("message", response.text)
-        except Exception:
+        except ValueError:
             # Fallback to response text if JSON parsing fails
-            error_message = response.text or f"HTTP {response.status_code}"
+            pass
+        else:
+            if isinstance(error_data, dict):
+                error_message = error_data.get("message", response.text)
 
         # Map status codes to exceptions
-        if response.status_code == 400:
-            raise InvalidRequestError(f"Bad request: {error_message}")
-        elif response.status_code == 401:
-            raise AuthenticationError(f"Authentication failed: {error_message}")
-        elif response.status_code == 404:
-            raise InvalidRequestError(f"Invalid model or endpoint: {error_message}")
-        elif response.status_code == 422:
-            raise InvalidRequestError(f"Validation error: {error_message}")
-        elif response.status_code == 429:
-            raise RateLimitError(f"Rate limit exceeded: {error_message}")
-        elif response.status_code >= 500:
+        if status_code >= 500:
             raise ProviderError(f"Server error: {error_message}")
-        else:
-            raise ProviderError(f"Unknown error (HTTP {response.status_code}): {error_message}")
+        exc_class, label = _STATUS_TO_EXC.get(
+            status_code, (ProviderError, f"Unknown error (HTTP {status_code})")
+        )
+        raise exc_class(f"{label}: {error_message}")
 
     async def _parse_sse_stream(
         self, response: httpx.Response
@@ -498,11 +729,14 @@ class GigaChatProvider(BaseProvider):
             Text content chunks from the SSE stream. Each chunk is extracted from
             choices[0].delta.content in the JSON payload.
 
+        Raises:
+            ProviderError: If an event is valid JSON but not the expected
+                structure (e.g. a list instead of an object)
+
         Note:
-            This method handles parsing errors gracefully: if a line cannot be
-            parsed as JSON or doesn't contain expected structure, it logs a warning
-            and continues to the next line. This ensures streaming continues even
-            if some events are malformed.
+            A line that cannot be parsed as JSON, or an object without the
+            expected choices, is logged and skipped, so streaming continues
+            past a single garbled event.
         """
         async for line in response.aiter_lines():
             # Skip empty lines and lines that don't start with "data: "
@@ -518,7 +752,7 @@ class GigaChatProvider(BaseProvider):
 
             # Parse JSON payload
             try:
-                data = json.loads(data_str)
+                data = _loads(data_str)
                 # Extract content from choices[0].delta.content
                 # Structure: {"choices":[{"delta":{"content":"..."}}]}
                 content = (
@@ -531,18 +765,23 @@ class GigaChatProvider(BaseProvider):
                 if content:
                     yield content
 
-            except json.JSONDecodeError as e:
+            except ValueError as e:
                 # Log warning but continue processing (some events might be malformed)
                 self.logger.warning(
                     f"Failed to parse SSE JSON chunk: {data_str[:100]}. Error: {e}"
                 )
                 continue
-            except (KeyError, IndexError, TypeError) as e:
-                # Log warning for missing expected structure
+            except (KeyError, IndexError) as e:
+                # Event without content (e.g. empty choices): nothing to yield
                 self.logger.warning(
                     f"Unexpected SSE structure in chunk: {data_str[:100]}. Error: {e}"
                 )
                 continue
+            except (TypeError, AttributeError) as e:
+                # Valid JSON of the wrong type (e.g. a list instead of an object)
+                raise ProviderError(
+                    f"Invalid response format from GigaChat API: {data_str[:100]}"
+                ) from e
 
     async def generate_stream(
         self, prompt: str, params: GenerationParams | None = None
@@ -596,22 +835,11 @@ class GigaChatProvider(BaseProvider):
             "data: {...}" lines. The stream ends when "data: [DONE]" is received.
         """
         # Ensure valid access token before making request
-        await self._ensure_access_token()
-
-        # Prepare API endpoint URL
-        base_url = self.config.base_url or self.DEFAULT_BASE_URL
-        url = f"{base_url}/chat/completions"
-
-        # Prepare request headers
-        headers = {
-            "Authorization": f"Bearer {self._access_token}",
-            "RqUID": str(uuid.uuid4()),
-            "Content-Type": "application/json",
-        }
+        access_token = await self._ensure_access_token()
 
         # Prepare request payload (same as generate(), but with stream=True)
         payload: dict[str, Any] = {
-            "model": self.config.model or self.DEFAULT_MODEL,
+            "model": self._model_name,
             "messages": [{"role": "user", "content": prompt}],
             "stream": True,  # Enable streaming
         }
@@ -635,7 +863,11 @@ class GigaChatProvider(BaseProvider):
         try:
             # Use streaming request instead of regular POST
             async with self._client.stream(
-                "POST", url, headers=headers, json=payload
+                "POST",
+                self._chat_url,
+                headers=self._chat_headers(access_token),
+                json=payload,
+                timeout=self._timeout,
             ) as response:
                 # Check for 401 BEFORE starting to read the stream
                 # This allows us to retry with a fresh token
@@ -643,29 +875,27 @@ class GigaChatProvider(BaseProvider):
                     self.logger.warning(
                         "Token expired before streaming, refreshing and retrying..."
                     )
-                    # Force token refresh by clearing current token
-                    async with self._token_lock:
-                        self._access_token = None
-                        self._token_expires_at = None
-                    # Refresh token
-                    await self._ensure_access_token()
-                    # Update headers with new token and new RqUID
-                    headers["Authorization"] = f"Bearer {self._access_token}"
-                    headers["RqUID"] = str(uuid.uuid4())
+                    access_token = await self._refresh_rejected_token(access_token)
                     # Retry streaming request ONCE
                     async with self._client.stream(
-                        "POST", url, headers=headers, json=payload
+                        "POST",
+                        self._chat_url,
+                        headers=self._chat_headers(access_token),
+                        json=payload,
+                        timeout=self._timeout,
                     ) as retry_response:
                         # Check status code after retry
                         if retry_response.status_code != 200:
+                            await retry_response.aread()
                             self._handle_error(retry_response)
                         # Parse and yield chunks from retry response
                         async for chunk in self._parse_sse_stream(retry_response):
                             yield chunk
                     return
 
-                # Handle other errors (before reading stream)
+                # Handle other errors (load the error body for _handle_error)
                 if response.status_code != 200:
+                    await response.aread()
                     self._handle_error(response)
 
                 # Parse and yield chunks from SSE stream
@@ -680,12 +910,6 @@ class GigaChatProvider(BaseProvider):
             raise ProviderError(f"Connection error to GigaChat API: {e}") from e
         except httpx.NetworkError as e:
             raise ProviderError(f"Network error to GigaChat API: {e}") from e
-        except ProviderError:
-            # Re-raise provider errors (AuthenticationError, RateLimitError, etc.)
-            raise
-        except Exception as e:
-            # Catch any other unexpected errors
-            raise ProviderError(
-                f"Unexpected error during streaming generation: {e}"
-            ) from e
+        except httpx.HTTPError as e:
+            raise ProviderError(f"HTTP error from GigaChat API: {e}") from e
 
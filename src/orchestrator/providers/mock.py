@@ -20,10 +20,20 @@ from .base import (
     GenerationParams,
     InvalidRequestError,
     ProviderConfig,
+    ProviderError,
     RateLimitError,
     TimeoutError,
 )
 
+# Error simulation modes: model name -> (exception raised, its message).
+# generate() and generate_stream() raise these before producing any output.
+ERROR_MODES: dict[str, tuple[type[ProviderError], str]] = {
+    "mock-timeout": (TimeoutError, "Mock timeout simulation"),
+    "mock-ratelimit": (RateLimitError, "Mock rate limit simulation"),
+    "mock-auth-error": (AuthenticationError, "Mock authentication failure"),
+    "mock-invalid-request": (InvalidRequestError, "Mock invalid request"),
+}
+
 # ============================================================================
 # MOCK PROVIDER
 # ============================================================================
@@ -37,6 +47,7 @@ class MockProvider(BaseProvider):
 
     Modes:
         - "mock-normal" (default): Returns a mock response with 0.1s delay
+        - "mock-instant": Like "mock-normal", but responds and streams without delay
         - "mock-timeout": Raises TimeoutError immediately
         - "mock-ratelimit": Raises RateLimitError immediately
         - "mock-auth-error": Raises AuthenticationError immediately
@@ -149,17 +160,14 @@ class MockProvider(BaseProvider):
         mode = (self.config.model or "mock-normal").lower()
 
         # Handle error simulation modes
-        if mode == "mock-timeout":
-            raise TimeoutError("Mock timeout simulation")
-        elif mode == "mock-ratelimit":
-            raise RateLimitError("Mock rate limit simulation")
-        elif mode == "mock-auth-error":
-            raise AuthenticationError("Mock authentication failure")
-        elif mode == "mock-invalid-request":
-            raise InvalidRequestError("Mock invalid request")
-
-        # Normal mode: generate mock response with delay
-        await asyncio.sleep(0.1)
+        error = ERROR_MODES.get(mode)
+        if error is not None:
+            error_type, message = error
+            raise error_type(message)
+
+        # Normal mode: generate mock response with delay (none in instant mode)
+        if mode != "mock-instant":
+            await asyncio.sleep(0.1)
         response = f"Mock response to: {prompt}"
 
         # Apply max_tokens limit if specified (interpreted as character limit)
@@ -270,14 +278,10 @@ class MockProvider(BaseProvider):
 
         # Handle error simulation modes - raise immediately (before any chunks)
         # This allows Router to fallback to another provider
-        if mode == "mock-timeout":
-            raise TimeoutError("Mock timeout simulation")
-        elif mode == "mock-ratelimit":
-            raise RateLimitError("Mock rate limit simulation")
-        elif mode == "mock-auth-error":
-            raise AuthenticationError("Mock authentication failure")
-        elif mode == "mock-invalid-request":
-            raise InvalidRequestError("Mock invalid request")
+        error = ERROR_MODES.get(mode)
+        if error is not None:
+            error_type, message = error
+            raise error_type(message)
 
         # Normal mode: generate full response (respects max_tokens via generate())
         # Then stream it word by word with small delays
@@ -302,6 +306,8 @@ class MockProvider(BaseProvider):
                     chunk = word
 
             yield chunk
-            # Small delay between chunks to simulate streaming
-            await asyncio.sleep(0.05)
+            # Small delay between chunks to simulate streaming (none after
+            # the last chunk, so the stream ends as soon as it is drained)
+            if mode != "mock-instant" and i < len(words) - 1:
+                await asyncio.sleep(0.05)
 
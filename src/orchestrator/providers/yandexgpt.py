@@ -98,7 +98,14 @@ class YandexGPTProvider(BaseProvider):
     DEFAULT_MODEL: str = "yandexgpt/latest"
     API_ENDPOINT: str = "/foundationModels/v1/completion"
 
-    def __init__(self, config: ProviderConfig) -> None:
+    # Short timeout for the minimal request made by health_check()
+    HEALTH_CHECK_TIMEOUT: httpx.Timeout = httpx.Timeout(5.0, connect=5.0)
+
+    def __init__(
+        self,
+        config: ProviderConfig,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
         """Initialize YandexGPT provider with configuration.
 
         Args:
@@ -110,6 +117,11 @@ class YandexGPTProvider(BaseProvider):
                 - timeout: Request timeout in seconds (default: 30)
                 - max_retries: Maximum retry attempts (default: 3)
                 - model: Model name (default: "yandexgpt/latest")
+            http_client: Optional shared HTTPX client. Pass one client to
+                several providers to reuse a single connection pool. The
+                configured timeout is still applied per request, but SSL
+                verification is taken from the shared client (verify_ssl is
+                ignored). The caller owns the client and must close it.
 
         Raises:
             ValueError: If required configuration (api_key or folder_id) is missing
@@ -123,6 +135,10 @@ class YandexGPTProvider(BaseProvider):
                 model="yandexgpt-lite/latest"
             )
             provider = YandexGPTProvider(config)
+
+            # Share one connection pool between providers
+            client = httpx.AsyncClient()
+            provider = YandexGPTProvider(config, http_client=client)
             ```
         """
         super().__init__(config)
@@ -133,14 +149,17 @@ class YandexGPTProvider(BaseProvider):
         if not config.folder_id:
             raise ValueError("folder_id is required for YandexGPTProvider")
 
+        # Per-request timeout, so a shared client keeps its own settings
+        self._timeout = httpx.Timeout(config.timeout)
+
         # HTTP client with configured timeout and SSL verification
-        self._client = httpx.AsyncClient(
-            timeout=config.timeout,
+        self._client = http_client or httpx.AsyncClient(
+            timeout=self._timeout,
             verify=config.verify_ssl
         )
 
         # Log security warning if SSL verification is disabled
-        if not config.verify_ssl:
+        if http_client is None and not config.verify_ssl:
             self.logger.warning(
                 f"SSL certificate verification is DISABLED for provider '{config.name}'. "
                 "This is insecure and should only be used in development."
@@ -266,7 +285,9 @@ class YandexGPTProvider(BaseProvider):
 
         try:
             # Make API request
-            response = await self._client.post(url, headers=headers, json=payload)
+            response = await self._client.post(
+                url, headers=headers, json=payload, timeout=self._timeout
+            )
 
             # Handle errors
             if response.status_code != 200:
@@ -331,11 +352,6 @@ class YandexGPTProvider(BaseProvider):
             ```
         """
         try:
-            # Save original timeout
-            old_timeout = self._client.timeout
-            # Use short timeout for health check (5 seconds)
-            self._client.timeout = httpx.Timeout(5.0, connect=5.0)
-
             # Prepare minimal request
             base_url = self.config.base_url or self.DEFAULT_BASE_URL
             url = f"{base_url}{self.API_ENDPOINT}"
@@ -356,11 +372,14 @@ class YandexGPTProvider(BaseProvider):
                 "messages": [{"role": "user", "text": "Hi"}],
             }
 
-            # Make minimal request
-            response = await self._client.post(url, headers=headers, json=payload)
-
-            # Restore original timeout
-            self._client.timeout = old_timeout
+            # Make minimal request with a short timeout (5 seconds); passed per
+            # request rather than set on the client, which may be shared
+            response = await self._client.post(
+                url,
+                headers=headers,
+                json=payload,
+                timeout=self.HEALTH_CHECK_TIMEOUT,
+            )
 
             # Health check passed if status is 200
             is_healthy = response.status_code == 200
@@ -373,10 +392,6 @@ class YandexGPTProvider(BaseProvider):
             return is_healthy
 
         except Exception as e:
-            # Restore timeout even on error
-            if hasattr(self, "_client"):
-                self._client.timeout = old_timeout
-
             self.logger.warning(f"Health check failed: {e}")
             return False
 
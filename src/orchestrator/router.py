@@ -1,20 +1,58 @@
 """LLM Router module for managing provider selection and request routing."""
 
 import asyncio
+import itertools
 import logging
 import random
 import time
-from collections.abc import AsyncIterator
-from datetime import UTC, datetime
+from collections.abc import AsyncIterator, Callable
+from typing import Literal
 
 from .metrics import ProviderMetrics
-from .pricing import calculate_cost
+from .pricing import calculate_cost, get_price_per_1k
 from .prometheus_exporter import PrometheusExporter
-from .providers.base import BaseProvider, GenerationParams, ProviderError
+from .providers.base import (
+    BaseProvider,
+    GenerationParams,
+    InvalidRequestError,
+    ProviderError,
+)
 from .tokenization import count_tokens
 
+__all__ = ["Router", "VALID_STRATEGIES"]
+
 # Valid routing strategies
-VALID_STRATEGIES = ["round-robin", "random", "first-available", "best-available"]
+VALID_STRATEGIES: frozenset[str] = frozenset(
+    {"round-robin", "random", "first-available", "best-available", "score"}
+)
+
+# Upper bound for a single provider health check in first-available selection
+HEALTH_CHECK_TIMEOUT_SECONDS = 5.0
+
+# How long a health check result is reused by first-available selection
+# before it is refreshed in the background
+HEALTH_CACHE_TTL_SECONDS = 30.0
+
+# Errors caused by the request itself: other providers would reject it too,
+# so route() raises them immediately instead of falling back. Authentication
+# errors stay retryable because every provider has its own credentials.
+NON_RETRYABLE_ERRORS: tuple[type[Exception], ...] = (InvalidRequestError,)
+
+# Circuit breaker: after this many consecutive failures a provider is skipped
+# during fallback for a cooldown that doubles per further failure (capped).
+# When the cooldown ends, a single trial request decides whether it closes.
+FAILURE_THRESHOLD = 3
+BASE_COOLDOWN_SECONDS = 30.0
+MAX_COOLDOWN_SECONDS = 300.0
+
+# "score" strategy: a provider's score is its latency EWMA plus its price,
+# both in milliseconds; 1 RUB per 1K tokens weighs like this much latency.
+# The best score is cached and recomputed at most once per refresh period.
+SCORE_COST_WEIGHT_MS = 1000.0
+SCORE_REFRESH_SECONDS = 5.0
+
+# Circuit-breaker states reported by Router._breaker_state
+BreakerState = Literal["closed", "open", "half-open"]
 
 
 class Router:
@@ -23,8 +61,9 @@ class Router:
     The Router handles intelligent routing of requests to appropriate
     LLM providers based on configurable routing strategies. It supports
     multiple routing strategies including round-robin, random selection,
-    first-available provider selection, and best-available (metrics-based)
-    selection with automatic fallback.
+    first-available provider selection, best-available (metrics-based)
+    selection and score (latency and price) selection with automatic
+    fallback.
 
     The Router tracks performance metrics for each provider, including
     request counts, latency, error rates, and health status, which can
@@ -33,8 +72,20 @@ class Router:
     Attributes:
         strategy: Routing strategy to use for provider selection
         providers: List of registered provider instances
+        _providers_by_name: Mapping of provider name to index in providers
+            (internal)
         metrics: Dictionary mapping provider names to their metrics (internal)
-        _current_index: Current index for round-robin strategy (internal)
+        _counter: Monotonic request counter for round-robin strategy (internal)
+        _rng: Private random number generator for random strategy (internal)
+        _hedge_delay: Delay before route() starts a hedged backup attempt,
+            or None for sequential fallback (internal)
+        _health_cache: Last health check result and its monotonic timestamp
+            per provider name, used by first-available (internal)
+        _failure_count: Consecutive failures per provider name (internal)
+        _cooldown_until: Monotonic time until which a provider (by name) is
+            skipped during fallback (internal)
+        _half_open_trials: Provider names with a half-open trial request
+            in flight (internal)
         logger: Logger instance for this router
 
     Example:
@@ -60,7 +111,42 @@ class Router:
         ```
     """
 
-    def __init__(self, strategy: str = "round-robin") -> None:
+    # Fixed attribute layout: faster attribute access on the routing hot
+    # path and no per-instance __dict__. New attributes must be listed here.
+    __slots__ = (
+        "strategy",
+        "_hedge_delay",
+        "providers",
+        "_providers_by_name",
+        "metrics",
+        "_counter",
+        "_weights",
+        "_current_weights",
+        "_total_weight",
+        "_weighted",
+        "_rng",
+        "_health_cache",
+        "_health_refresh_tasks",
+        "_failure_count",
+        "_cooldown_until",
+        "_half_open_trials",
+        "_prices",
+        "_score_choice",
+        "_score_expires_at",
+        "_select_sync",
+        "logger",
+        "_prometheus_exporter",
+        "_metrics_update_task",
+        # Keep Router weak-referenceable (slots drop __weakref__ by default)
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        strategy: str = "round-robin",
+        seed: int | None = None,
+        hedge_delay: float | None = None,
+    ) -> None:
         """Initialize the router with a routing strategy.
 
         Args:
@@ -69,9 +155,19 @@ class Router:
                 - "random": Select a random provider from available providers
                 - "first-available": Select the first healthy provider
                 - "best-available": Select the healthiest provider with lowest latency
+                - "score": Select the provider with the best combined latency
+                  and price score
+            seed: Optional seed for the router's private random number
+                generator used by the "random" strategy. Pass a fixed value
+                for reproducible provider selection (e.g., in tests).
+            hedge_delay: Optional delay in seconds for hedged requests in
+                route(). If an attempt has not finished after this delay, the
+                next provider is started in parallel and the first success
+                wins. None (default) keeps strictly sequential fallback.
 
         Raises:
-            ValueError: If the provided strategy is not valid
+            ValueError: If the provided strategy is not valid, or
+                hedge_delay is negative
 
         Example:
             ```python
@@ -81,30 +177,76 @@ class Router:
             # Random selection
             router = Router(strategy="random")
 
+            # Reproducible random selection
+            router = Router(strategy="random", seed=42)
+
             # First available healthy provider
             router = Router(strategy="first-available")
+
+            # Trade off latency against price per token
+            router = Router(strategy="score")
+
+            # Start a backup provider if the first takes longer than 2s
+            router = Router(hedge_delay=2.0)
             ```
         """
         # Validate strategy
         if strategy not in VALID_STRATEGIES:
             raise ValueError(
                 f"Invalid strategy: {strategy}. "
-                f"Must be one of {VALID_STRATEGIES}"
+                f"Must be one of {sorted(VALID_STRATEGIES)}"
             )
 
+        if hedge_delay is not None and hedge_delay < 0:
+            raise ValueError("hedge_delay must be non-negative")
+
         self.strategy = strategy
+        self._hedge_delay = hedge_delay
         self.providers: list[BaseProvider] = []
+        self._providers_by_name: dict[str, int] = {}
         self.metrics: dict[str, ProviderMetrics] = {}
-        self._current_index: int = 0
+        # Round-robin position. Concurrent requests are safe only because
+        # selection reads and advances it with no await in between; keep it
+        # that way when editing the selectors (count() itself adds no locking)
+        self._counter = itertools.count()
+        # Smooth weighted round-robin state, aligned with self.providers
+        self._weights: list[int] = []
+        self._current_weights: list[int] = []
+        # Aggregates over _weights, updated on add/remove instead of per request
+        self._total_weight: int = 0
+        self._weighted: bool = False
+        # Private RNG for the random strategy (avoids the shared global RNG)
+        self._rng = random.Random(seed)
+        # Cached health results for first-available, keyed by provider name
+        self._health_cache: dict[str, tuple[bool, float]] = {}
+        self._health_refresh_tasks: dict[str, asyncio.Task[bool]] = {}
+        # Circuit breaker state, keyed by provider name so it stays valid
+        # when remove_provider() shifts indices under an in-flight request
+        self._failure_count: dict[str, int] = {}
+        self._cooldown_until: dict[str, float] = {}
+        self._half_open_trials: set[str] = set()
+        # "score" strategy: prices keyed by provider name (looked up once) and
+        # the cached (score, index) of the best provider until it expires
+        self._prices: dict[str, float] = {}
+        self._score_choice: tuple[float, int] = (0.0, 0)
+        self._score_expires_at = 0.0
+        # Strategy dispatch, resolved once. first-available is the only
+        # strategy that awaits (health checks), so it has no sync selector.
+        self._select_sync: Callable[[], BaseProvider] | None = {
+            "round-robin": self._select_round_robin,
+            "random": self._select_random,
+            "best-available": self._select_best_available_provider,
+            "score": self._select_by_score,
+        }.get(strategy)
         self.logger = logging.getLogger("orchestrator.router")
 
         # Prometheus exporter (v0.7.0+, not started by default)
         self._prometheus_exporter: PrometheusExporter | None = None
         self._metrics_update_task: asyncio.Task[None] | None = None
 
-        self.logger.info(f"Router initialized with strategy: {strategy}")
+        self.logger.info("Router initialized with strategy: %s", strategy)
 
-    def add_provider(self, provider: BaseProvider) -> None:
+    def add_provider(self, provider: BaseProvider, weight: int = 1) -> None:
         """Add a provider to the router.
 
         The provider will be added to the list of available providers
@@ -114,9 +256,14 @@ class Router:
         Args:
             provider: Provider instance to add. Must be an instance of
                     BaseProvider or its subclass.
+            weight: Relative share of requests for the round-robin strategy
+                    (default: 1). Weighted providers are interleaved smoothly,
+                    e.g. weights 1/2/3 for A/B/C repeat C B A C B C rather
+                    than A B B C C C.
 
         Raises:
-            ValueError: If a provider with the same name already exists
+            ValueError: If a provider with the same name already exists,
+                or weight is less than 1
 
         Example:
             ```python
@@ -126,25 +273,107 @@ class Router:
             config = ProviderConfig(name="my-provider", model="mock-normal")
             provider = MockProvider(config)
             router.add_provider(provider)
+
+            # Send twice as many round-robin requests to a second provider
+            router.add_provider(other_provider, weight=2)
             ```
         """
+        if weight < 1:
+            raise ValueError("weight must be at least 1")
+
         # Check for duplicate provider names
         provider_name = provider.config.name
-        if provider_name in self.metrics:
+        if provider_name in self._providers_by_name:
             raise ValueError(
                 f"Provider with name '{provider_name}' already exists"
             )
-        # Check if name exists in providers list
-        for existing_provider in self.providers:
-            if existing_provider.config.name == provider_name:
-                raise ValueError(
-                    f"Provider with name '{provider_name}' already exists"
-                )
 
+        self._providers_by_name[provider_name] = len(self.providers)
         self.providers.append(provider)
+        self._weights.append(weight)
+        self._current_weights.append(0)
+        self._update_weight_totals()
+        self._score_expires_at = 0.0
         # Initialize metrics for the new provider
         self.metrics[provider_name] = ProviderMetrics()
-        self.logger.info(f"Added provider: {provider_name}")
+        self.logger.info("Added provider: %s", provider_name)
+
+    def get_provider(self, name: str) -> BaseProvider:
+        """Return the registered provider with the given name.
+
+        Args:
+            name: Name of the provider
+
+        Returns:
+            Provider instance registered under this name
+
+        Raises:
+            ValueError: If no provider with this name is registered
+
+        Example:
+            ```python
+            provider = router.get_provider("gigachat")
+            is_healthy = await provider.health_check()
+            ```
+        """
+        if name not in self._providers_by_name:
+            raise ValueError(f"Provider with name '{name}' not found")
+        return self.providers[self._providers_by_name[name]]
+
+    def remove_provider(self, name: str) -> BaseProvider:
+        """Remove a provider from the router by name.
+
+        The provider's metrics, cached health and circuit-breaker state are
+        discarded, and a health check still running for it is cancelled.
+        Useful for replacing a provider, e.g. after rotating its API key:
+        remove the old instance, then add a new one with the same name.
+
+        Args:
+            name: Name of the provider to remove
+
+        Returns:
+            The removed provider instance
+
+        Raises:
+            ValueError: If no provider with this name is registered
+
+        Example:
+            ```python
+            router.remove_provider("gigachat")
+            router.add_provider(GigaChatProvider(new_config))
+            ```
+        """
+        if name not in self._providers_by_name:
+            raise ValueError(f"Provider with name '{name}' not found")
+
+        removed_index = self._providers_by_name[name]
+        provider = self.providers.pop(removed_index)
+        del self._weights[removed_index]
+        del self._current_weights[removed_index]
+        self._update_weight_totals()
+        del self.metrics[name]
+        self._health_cache.pop(name, None)
+        refresh_task = self._health_refresh_tasks.pop(name, None)
+        if refresh_task is not None:
+            refresh_task.cancel()
+        self._prices.pop(name, None)
+        self._score_expires_at = 0.0
+        self._failure_count.pop(name, None)
+        self._cooldown_until.pop(name, None)
+        self._half_open_trials.discard(name)
+
+        # Rebuild the name index (removal is rare, so a full rebuild is fine)
+        self._providers_by_name = {
+            p.config.name: i for i, p in enumerate(self.providers)
+        }
+
+        self.logger.info("Removed provider: %s", name)
+        return provider
+
+    def _update_weight_totals(self) -> None:
+        """Recompute cached weight aggregates after the provider set changes."""
+        self._total_weight = sum(self._weights)
+        self._weighted = len(set(self._weights)) > 1
 
     def _log_request_event(
         self,
@@ -225,7 +454,8 @@ class Router:
             TimeoutError: If all providers timeout
             RateLimitError: If all providers hit rate limit
             AuthenticationError: If all providers fail authentication
-            InvalidRequestError: If all providers receive invalid requests
+            InvalidRequestError: As soon as any provider rejects the request
+                (no fallback, see NON_RETRYABLE_ERRORS)
             Exception: Any other exception from the last failed provider
 
         Example:
@@ -243,103 +473,432 @@ class Router:
         if not self.providers:
             raise ProviderError("No providers registered")
 
-        # Select provider based on strategy
-        selected_provider = await self._select_provider()
-
-        # Find index of selected provider for fallback logic
-        selected_index = self.providers.index(selected_provider)
+        order, last_resort = await self._provider_order()
+        if self._hedge_delay is not None and len(order) > 1:
+            return await self._route_hedged(order, last_resort, prompt, params)
 
         # Attempt to generate response with fallback
         last_error: Exception | None = None
 
-        for i in range(len(self.providers)):
-            # Calculate provider index (circular, starting from selected)
-            index = (selected_index + i) % len(self.providers)
-            provider = self.providers[index]
+        for provider in order:
+            name = provider.config.name
+            claimed = self._begin_attempt(name)
+            if not (claimed or last_resort):
+                continue
+            try:
+                return await self._attempt(provider, prompt, params)
+            except Exception as e:
+                if isinstance(e, NON_RETRYABLE_ERRORS):
+                    raise
+                last_error = e
+                continue
+            finally:
+                if claimed:
+                    self._half_open_trials.discard(name)
 
-            # Measure time for metrics
-            start_time = time.perf_counter()
+        # All providers failed
+        self.logger.error("All providers failed")
+        if last_error is None:
+            raise ProviderError("All providers failed")
+        raise last_error
 
-            try:
-                self.logger.info(f"Trying provider: {provider.config.name}")
-                result = await provider.generate(prompt, params)
+    async def _route_hedged(
+        self,
+        order: list[BaseProvider],
+        last_resort: bool,
+        prompt: str,
+        params: GenerationParams | None,
+    ) -> str:
+        """Route a request with hedging across the fallback order.
 
-                # Calculate latency
-                latency_ms = (time.perf_counter() - start_time) * 1000
+        The first provider is tried immediately. Whenever no attempt has
+        finished within hedge_delay seconds, the next provider in order is
+        started alongside the running ones; a failed attempt is replaced by
+        the next provider right away. The first successful response wins and
+        all other attempts are cancelled.
 
-                # Count tokens (v0.7.0+)
-                prompt_tokens = count_tokens(prompt)
-                completion_tokens = count_tokens(result)
-                total_tokens = prompt_tokens + completion_tokens
+        Args:
+            order: Providers in the order they should be tried
+            last_resort: Try providers even if their half-open trial is
+                taken (see _provider_order())
+            prompt: Input text prompt
+            params: Optional generation parameters
 
-                # Calculate cost (v0.7.0+)
-                cost = calculate_cost(
-                    provider_name=provider.config.name,
-                    model=provider.config.model,
-                    total_tokens=total_tokens,
-                )
+        Returns:
+            Generated text from the first provider to succeed
 
-                # Update metrics with tokens and cost
-                metrics = self.metrics[provider.config.name]
-                metrics.record_success(
-                    latency_ms=latency_ms,
-                    prompt_tokens=prompt_tokens,
-                    completion_tokens=completion_tokens,
-                    cost=cost,
+        Raises:
+            ProviderError: If no attempt could be started
+            InvalidRequestError: As soon as any provider rejects the request
+            Exception: The last error if every provider failed
+        """
+        candidates = iter(order)
+        # Running attempts -> provider name, or None if no trial slot was claimed
+        pending: dict[asyncio.Task[str], str | None] = {}
+        last_error: BaseException | None = None
+
+        def launch_next() -> bool:
+            for provider in candidates:
+                name = provider.config.name
+                claimed = self._begin_attempt(name)
+                if claimed or last_resort:
+                    task = asyncio.create_task(self._attempt(provider, prompt, params))
+                    pending[task] = name if claimed else None
+                    return True
+            return False
+
+        def end_attempt(name: str | None) -> None:
+            if name is not None:
+                self._half_open_trials.discard(name)
+
+        more_candidates = launch_next()
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending,
+                    timeout=self._hedge_delay if more_candidates else None,
+                    return_when=asyncio.FIRST_COMPLETED,
                 )
+                if not done:
+                    # Every running attempt is slower than the hedge delay
+                    self.logger.info("Hedge delay elapsed, starting next provider")
+                    more_candidates = launch_next()
+                    continue
+
+                for task in done:
+                    end_attempt(pending.pop(task))
+                    error = task.exception()
+                    if error is None:
+                        return task.result()
+                    if isinstance(error, NON_RETRYABLE_ERRORS):
+                        raise error
+                    last_error = error
+                if more_candidates:
+                    more_candidates = launch_next()
+        finally:
+            # Cancel attempts that lost the race (or outlived an error)
+            for task, name in pending.items():
+                task.cancel()
+                end_attempt(name)
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
 
-                # Log success event with token info
-                self._log_request_event(
-                    provider_name=provider.config.name,
-                    model=provider.config.model,
+        # All providers failed
+        self.logger.error("All providers failed")
+        if last_error is None:
+            raise ProviderError("All providers failed")
+        raise last_error
+
+    async def _attempt(
+        self,
+        provider: BaseProvider,
+        prompt: str,
+        params: GenerationParams | None,
+    ) -> str:
+        """Generate a response with one provider and record the outcome.
+
+        Updates metrics, the structured request log and the circuit breaker
+        for the provider, then returns the result or re-raises the error.
+        If the provider was removed while the request was running, its
+        outcome is logged but not recorded.
+
+        Args:
+            provider: Provider to use
+            prompt: Input text prompt
+            params: Optional generation parameters
+
+        Returns:
+            Generated text response
+
+        Raises:
+            Exception: Whatever the provider raised
+        """
+        name = provider.config.name
+
+        # Measure time for metrics
+        start_time = time.perf_counter()
+
+        try:
+            self.logger.info("Trying provider: %s", provider.config.name)
+            result = await provider.generate(prompt, params)
+
+            # Calculate latency
+            latency_ms = (time.perf_counter() - start_time) * 1000
+
+            # Count tokens (v0.7.0+)
+            prompt_tokens = count_tokens(prompt)
+            completion_tokens = count_tokens(result)
+            total_tokens = prompt_tokens + completion_tokens
+
+            # Calculate cost (v0.7.0+)
+            cost = calculate_cost(
+                provider_name=provider.config.name,
+                model=provider.config.model,
+                total_tokens=total_tokens,
+            )
+
+            # Update metrics with tokens and cost (unless removed meanwhile)
+            metrics = self.metrics.get(name)
+            if metrics is not None:
+                metrics.record_success(
                     latency_ms=latency_ms,
-                    streaming=False,
-                    success=True,
                     prompt_tokens=prompt_tokens,
                     completion_tokens=completion_tokens,
-                    total_tokens=total_tokens,
                     cost=cost,
                 )
 
-                self.logger.info(
-                    f"Success with provider: {provider.config.name}"
-                )
-                return result
-            except Exception as e:
-                # Calculate latency even for failed requests
-                latency_ms = (time.perf_counter() - start_time) * 1000
-                metrics = self.metrics[provider.config.name]
-                metrics.record_error(
-                    latency_ms, datetime.now(UTC)
-                )
+            # Log success event with token info
+            self._log_request_event(
+                provider_name=provider.config.name,
+                model=provider.config.model,
+                latency_ms=latency_ms,
+                streaming=False,
+                success=True,
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                total_tokens=total_tokens,
+                cost=cost,
+            )
 
-                # Log failure event
-                self._log_request_event(
-                    provider_name=provider.config.name,
-                    model=provider.config.model,
-                    latency_ms=latency_ms,
-                    streaming=False,
-                    success=False,
-                    error_type=type(e).__name__,
-                )
+            self._record_provider_success(name)
+            self.logger.info("Success with provider: %s", provider.config.name)
+            return result
+        except Exception as e:
+            # Calculate latency even for failed requests
+            latency_ms = (time.perf_counter() - start_time) * 1000
+            metrics = self.metrics.get(name)
+            if metrics is not None:
+                metrics.record_error(latency_ms)
+
+            # Log failure event
+            self._log_request_event(
+                provider_name=provider.config.name,
+                model=provider.config.model,
+                latency_ms=latency_ms,
+                streaming=False,
+                success=False,
+                error_type=type(e).__name__,
+            )
 
+            if isinstance(e, NON_RETRYABLE_ERRORS):
+                # The request is at fault, not the provider
                 self.logger.warning(
-                    f"Provider {provider.config.name} failed: {e}, trying next"
+                    "Provider %s rejected the request: %s, not retrying",
+                    provider.config.name,
+                    e,
                 )
-                last_error = e
-                continue
+                raise
 
-        # All providers failed
-        self.logger.error("All providers failed")
-        if last_error is None:
-            raise ProviderError("All providers failed")
-        raise last_error
+            self._record_provider_failure(name)
+            self.logger.warning(
+                "Provider %s failed: %s, trying next", provider.config.name, e
+            )
+            raise
+
+    async def route_many(
+        self,
+        prompts: list[str],
+        params: GenerationParams | None = None,
+        max_concurrency: int = 16,
+    ) -> list[str | BaseException]:
+        """Route several independent prompts concurrently.
+
+        Each prompt goes through route(), so provider selection, fallback
+        and metrics behave exactly as for single requests. At most
+        max_concurrency requests are in flight at once. A failed prompt
+        does not abort the batch: its exception is returned in place of
+        the response.
+
+        Providers that keep a persistent HTTP client reuse its pooled
+        connections for the whole batch.
+
+        Args:
+            prompts: Input prompts, one request per prompt
+            params: Optional generation parameters applied to every prompt
+            max_concurrency: Maximum number of requests in flight (default: 16)
+
+        Returns:
+            List aligned with prompts containing either the generated text
+            or the exception raised for that prompt
+
+        Raises:
+            ValueError: If max_concurrency is less than 1
+
+        Example:
+            ```python
+            results = await router.route_many(["Hi", "What is Python?"])
+            for result in results:
+                if isinstance(result, BaseException):
+                    print(f"Failed: {result}")
+                else:
+                    print(result)
+            ```
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _route_one(prompt: str) -> str:
+            async with semaphore:
+                return await self.route(prompt, params)
+
+        return await asyncio.gather(
+            *(_route_one(prompt) for prompt in prompts), return_exceptions=True
+        )
+
+    async def _provider_order(self) -> tuple[list[BaseProvider], bool]:
+        """Select a provider by strategy and return the full attempt order.
+
+        With a single registered provider there is nothing to choose or fall
+        back to, so strategy selection (including first-available health
+        checks) is skipped entirely. Providers are resolved from indices
+        here, so a later remove_provider() cannot shift the order of a
+        request that is already running.
+
+        Returns:
+            Providers in the order route()/route_stream() try them, and
+            whether the order is a last resort: no provider is available to
+            the circuit breaker, so each one is tried even if another request
+            holds its half-open trial slot
+
+        Raises:
+            ProviderError: If every provider was removed during selection
+        """
+        if len(self.providers) == 1:
+            return [self.providers[0]], True
+
+        # Select provider based on strategy
+        selected_provider = await self._select_provider()
+
+        # Find index of selected provider for fallback logic (O(1) name lookup);
+        # it may have been removed while first-available awaited health checks
+        selected_index = self._providers_by_name.get(selected_provider.config.name)
+        if selected_index is None:
+            if not self.providers:
+                raise ProviderError("No providers registered")
+            selected_index = 0
+        indices, last_resort = self._fallback_order(selected_index)
+        return [self.providers[i] for i in indices], last_resort
+
+    def _fallback_order(self, selected_index: int) -> tuple[list[int], bool]:
+        """Return provider indices to try, starting from the selected one.
+
+        The selected provider is tried first. The remaining providers follow
+        in ascending order of their failure-penalized latency EWMA, so a
+        provider that keeps timing out is tried last instead of costing a
+        full timeout before every fallback. Providers without data rank as
+        fastest; ties keep circular order. Providers whose circuit breaker
+        is open, or half-open with a trial already in flight, are skipped,
+        unless that leaves nothing, in which case all of them are tried
+        (as a last resort) rather than failing without a request.
+
+        Args:
+            selected_index: Index of the provider chosen by the strategy
+
+        Returns:
+            Provider indices in the order they should be tried, and whether
+            this is the last-resort order of all providers
+        """
+        # Circular order after the selected provider, built from two ranges
+        # instead of a modulo per position
+        circular = [
+            *range(selected_index + 1, len(self.providers)),
+            *range(selected_index),
+        ]
+        rest = sorted(
+            circular,
+            key=lambda index: (
+                self.metrics[self.providers[index].config.name].ewma_latency_ms
+                or 0.0
+            ),
+        )
+        order = [selected_index, *rest]
+        available = []
+        for index in order:
+            name = self.providers[index].config.name
+            state = self._breaker_state(name)
+            if state == "closed" or (
+                state == "half-open" and name not in self._half_open_trials
+            ):
+                available.append(index)
+        if available:
+            return available, False
+        return order, True
+
+    def _breaker_state(self, name: str) -> BreakerState:
+        """Return the circuit-breaker state of a provider.
+
+        Args:
+            name: Name of the provider
+
+        Returns:
+            "closed" below the failure threshold, "open" while cooling down,
+            "half-open" once the cooldown has expired
+        """
+        if self._failure_count.get(name, 0) < FAILURE_THRESHOLD:
+            return "closed"
+        if self._cooldown_until.get(name, 0.0) > time.monotonic():
+            return "open"
+        return "half-open"
+
+    def _begin_attempt(self, name: str) -> bool:
+        """Claim the trial slot of a half-open provider before trying it.
+
+        Args:
+            name: Name of the provider about to be tried
+
+        Returns:
+            False if the provider is half-open and another request is already
+            running its trial, True otherwise
+        """
+        if self._breaker_state(name) != "half-open":
+            return True
+        if name in self._half_open_trials:
+            return False
+        self._half_open_trials.add(name)
+        return True
+
+    def _record_provider_failure(self, name: str) -> None:
+        """Count a failure and start a cooldown once the threshold is reached.
+
+        Does nothing if the provider was removed while its request was
+        running, so no stale state is left behind for that name.
+
+        Args:
+            name: Name of the provider that failed
+        """
+        if name not in self._providers_by_name:
+            return
+        failures = self._failure_count.get(name, 0) + 1
+        self._failure_count[name] = failures
+        if failures >= FAILURE_THRESHOLD:
+            cooldown = min(
+                BASE_COOLDOWN_SECONDS * 2 ** (failures - FAILURE_THRESHOLD),
+                MAX_COOLDOWN_SECONDS,
+            )
+            self._cooldown_until[name] = time.monotonic() + cooldown
+            self.logger.warning(
+                "Provider %s failed %d times in a row, skipping it for %.0fs",
+                name,
+                failures,
+                cooldown,
+            )
+
+    def _record_provider_success(self, name: str) -> None:
+        """Reset circuit-breaker state after a successful request.
+
+        Args:
+            name: Name of the provider that succeeded
+        """
+        self._failure_count.pop(name, None)
+        self._cooldown_until.pop(name, None)
 
     async def _select_provider(self) -> BaseProvider:
         """Select a provider based on the configured routing strategy.
 
-        This is an internal method that implements the provider selection
-        logic for each supported strategy.
+        This is an internal method that dispatches to the selector resolved
+        for the configured strategy in __init__.
 
         Returns:
             Selected provider instance
@@ -351,56 +910,177 @@ class Router:
         if not self.providers:
             raise ProviderError("No providers available for selection")
 
-        if self.strategy == "round-robin":
-            # Round-robin: select in cyclic order
-            selected = self.providers[
-                self._current_index % len(self.providers)
-            ]
-            self._current_index += 1
+        if self._select_sync is not None:
+            return self._select_sync()
+        return await self._select_first_available()
+
+    def _select_round_robin(self) -> BaseProvider:
+        """Select providers in cyclic order, honoring provider weights.
+
+        With equal weights this is a plain counter modulo the provider count.
+        Otherwise it uses smooth weighted round-robin (as in nginx): every
+        provider's current weight grows by its weight, the largest one is
+        picked and reduced by the total, which spreads a heavy provider's
+        turns evenly instead of bunching them.
+
+        Returns:
+            Next provider in the (weighted) rotation
+        """
+        if not self._weighted:
+            index = next(self._counter) % len(self.providers)
+        else:
+            current = self._current_weights
+            for i, weight in enumerate(self._weights):
+                current[i] += weight
+            index = max(range(len(current)), key=current.__getitem__)
+            current[index] -= self._total_weight
+        selected = self.providers[index]
+        self.logger.info(
+            "Selected provider: %s (strategy: round-robin)", selected.config.name
+        )
+        return selected
+
+    def _select_random(self) -> BaseProvider:
+        """Select a provider uniformly at random using the router's RNG.
+
+        Returns:
+            Randomly chosen provider
+        """
+        selected = self.providers[self._rng.randrange(len(self.providers))]
+        self.logger.info(
+            "Selected provider: %s (strategy: random)", selected.config.name
+        )
+        return selected
+
+    async def _select_first_available(self) -> BaseProvider:
+        """Select the first healthy provider in registration order.
+
+        Health results are cached for HEALTH_CACHE_TTL_SECONDS. Providers
+        without a cached result are all probed concurrently, and selection
+        waits only for the probes up to the first healthy provider; later
+        probes finish in the background and populate the cache. Expired
+        results are still used for this selection while a background task
+        refreshes them, keeping health probes off the request path. The
+        lowest-index healthy provider wins to preserve registration-order
+        priority.
+
+        Returns:
+            First healthy provider, or the first provider if none is healthy
+        """
+        # Start first-time probes together so they overlap
+        for provider in self.providers:
+            if provider.config.name not in self._health_cache:
+                self._schedule_health_refresh(provider)
+
+        selected = None
+        # Iterate over a snapshot: remove_provider() may run while we await
+        for provider in tuple(self.providers):
+            name = provider.config.name
+            if name not in self._health_cache:
+                if selected is not None:
+                    # First probe still running; not needed for this request
+                    continue
+                task = self._health_refresh_tasks.get(name)
+                if task is None:
+                    # Provider was removed while an earlier probe was awaited
+                    continue
+                try:
+                    # Shielded: the probe is shared and must outlive a
+                    # cancelled caller
+                    await asyncio.shield(task)
+                except asyncio.CancelledError:
+                    if not task.cancelled():
+                        raise
+                    # remove_provider() cancelled the probe; skip the provider
+                    continue
+            cached = self._health_cache.get(name)
+            if cached is None:
+                continue
+            is_healthy, checked_at = cached
+            if time.monotonic() - checked_at >= HEALTH_CACHE_TTL_SECONDS:
+                self._schedule_health_refresh(provider)
+            if is_healthy and selected is None:
+                selected = provider
+
+        # If no healthy provider found, fallback to first provider
+        if selected is None:
+            if not self.providers:
+                raise ProviderError("No providers available for selection")
+            selected = self.providers[0]
             self.logger.info(
-                f"Selected provider: {selected.config.name} "
-                f"(strategy: round-robin)"
+                "No healthy providers found, will try all starting with: %s "
+                "(strategy: first-available)",
+                selected.config.name,
             )
-            return selected
-
-        elif self.strategy == "random":
-            # Random: select a random provider
-            selected = random.choice(self.providers)
+        else:
             self.logger.info(
-                f"Selected provider: {selected.config.name} "
-                f"(strategy: random)"
+                "Selected provider: %s (strategy: first-available)",
+                selected.config.name,
             )
-            return selected
-
-        elif self.strategy == "first-available":
-            # First-available: select first healthy provider
-            selected = None
-            for provider in self.providers:
-                if await provider.health_check():
-                    selected = provider
-                    break
-
-            # If no healthy provider found, fallback to first provider
-            if selected is None:
-                selected = self.providers[0]
-                self.logger.info(
-                    f"No healthy providers found, will try all starting with: "
-                    f"{selected.config.name} (strategy: first-available)"
-                )
-            else:
-                self.logger.info(
-                    f"Selected provider: {selected.config.name} "
-                    f"(strategy: first-available)"
-                )
-            return selected
+        return selected
 
-        elif self.strategy == "best-available":
-            # Best-available: select healthiest provider with lowest latency
-            return self._select_best_available_provider()
+    async def _refresh_health(self, provider: BaseProvider) -> bool:
+        """Check a provider's health and store the result in the cache.
 
-        else:
-            # This should never happen due to validation in __init__
-            raise ValueError(f"Unknown strategy: {self.strategy}")
+        The result is dropped if the provider was removed (or replaced by
+        another instance with the same name) while it was being checked.
+
+        Args:
+            provider: Provider to check
+
+        Returns:
+            Result of the health check
+        """
+        is_healthy = await self._check_health(provider)
+        name = provider.config.name
+        index = self._providers_by_name.get(name)
+        if index is not None and self.providers[index] is provider:
+            self._health_cache[name] = (is_healthy, time.monotonic())
+        return is_healthy
+
+    def _schedule_health_refresh(self, provider: BaseProvider) -> None:
+        """Refresh a provider's cached health in the background.
+
+        At most one refresh per provider is in flight at a time.
+
+        Args:
+            provider: Provider with a missing or expired cached result
+        """
+        name = provider.config.name
+        if name in self._health_refresh_tasks:
+            return
+        task = asyncio.create_task(self._refresh_health(provider))
+        self._health_refresh_tasks[name] = task
+
+        def forget(done: asyncio.Task[bool]) -> None:
+            # Only forget this task, not a newer one for a re-added provider
+            if self._health_refresh_tasks.get(name) is done:
+                del self._health_refresh_tasks[name]
+
+        task.add_done_callback(forget)
+
+    async def _check_health(self, provider: BaseProvider) -> bool:
+        """Run a provider health check bounded by HEALTH_CHECK_TIMEOUT_SECONDS.
+
+        A health check that times out or raises is treated as unhealthy, so
+        one slow or misbehaving provider cannot stall provider selection.
+
+        Args:
+            provider: Provider to check
+
+        Returns:
+            True if the provider reported healthy within the timeout,
+            False otherwise
+        """
+        try:
+            return await asyncio.wait_for(
+                provider.health_check(), timeout=HEALTH_CHECK_TIMEOUT_SECONDS
+            )
+        except Exception as e:
+            self.logger.warning(
+                "Health check for provider %s failed: %s", provider.config.name, e
+            )
+            return False
 
     def _effective_latency_for_sort(self, metrics: ProviderMetrics) -> float:
         """Calculate effective latency for sorting providers.
@@ -476,15 +1156,59 @@ class Router:
         )
 
         selected = selected_group[0]
-        metrics = self.metrics[selected.config.name]
-        effective_latency = self._effective_latency_for_sort(metrics)
 
+        # health_status and latency are recomputed here only for the log line
+        if self.logger.isEnabledFor(logging.INFO):
+            metrics = self.metrics[selected.config.name]
+            self.logger.info(
+                "Selected provider: %s (strategy: best-available, health: %s, "
+                "latency: %.1fms)",
+                selected.config.name,
+                metrics.health_status,
+                self._effective_latency_for_sort(metrics),
+            )
+
+        return selected
+
+    def _select_by_score(self) -> BaseProvider:
+        """Select the provider with the lowest latency-and-price score.
+
+        The score is the provider's latency EWMA plus its price per 1K tokens
+        weighted by SCORE_COST_WEIGHT_MS. Providers without latency data
+        score on price alone, so they get tried. The best provider is
+        recomputed at most every SCORE_REFRESH_SECONDS (or after the
+        provider set changes); in between, the cached choice is reused.
+
+        Returns:
+            Selected provider instance
+
+        Raises:
+            ProviderError: If no providers are available
+        """
+        if not self.providers:
+            raise ProviderError("No providers available for selection")
+
+        now = time.monotonic()
+        if now >= self._score_expires_at:
+            scores: list[tuple[float, int]] = []
+            for index, provider in enumerate(self.providers):
+                name = provider.config.name
+                price = self._prices.get(name)
+                if price is None:
+                    price = get_price_per_1k(name, provider.config.model)
+                    self._prices[name] = price
+                latency = self.metrics[name].ewma_latency_ms or 0.0
+                scores.append((latency + SCORE_COST_WEIGHT_MS * price, index))
+            self._score_choice = min(scores)
+            self._score_expires_at = now + SCORE_REFRESH_SECONDS
+
+        score, index = self._score_choice
+        selected = self.providers[index]
         self.logger.info(
-            f"Selected provider: {selected.config.name} "
-            f"(strategy: best-available, health: {metrics.health_status}, "
-            f"latency: {effective_latency:.1f}ms)"
+            "Selected provider: %s (strategy: score, score: %.1f)",
+            selected.config.name,
+            score,
         )
-
         return selected
 
     def get_metrics(self) -> dict[str, ProviderMetrics]:
@@ -539,7 +1263,8 @@ class Router:
             TimeoutError: If all providers timeout (before first chunk)
             RateLimitError: If all providers hit rate limit (before first chunk)
             AuthenticationError: If all providers fail authentication (before first chunk)
-            InvalidRequestError: If all providers receive invalid requests (before first chunk)
+            InvalidRequestError: As soon as any provider rejects the request
+                (no fallback, see NON_RETRYABLE_ERRORS)
             Exception: Any other exception from the last failed provider (before first chunk)
                        or any exception after the first chunk is yielded
 
@@ -566,129 +1291,141 @@ class Router:
         if not self.providers:
             raise ProviderError("No providers registered")
 
-        # Select provider based on strategy
-        selected_provider = await self._select_provider()
-
-        # Find index of selected provider for fallback logic
-        selected_index = self.providers.index(selected_provider)
-
         # Attempt to generate response with fallback
         last_error: Exception | None = None
 
-        for i in range(len(self.providers)):
-            # Calculate provider index (circular, starting from selected)
-            index = (selected_index + i) % len(self.providers)
-            provider = self.providers[index]
+        order, last_resort = await self._provider_order()
+        for provider in order:
+            name = provider.config.name
+            claimed = self._begin_attempt(name)
+            if not (claimed or last_resort):
+                continue
 
             # Measure time for metrics
             start_time = time.perf_counter()
 
-            try:
-                self.logger.info(f"Trying provider: {provider.config.name}")
+            self.logger.info("Trying provider: %s", provider.config.name)
 
-                # Track if we've yielded the first chunk
-                # Once the first chunk is sent, we cannot fallback to another provider
-                first_chunk_sent = False
+            # Track if we've yielded the first chunk
+            # Once the first chunk is sent, we cannot fallback to another provider
+            first_chunk_sent = False
 
-                # Accumulate chunks for token counting (v0.7.0+)
-                accumulated_chunks: list[str] = []
+            # Accumulate chunks for token counting (v0.7.0+)
+            accumulated_chunks: list[str] = []
 
+            stream = provider.generate_stream(prompt, params)
+            try:
                 try:
                     # Stream chunks from the provider
-                    async for chunk in provider.generate_stream(prompt, params):
+                    async for chunk in stream:
                         # Mark that we've started streaming
-                        if not first_chunk_sent:
-                            first_chunk_sent = True
+                        first_chunk_sent = True
 
                         # Accumulate chunks for token counting
                         accumulated_chunks.append(chunk)
 
                         # Yield the chunk to the caller
                         yield chunk
+                finally:
+                    # Close the provider stream right away (also when the caller
+                    # stops consuming early) so its HTTP connection is released
+                    aclose = getattr(stream, "aclose", None)
+                    if aclose is not None:
+                        await aclose()
 
-                    # If we get here, streaming completed successfully
-                    # Calculate latency
-                    latency_ms = (time.perf_counter() - start_time) * 1000
-
-                    # Reconstruct full response for tokenization (v0.7.0+)
-                    full_response = "".join(accumulated_chunks)
-
-                    # Count tokens (v0.7.0+)
-                    prompt_tokens = count_tokens(prompt)
-                    completion_tokens = count_tokens(full_response)
-                    total_tokens = prompt_tokens + completion_tokens
-
-                    # Calculate cost (v0.7.0+)
-                    cost = calculate_cost(
-                        provider_name=provider.config.name,
-                        model=provider.config.model,
-                        total_tokens=total_tokens,
-                    )
-
-                    # Update metrics with tokens and cost
-                    metrics = self.metrics[provider.config.name]
-                    metrics.record_success(
-                        latency_ms=latency_ms,
-                        prompt_tokens=prompt_tokens,
-                        completion_tokens=completion_tokens,
-                        cost=cost,
-                    )
+            except Exception as e:
+                # Calculate latency even for failed requests
+                latency_ms = (time.perf_counter() - start_time) * 1000
+                metrics = self.metrics.get(name)
+                if metrics is not None:
+                    metrics.record_error(latency_ms)
 
-                    # Log success event with token info
-                    self._log_request_event(
-                        provider_name=provider.config.name,
-                        model=provider.config.model,
-                        latency_ms=latency_ms,
-                        streaming=True,
-                        success=True,
-                        prompt_tokens=prompt_tokens,
-                        completion_tokens=completion_tokens,
-                        total_tokens=total_tokens,
-                        cost=cost,
-                    )
+                # Log failure event
+                self._log_request_event(
+                    provider_name=provider.config.name,
+                    model=provider.config.model,
+                    latency_ms=latency_ms,
+                    streaming=True,
+                    success=False,
+                    error_type=type(e).__name__,
+                )
 
-                    self.logger.info(
-                        f"Success with provider: {provider.config.name}"
+                if isinstance(e, NON_RETRYABLE_ERRORS):
+                    self.logger.warning(
+                        "Provider %s rejected the request: %s, not retrying",
+                        provider.config.name,
+                        e,
                     )
-                    return
-
-                except Exception as stream_error:
-                    # Calculate latency even for failed requests
-                    latency_ms = (time.perf_counter() - start_time) * 1000
-                    metrics = self.metrics[provider.config.name]
-                    metrics.record_error(
-                        latency_ms, datetime.now(UTC)
+                    raise
+
+                self._record_provider_failure(name)
+
+                # If error occurred after first chunk, we cannot fallback
+                # Raise immediately to prevent mixing chunks from different providers
+                if first_chunk_sent:
+                    self.logger.error(
+                        "Streaming error after first chunk from provider "
+                        "%s: %s. Cannot fallback to prevent mixing chunks.",
+                        provider.config.name,
+                        e,
                     )
+                    raise
 
-                    # Log failure event
-                    self._log_request_event(
-                        provider_name=provider.config.name,
-                        model=provider.config.model,
-                        latency_ms=latency_ms,
-                        streaming=True,
-                        success=False,
-                        error_type=type(stream_error).__name__,
-                    )
-
-                    # If error occurred after first chunk, we cannot fallback
-                    # Raise immediately to prevent mixing chunks from different providers
-                    if first_chunk_sent:
-                        self.logger.error(
-                            f"Streaming error after first chunk from provider "
-                            f"{provider.config.name}: {stream_error}. "
-                            f"Cannot fallback to prevent mixing chunks."
-                        )
-                        raise
-
-                    # If error occurred before first chunk, we can try next provider
-                    raise stream_error
-
-            except Exception as e:
+                # If error occurred before first chunk, we can try next provider
                 self.logger.warning(
-                    f"Provider {provider.config.name} failed: {e}, trying next"
+                    "Provider %s failed: %s, trying next", provider.config.name, e
                 )
                 last_error = e
                 continue
+            finally:
+                if claimed:
+                    self._half_open_trials.discard(name)
+
+            # If we get here, streaming completed successfully
+            # Calculate latency
+            latency_ms = (time.perf_counter() - start_time) * 1000
+
+            # Reconstruct full response for tokenization (v0.7.0+)
+            full_response = "".join(accumulated_chunks)
+
+            # Count tokens (v0.7.0+)
+            prompt_tokens = count_tokens(prompt)
+            completion_tokens = count_tokens(full_response)
+            total_tokens = prompt_tokens + completion_tokens
+
+            # Calculate cost (v0.7.0+)
+            cost = calculate_cost(
+                provider_name=provider.config.name,
+                model=provider.config.model,
+                total_tokens=total_tokens,
+            )
+
+            # Update metrics with tokens and cost (unless removed meanwhile)
+            metrics = self.metrics.get(name)
+            if metrics is not None:
+                metrics.record_success(
+                    latency_ms=latency_ms,
+                    prompt_tokens=prompt_tokens,
+                    completion_tokens=completion_tokens,
+                    cost=cost,
+                )
+
+            # Log success event with token info
+            self._log_request_event(
+                provider_name=provider.config.name,
+                model=provider.config.model,
+                latency_ms=latency_ms,
+                streaming=True,
+                success=True,
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                total_tokens=total_tokens,
+                cost=cost,
+            )
+
+            self._record_provider_success(name)
+            self.logger.info("Success with provider: %s", provider.config.name)
+            return
 
         # All providers failed (before any chunks were yielded)
         self.logger.error("All providers failed")
@@ -743,9 +1480,7 @@ class Router:
             self._update_metrics_loop()
         )
 
-        self.logger.info(
-            f"Metrics server started at http://0.0.0.0:{port}/metrics"
-        )
+        self.logger.info("Metrics server started at http://0.0.0.0:%d/metrics", port)
 
     async def stop_metrics_server(self) -> None:
         """Stop Prometheus metrics HTTP server gracefully.
@@ -802,5 +1537,5 @@ class Router:
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                self.logger.error(f"Error updating metrics: {e}")
+                self.logger.error("Error updating metrics: %s", e)
                 await asyncio.sleep(1.0)
@@ -18,9 +18,43 @@ Example:
 """
 
 import logging
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import tiktoken
 
 logger = logging.getLogger("orchestrator.tokenization")
 
+# Max number of per-model tiktoken encoders kept by _get_encoder()
+ENCODER_CACHE_SIZE = 16
+
+
+@lru_cache(maxsize=ENCODER_CACHE_SIZE)
+def _get_encoder(model: str) -> "tiktoken.Encoding | None":
+    """Return the tiktoken encoder for a model, resolving it once per model.
+
+    Failures are cached as None too: loading an encoding may download it
+    synchronously, so retrying on every call (e.g. while offline) would
+    block the event loop on each routed request.
+
+    Args:
+        model: Model name for tiktoken encoding
+
+    Returns:
+        tiktoken encoder for the model, or None if it could not be loaded
+    """
+    try:
+        import tiktoken
+
+        return tiktoken.encoding_for_model(model)
+    except Exception as e:
+        logger.warning(
+            f"tiktoken failed for model '{model}': {e}. "
+            f"Using fallback estimation (word_count * 1.3)"
+        )
+        return None
+
 
 def count_tokens(text: str, model: str = "gpt-3.5-turbo") -> int:
     """Count tokens using tiktoken with fallback to word-based estimation.
@@ -59,11 +93,17 @@ def count_tokens(text: str, model: str = "gpt-3.5-turbo") -> int:
         For English text, 1 token ≈ 0.75 words, so 1 word ≈ 1.3 tokens.
         Accuracy varies for non-English languages.
     """
-    try:
-        import tiktoken
+    # Empty text is 0 tokens for every encoding; skip the encoder lookup
+    if not text:
+        return 0
 
-        encoding = tiktoken.encoding_for_model(model)
-        return len(encoding.encode(text))
+    encoder = _get_encoder(model)
+    if encoder is None:
+        # Encoder could not be loaded (already logged once for this model)
+        return estimate_tokens_fallback(text)
+
+    try:
+        return len(encoder.encode(text))
     except Exception as e:
         # Fallback to word-based estimation
         logger.warning(
@@ -110,5 +150,6 @@ def estimate_tokens_fallback(text: str) -> int:
         - Code snippets
     """
     word_count = len(text.split())
-    return int(word_count * 1.3)
+    # Integer form of int(word_count * 1.3), without the float round-trip
+    return (word_count * 13) // 10
 
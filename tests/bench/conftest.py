@@ -0,0 +1,43 @@
+"""Pytest fixtures for Multi-LLM Orchestrator benchmarks.
+
+Benchmarks need the pytest-benchmark plugin (a dev dependency) and are
+skipped when it is not installed.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.fixture
+def aio_benchmark(
+    benchmark: Any, event_loop: asyncio.AbstractEventLoop
+) -> Callable[..., None]:
+    """Return a wrapper that benchmarks a coroutine function.
+
+    pytest-benchmark only times synchronous callables, so each round runs
+    the coroutine to completion on the shared session event loop. Tests
+    using this fixture must be synchronous.
+
+    Args:
+        benchmark: pytest-benchmark fixture
+        event_loop: Session-scoped event loop fixture
+
+    Returns:
+        Callable taking a coroutine function and its arguments
+
+    Example:
+        ```python
+        def test_route_perf(aio_benchmark, router):
+            aio_benchmark(router.route, "test")
+        ```
+    """
+
+    def run(func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> None:
+        benchmark(lambda: event_loop.run_until_complete(func(*args, **kwargs)))
+
+    return run
@@ -0,0 +1,73 @@
+"""Benchmarks for the Router request hot path.
+
+Measures route() and route_stream() on a warm Router with three
+zero-delay mock-instant providers. Token counting is replaced by the
+word-count estimate, so the timings cover routing overhead (selection,
+metrics, logging) rather than simulated latency or tiktoken lookups.
+
+Benchmarks are not collected by a plain pytest run. Run them with:
+    pytest tests/bench --benchmark-only
+"""
+
+import asyncio
+from collections.abc import Callable
+
+import pytest
+
+from orchestrator import Router
+from orchestrator import router as router_module
+from orchestrator.tokenization import estimate_tokens_fallback
+
+# (name, model) pairs for make_router: three zero-delay providers
+INSTANT_X3 = (
+    ("provider-1", "mock-instant"),
+    ("provider-2", "mock-instant"),
+    ("provider-3", "mock-instant"),
+)
+
+# Requests made before timing so metrics windows are populated
+WARMUP_REQUESTS = 10
+
+
+@pytest.fixture
+def warm_router(
+    make_router: Callable[..., Router],
+    event_loop: asyncio.AbstractEventLoop,
+    monkeypatch: pytest.MonkeyPatch,
+) -> Router:
+    """Create a round-robin Router over INSTANT_X3 after a few warm-up requests.
+
+    The router's count_tokens is stubbed with the word-count estimate, so
+    tiktoken (which may download encodings) is kept out of the timings.
+
+    Returns:
+        Router whose providers already have recorded metrics
+    """
+    monkeypatch.setattr(router_module, "count_tokens", estimate_tokens_fallback)
+    router = make_router("round-robin", *INSTANT_X3)
+    for _ in range(WARMUP_REQUESTS):
+        event_loop.run_until_complete(router.route("test"))
+    return router
+
+
+async def _consume_stream(router: Router, prompt: str) -> None:
+    """Drain router.route_stream() for one prompt."""
+    async for _ in router.route_stream(prompt):
+        pass
+
+
+@pytest.mark.slow
+class TestRouterBenchmarks:
+    """Benchmark Router.route() and Router.route_stream()."""
+
+    def test_route_perf(
+        self, aio_benchmark: Callable[..., None], warm_router: Router
+    ) -> None:
+        """Benchmark a single route() call."""
+        aio_benchmark(warm_router.route, "test")
+
+    def test_route_stream_perf(
+        self, aio_benchmark: Callable[..., None], warm_router: Router
+    ) -> None:
+        """Benchmark draining a single route_stream() call."""
+        aio_benchmark(_consume_stream, warm_router, "test")
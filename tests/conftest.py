@@ -3,22 +3,186 @@
 This module provides reusable fixtures for testing Router, MockProvider,
 and related components. All fixtures follow pytest conventions and
 support async testing with pytest-asyncio.
+
+Config and MockProvider fixtures are session-scoped because they hold no
+mutable state; tests must not modify them. Router fixtures stay
+function-scoped since routers track selection state and metrics.
+
+All async tests share one session-scoped event loop, so tests must not rely
+on a fresh loop (e.g. to discard tasks they leave running).
 """
 
-import sys
-from pathlib import Path
+import asyncio
+from collections.abc import Callable, Iterator
+from functools import cache
+from types import SimpleNamespace
 
 import pytest
 
-# Add src to path for testing
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from orchestrator import Router
+from orchestrator.metrics import MIN_REQUESTS_FOR_HEALTH, ProviderMetrics
+from orchestrator.providers import mock as mock_module
 from orchestrator.providers.base import ProviderConfig
 from orchestrator.providers.mock import MockProvider
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is optional (no Windows wheels)
+    uvloop = None
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the --fast option for skipping slow tests."""
+    parser.addoption(
+        "--fast",
+        action="store_true",
+        default=False,
+        help="Skip tests marked @pytest.mark.slow",
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Skip tests marked slow when --fast is given."""
+    if not config.getoption("--fast"):
+        return
+    skip_slow = pytest.mark.skip(reason="--fast: skipping slow test")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def event_loop() -> Iterator[asyncio.AbstractEventLoop]:
+    """Share one event loop across all async tests of the session.
+
+    Overrides pytest-asyncio's function-scoped loop, so the loop is created
+    and closed once instead of once per test. Uses uvloop's faster loop when
+    it is installed.
+    """
+    loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+def assert_all_responses_were_requested() -> bool:
+    """Allow pytest-httpx stubs that a test does not consume.
+
+    Lets tests register a shared set of responses (e.g. a fixture-provided
+    OAuth2 stub) without every test having to hit all of them. Tests assert
+    on the provider's result or on httpx_mock.get_requests() instead.
+    """
+    return False
+
+
+@pytest.fixture(scope="session")
+def make_config() -> Callable[..., ProviderConfig]:
+    """Return a ProviderConfig factory that validates each distinct config once.
+
+    Calls with the same keyword arguments return the same (shared) instance
+    for the whole session, so tests must not modify the returned configs.
+
+    Returns:
+        Cached callable taking ProviderConfig keyword arguments
+    """
+
+    @cache
+    def make(**kwargs: object) -> ProviderConfig:
+        return ProviderConfig(**kwargs)
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def make_mock_provider(
+    make_config: Callable[..., ProviderConfig],
+) -> Callable[[str, str], MockProvider]:
+    """Return a MockProvider factory that builds each (name, model) pair once.
+
+    MockProvider holds no state besides its config, so one instance can be
+    registered with any number of routers.
+
+    Args:
+        make_config: Cached ProviderConfig factory fixture
+
+    Returns:
+        Cached callable taking a provider name and a mock model
+    """
+
+    @cache
+    def make(name: str, model: str) -> MockProvider:
+        return MockProvider(make_config(name=name, model=model))
+
+    return make
+
+
+@pytest.fixture
+def make_router(
+    make_mock_provider: Callable[[str, str], MockProvider],
+) -> Callable[..., Router]:
+    """Return a factory for fresh Routers over shared MockProviders.
+
+    Each call creates a new Router (so selection state and metrics start
+    clean) and registers the cached providers in the given order.
+
+    Args:
+        make_mock_provider: Cached MockProvider factory fixture
+
+    Returns:
+        Callable taking a strategy and (name, model) pairs
+
+    Example:
+        ```python
+        router = make_router("round-robin", ("p1", "mock-timeout"), ("p2", "mock-normal"))
+        ```
+    """
+
+    def make(strategy: str, *providers: tuple[str, str]) -> Router:
+        router = Router(strategy=strategy)
+        for name, model in providers:
+            router.add_provider(make_mock_provider(name, model))
+        return router
+
+    return make
+
+
+@pytest.fixture
+def primed_metrics() -> ProviderMetrics:
+    """Create ProviderMetrics with just enough successes to assess health.
+
+    Records MIN_REQUESTS_FOR_HEALTH successful requests at 100ms, so
+    health_status is evaluated instead of defaulting to "healthy".
+
+    Returns:
+        ProviderMetrics instance with MIN_REQUESTS_FOR_HEALTH successes
+    """
+    metrics = ProviderMetrics()
+    for _ in range(MIN_REQUESTS_FOR_HEALTH):
+        metrics.record_success(100.0)
+    return metrics
+
 
 @pytest.fixture
+def frozen_clock(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make MockProvider's simulated delays return immediately.
+
+    Swaps the asyncio name inside orchestrator.providers.mock for a
+    namespace whose sleep is a no-op, so mock-normal responses (and
+    streams) skip their 0.1s/0.05s waits. The real asyncio module is left
+    alone, so the event loop, the router's timeouts and other tests still
+    see the real asyncio.sleep. Error modes are unaffected; they raise
+    before sleeping.
+    """
+
+    async def no_sleep(delay: float) -> None:
+        return None
+
+    monkeypatch.setattr(mock_module, "asyncio", SimpleNamespace(sleep=no_sleep))
+
+
+@pytest.fixture(scope="session")
 def mock_provider_config() -> ProviderConfig:
     """Create a default ProviderConfig for testing.
     
@@ -28,7 +192,7 @@ def mock_provider_config() -> ProviderConfig:
     return ProviderConfig(name="test-provider", model="mock-normal")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_provider_normal() -> MockProvider:
     """Create a MockProvider in normal mode.
     
@@ -41,7 +205,7 @@ def mock_provider_normal() -> MockProvider:
     return MockProvider(config)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_provider_timeout() -> MockProvider:
     """Create a MockProvider in timeout mode.
     
@@ -54,7 +218,7 @@ def mock_provider_timeout() -> MockProvider:
     return MockProvider(config)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_provider_unhealthy() -> MockProvider:
     """Create a MockProvider in unhealthy mode.
     
@@ -80,11 +244,14 @@ def router_round_robin() -> Router:
 @pytest.fixture
 def router_random() -> Router:
     """Create a Router with random strategy.
+
+    The router's private RNG is seeded so provider selection is
+    reproducible across test runs.
     
     Returns:
         Router instance configured for random provider selection
     """
-    return Router(strategy="random")
+    return Router(strategy="random", seed=0)
 
 
 @pytest.fixture
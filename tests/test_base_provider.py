@@ -198,3 +198,18 @@ class TestGenerationParamsValidation:
         params_empty = GenerationParams(stop=[])
         assert params_empty.stop == []
 
+    def test_generation_params_immutable(self) -> None:
+        """Test that GenerationParams cannot be modified after creation.
+
+        Verifies that shared params objects are safe to reuse and that
+        model_copy() derives new parameters.
+        """
+        params = GenerationParams(temperature=0.5)
+
+        with pytest.raises(ValidationError):
+            params.temperature = 1.0  # type: ignore[misc]
+
+        updated = params.model_copy(update={"max_tokens": 10})
+        assert updated.max_tokens == 10
+        assert params.max_tokens == 1000
+
@@ -9,10 +9,18 @@ This module tests all GigaChatProvider functionality including:
 - Network error handling
 """
 
+import asyncio
+import gc
+import json
+import time
+from collections.abc import Iterator
+
 import httpx
+import orjson
 import pytest
 import pytest_httpx
 
+from orchestrator.providers import gigachat as gigachat_module
 from orchestrator.providers.base import (
     AuthenticationError,
     GenerationParams,
@@ -24,12 +32,78 @@ from orchestrator.providers.base import (
 )
 from orchestrator.providers.gigachat import GigaChatProvider
 
+# OAuth2 expires_at (milliseconds since epoch) for tokens that never expire
+FAR_FUTURE_EXPIRES_AT = 9_999_999_999_000
+
+
+def _oauth_ok(token: str = "test_token") -> dict[str, object]:
+    """Build a successful OAuth2 token response body."""
+    return {"access_token": token, "expires_at": FAR_FUTURE_EXPIRES_AT}
+
+
+# Pre-serialized bodies for the most common stubs (sent with JSON_HEADERS)
+JSON_HEADERS = {"Content-Type": "application/json"}
+OAUTH_OK_BYTES = orjson.dumps(_oauth_ok())
+CHAT_OK_BYTES = orjson.dumps({"choices": [{"message": {"content": "Test response"}}]})
+
+# GenerationParams are immutable, so one instance is shared by all tests
+CUSTOM_PARAMS = GenerationParams(
+    max_tokens=500, temperature=0.8, top_p=0.9, stop=["###", "END"]
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_gigachat_token_cache() -> None:
+    """Isolate tests from OAuth2 tokens cached by previous tests."""
+    GigaChatProvider.clear_token_cache()
+
+
+@pytest.fixture
+def oauth_stub(httpx_mock: pytest_httpx.HTTPXMock) -> None:
+    """Install the standard OAuth2 token response (token "test_token")."""
+    httpx_mock.add_response(
+        url="https://ngw.devices.sberbank.ru:9443/api/v2/oauth",
+        method="POST",
+        content=OAUTH_OK_BYTES,
+        headers=JSON_HEADERS,
+    )
+
+
+@pytest.fixture
+def authed_provider(http_client: httpx.AsyncClient) -> GigaChatProvider:
+    """Create a GigaChatProvider that already holds a valid access token.
+
+    For tests of request handling that do not exercise the OAuth2 flow, so
+    no token response has to be mocked.
+    """
+    config = ProviderConfig(name="gigachat", api_key="test_key")
+    provider = GigaChatProvider(config, http_client=http_client)
+    provider._access_token = "test_token"
+    provider._token_expires_at = time.time() + 3600
+    return provider
+
+
+@pytest.fixture(scope="session")
+def http_client(
+    event_loop: asyncio.AbstractEventLoop,
+) -> Iterator[httpx.AsyncClient]:
+    """Share one HTTPX client (and connection pool) across GigaChat tests."""
+    client = httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+    )
+    yield client
+    event_loop.run_until_complete(client.aclose())
+
 
 class TestGigaChatProviderOAuth2:
     """Test OAuth2 token management."""
 
     @pytest.mark.asyncio
-    async def test_successful_token_acquisition(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
+    async def test_successful_token_acquisition(
+        self,
+        http_client: httpx.AsyncClient,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
         """Test successful OAuth2 token acquisition.
 
         Verifies that provider correctly requests and stores OAuth2 token
@@ -39,17 +113,18 @@ class TestGigaChatProviderOAuth2:
         httpx_mock.add_response(
             url="https://ngw.devices.sberbank.ru:9443/api/v2/oauth",
             method="POST",
-            json={"access_token": "test_token_123", "expires_at": 9999999999000},
+            json=_oauth_ok("test_token_123"),
         )
 
         config = ProviderConfig(name="gigachat", api_key="test_key")
-        provider = GigaChatProvider(config)
+        provider = GigaChatProvider(config, http_client=http_client)
 
         # Token should be acquired on first generate() call
         httpx_mock.add_response(
             url="https://gigachat.devices.sberbank.ru/api/v1/chat/completions",
             method="POST",
-            json={"choices": [{"message": {"content": "Test response"}}]},
+            content=CHAT_OK_BYTES,
+            headers=JSON_HEADERS,
         )
 
         response = await provider.generate("test")
@@ -57,7 +132,11 @@ class TestGigaChatProviderOAuth2:
         assert provider._access_token == "test_token_123"
 
     @pytest.mark.asyncio
-    async def test_invalid_authorization_key(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
+    async def test_invalid_authorization_key(
+        self,
+        http_client: httpx.AsyncClient,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
         """Test handling of invalid authorization key.
 
         Verifies that 401 from OAuth2 endpoint raises AuthenticationError.
@@ -71,29 +150,31 @@ class TestGigaChatProviderOAuth2:
         )
 
         config = ProviderConfig(name="gigachat", api_key="invalid_key")
-        provider = GigaChatProvider(config)
+        provider = GigaChatProvider(config, http_client=http_client)
 
         with pytest.raises(AuthenticationError, match="Invalid authorization key"):
             await provider._ensure_access_token()
 
     @pytest.mark.asyncio
-    async def test_token_refresh_on_expiration(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
+    async def test_token_refresh_on_expiration(
+        self,
+        http_client: httpx.AsyncClient,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
         """Test automatic token refresh when token expires.
 
         Verifies that provider automatically refreshes token when it expires
         (expires_at in the past).
         """
-        import time
-
         # Mock OAuth2 endpoint - first token request
         httpx_mock.add_response(
             url="https://ngw.devices.sberbank.ru:9443/api/v2/oauth",
             method="POST",
-            json={"access_token": "token1", "expires_at": int(time.time() * 1000) - 1000},
+            json={"access_token": "token1", "expires_at": time.time_ns() // 1_000_000 - 1000},
         )
 
         config = ProviderConfig(name="gigachat", api_key="test_key")
-        provider = GigaChatProvider(config)
+        provider = GigaChatProvider(config, http_client=http_client)
 
         # First generate() - will get token1 (expired)
         httpx_mock.add_response(
@@ -109,7 +190,7 @@ class TestGigaChatProviderOAuth2:
         httpx_mock.add_response(
             url="https://ngw.devices.sberbank.ru:9443/api/v2/oauth",
             method="POST",
-            json={"access_token": "token2", "expires_at": 9999999999000},
+            json=_oauth_ok("token2"),
         )
 
         # Second generate() - should refresh token
@@ -123,49 +204,189 @@ class TestGigaChatProviderOAuth2:
         assert response == "Response 2"
         assert provider._access_token == "token2"
 
+    @pytest.mark.asyncio
+    async def test_token_validity_ignores_wall_clock_jump(
+        self,
+        http_client: httpx.AsyncClient,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a wall-clock jump does not invalidate a cached token.
 
-class TestGigaChatProviderGenerate:
-    """Test text generation functionality."""
+        Validity is checked on the monotonic clock, so moving time.time()
+        a day forward must not trigger an OAuth2 request (none is mocked).
+        """
+        config = ProviderConfig(name="gigachat", api_key="test_key")
+        provider = GigaChatProvider(config, http_client=http_client)
+        provider._access_token = "token"
+        provider._token_expires_at = time.time() + 1800
+
+        wall_clock = time.time() + 86400
+        monkeypatch.setattr(time, "time", lambda: wall_clock)
+
+        assert await provider._ensure_access_token() == "token"
 
     @pytest.mark.asyncio
-    async def test_generate_success(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
-        """Test successful text generation.
+    async def test_token_response_missing_field(
+        self,
+        http_client: httpx.AsyncClient,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test OAuth2 response without expires_at.
 
-        Verifies that generate() correctly sends request and parses response.
+        Verifies that a malformed token response raises ProviderError naming
+        the missing field and leaves no token cached.
         """
-        # Mock OAuth2
         httpx_mock.add_response(
             url="https://ngw.devices.sberbank.ru:9443/api/v2/oauth",
             method="POST",
-            json={"access_token": "test_token", "expires_at": 9999999999000},
+            json={"access_token": "test_token_123"},
         )
 
+        config = ProviderConfig(name="gigachat", api_key="test_key")
+        provider = GigaChatProvider(config, http_client=http_client)
+
+        with pytest.raises(ProviderError, match="OAuth2 response missing field: 'expires_at'"):
+            await provider._ensure_access_token()
+        assert provider._access_token is None
+
+
+    @pytest.mark.asyncio
+    async def test_concurrent_refresh_coalesced(
+        self,
+        http_client: httpx.AsyncClient,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test that concurrent callers share a single OAuth2 request."""
+        httpx_mock.add_response(
+            url="https://ngw.devices.sberbank.ru:9443/api/v2/oauth",
+            method="POST",
+            content=OAUTH_OK_BYTES,
+            headers=JSON_HEADERS,
+        )
+
+        config = ProviderConfig(name="gigachat", api_key="test_key")
+        provider = GigaChatProvider(config, http_client=http_client)
+
+        tokens = await asyncio.gather(
+            *(provider._ensure_access_token() for _ in range(10))
+        )
+
+        assert tokens == ["test_token"] * 10
+        assert len(httpx_mock.get_requests()) == 1
+
+
+class TestGigaChatProviderTokenCache:
+    """Test OAuth2 token sharing between provider instances."""
+
+    @pytest.mark.asyncio
+    async def test_providers_with_same_credentials_share_token(
+        self, httpx_mock: pytest_httpx.HTTPXMock
+    ) -> None:
+        """Test that identical credentials trigger a single OAuth2 request."""
+        httpx_mock.add_response(
+            url="https://ngw.devices.sberbank.ru:9443/api/v2/oauth",
+            method="POST",
+            json=_oauth_ok("shared_token"),
+        )
+
+        provider1 = GigaChatProvider(ProviderConfig(name="gigachat-1", api_key="test_key"))
+        provider2 = GigaChatProvider(ProviderConfig(name="gigachat-2", api_key="test_key"))
+
+        assert await provider1._ensure_access_token() == "shared_token"
+        assert await provider2._ensure_access_token() == "shared_token"
+        assert provider1._token_lock is provider2._token_lock
+
+        oauth_requests = httpx_mock.get_requests(
+            url="https://ngw.devices.sberbank.ru:9443/api/v2/oauth"
+        )
+        assert len(oauth_requests) == 1
+
+    def test_providers_with_different_scope_do_not_share_token(self) -> None:
+        """Test that different scopes get independent token cache entries."""
+        provider1 = GigaChatProvider(ProviderConfig(name="gigachat-1", api_key="test_key"))
+        provider2 = GigaChatProvider(
+            ProviderConfig(name="gigachat-2", api_key="test_key", scope="GIGACHAT_API_CORP")
+        )
+
+        provider1._access_token = "pers_token"
+        assert provider2._access_token is None
+
+    def test_token_cache_does_not_store_raw_api_key(self) -> None:
+        """Test that the cache key holds a hash of the api_key, not the key itself."""
+        GigaChatProvider(ProviderConfig(name="gigachat", api_key="secret_key"))
+
+        for cache_key in GigaChatProvider._TOKEN_CACHE:
+            assert "secret_key" not in cache_key
+
+    def test_token_cache_drops_entries_without_providers(self) -> None:
+        """Test that a cache entry goes away with the last provider using it."""
+        provider = GigaChatProvider(ProviderConfig(name="gigachat", api_key="test_key"))
+        assert len(GigaChatProvider._TOKEN_CACHE) == 1
+
+        del provider
+        gc.collect()
+
+        assert len(GigaChatProvider._TOKEN_CACHE) == 0
+
+    def test_token_lock_works_across_event_loops(self) -> None:
+        """Test that the refresh lock can be contended in successive loops.
+
+        LangChain's sync API runs each call in its own asyncio.run() loop;
+        a lock bound to the first loop would fail in the second.
+        """
+        provider = GigaChatProvider(ProviderConfig(name="gigachat", api_key="test_key"))
+
+        async def contend() -> None:
+            lock = provider._token_lock
+            async with lock:
+                waiter = asyncio.create_task(lock.acquire())
+                await asyncio.sleep(0)
+            await waiter
+            lock.release()
+
+        asyncio.run(contend())
+        asyncio.run(contend())
+
+
+class TestGigaChatProviderGenerate:
+    """Test text generation functionality."""
+
+    @pytest.mark.asyncio
+    async def test_generate_success(
+        self,
+        http_client: httpx.AsyncClient,
+        oauth_stub: None,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test successful text generation.
+
+        Verifies that generate() correctly sends request and parses response.
+        """
         # Mock API
         httpx_mock.add_response(
             url="https://gigachat.devices.sberbank.ru/api/v1/chat/completions",
             method="POST",
-            json={"choices": [{"message": {"content": "Test response"}}]},
+            content=CHAT_OK_BYTES,
+            headers=JSON_HEADERS,
         )
 
         config = ProviderConfig(name="gigachat", api_key="test_key")
-        provider = GigaChatProvider(config)
+        provider = GigaChatProvider(config, http_client=http_client)
 
         response = await provider.generate("test prompt")
         assert response == "Test response"
 
     @pytest.mark.asyncio
-    async def test_generate_with_params(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
+    async def test_generate_with_params(
+        self,
+        http_client: httpx.AsyncClient,
+        oauth_stub: None,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
         """Test generation with custom GenerationParams.
 
         Verifies that all generation parameters are correctly passed to API.
         """
-        # Mock OAuth2
-        httpx_mock.add_response(
-            url="https://ngw.devices.sberbank.ru:9443/api/v2/oauth",
-            method="POST",
-            json={"access_token": "test_token", "expires_at": 9999999999000},
-        )
-
         # Mock API
         httpx_mock.add_response(
             url="https://gigachat.devices.sberbank.ru/api/v1/chat/completions",
@@ -174,27 +395,22 @@ class TestGigaChatProviderGenerate:
         )
 
         config = ProviderConfig(name="gigachat", api_key="test_key")
-        provider = GigaChatProvider(config)
+        provider = GigaChatProvider(config, http_client=http_client)
 
-        params = GenerationParams(
-            max_tokens=500, temperature=0.8, top_p=0.9, stop=["###", "END"]
-        )
-        response = await provider.generate("test", params=params)
+        response = await provider.generate("test", params=CUSTOM_PARAMS)
         assert response == "Response"
 
     @pytest.mark.asyncio
-    async def test_generate_with_custom_model(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
+    async def test_generate_with_custom_model(
+        self,
+        http_client: httpx.AsyncClient,
+        oauth_stub: None,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
         """Test generation with custom model from config.
 
         Verifies that config.model is used in API request.
         """
-        # Mock OAuth2
-        httpx_mock.add_response(
-            url="https://ngw.devices.sberbank.ru:9443/api/v2/oauth",
-            method="POST",
-            json={"access_token": "test_token", "expires_at": 9999999999000},
-        )
-
         # Mock API
         httpx_mock.add_response(
             url="https://gigachat.devices.sberbank.ru/api/v1/chat/completions",
@@ -205,12 +421,45 @@ class TestGigaChatProviderGenerate:
         config = ProviderConfig(
             name="gigachat", api_key="test_key", model="GigaChat-Pro"
         )
-        provider = GigaChatProvider(config)
+        provider = GigaChatProvider(config, http_client=http_client)
 
         await provider.generate("test")
 
+        request = httpx_mock.get_request(
+            url="https://gigachat.devices.sberbank.ru/api/v1/chat/completions"
+        )
+        assert request is not None
+        assert json.loads(request.content)["model"] == "GigaChat-Pro"
+
     @pytest.mark.asyncio
-    async def test_generate_token_refresh_on_401(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
+    async def test_generate_with_custom_base_url(
+        self,
+        http_client: httpx.AsyncClient,
+        oauth_stub: None,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test that config.base_url is used for the chat completions endpoint."""
+        httpx_mock.add_response(
+            url="https://gigachat.example.com/api/v1/chat/completions",
+            method="POST",
+            json={"choices": [{"message": {"content": "Response"}}]},
+        )
+
+        config = ProviderConfig(
+            name="gigachat",
+            api_key="test_key",
+            base_url="https://gigachat.example.com/api/v1",
+        )
+        provider = GigaChatProvider(config, http_client=http_client)
+
+        assert await provider.generate("test") == "Response"
+
+    @pytest.mark.asyncio
+    async def test_generate_token_refresh_on_401(
+        self,
+        http_client: httpx.AsyncClient,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
         """Test automatic token refresh when 401 occurs during generate().
 
         Verifies that provider automatically refreshes token and retries request
@@ -220,13 +469,14 @@ class TestGigaChatProviderGenerate:
         httpx_mock.add_response(
             url="https://ngw.devices.sberbank.ru:9443/api/v2/oauth",
             method="POST",
-            json={"access_token": "old_token", "expires_at": 9999999999000},
+            json=_oauth_ok("old_token"),
         )
 
-        # Mock API - first request returns 401 (token expired during request)
+        # Mock API - requests with the old token return 401 (token expired)
         httpx_mock.add_response(
             url="https://gigachat.devices.sberbank.ru/api/v1/chat/completions",
             method="POST",
+            match_headers={"Authorization": "Bearer old_token"},
             status_code=401,
             json={"message": "Token expired"},
         )
@@ -235,18 +485,19 @@ class TestGigaChatProviderGenerate:
         httpx_mock.add_response(
             url="https://ngw.devices.sberbank.ru:9443/api/v2/oauth",
             method="POST",
-            json={"access_token": "new_token", "expires_at": 9999999999000},
+            json=_oauth_ok("new_token"),
         )
 
-        # Mock API - retry after refresh succeeds
+        # Mock API - retry with the refreshed token succeeds
         httpx_mock.add_response(
             url="https://gigachat.devices.sberbank.ru/api/v1/chat/completions",
             method="POST",
+            match_headers={"Authorization": "Bearer new_token"},
             json={"choices": [{"message": {"content": "Success after refresh"}}]},
         )
 
         config = ProviderConfig(name="gigachat", api_key="test_key")
-        provider = GigaChatProvider(config)
+        provider = GigaChatProvider(config, http_client=http_client)
 
         # First call will get old_token, then 401, then refresh to new_token, then retry
         response = await provider.generate("test")
@@ -255,44 +506,74 @@ class TestGigaChatProviderGenerate:
         assert provider._access_token == "new_token"
 
 
+    @pytest.mark.asyncio
+    async def test_401_reuses_token_refreshed_concurrently(
+        self,
+        http_client: httpx.AsyncClient,
+    ) -> None:
+        """Test that a 401 does not refetch a token someone already replaced.
+
+        If another request refreshed the shared token after ours was rejected,
+        the newer token is reused without a second OAuth2 request (no OAuth2
+        response is mocked, so any request would fail the test).
+        """
+        config = ProviderConfig(name="gigachat", api_key="test_key")
+        provider = GigaChatProvider(config, http_client=http_client)
+        provider._access_token = "fresh_token"
+        provider._token_expires_at = FAR_FUTURE_EXPIRES_AT / 1000
+
+        token = await provider._refresh_rejected_token("stale_token")
+        assert token == "fresh_token"
+
+
 class TestGigaChatProviderErrors:
     """Test error handling and status code mapping."""
 
     @pytest.mark.asyncio
-    async def test_error_400_invalid_request(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
-        """Test handling of 400 Bad Request error."""
-        httpx_mock.add_response(
-            url="https://ngw.devices.sberbank.ru:9443/api/v2/oauth",
-            method="POST",
-            json={"access_token": "token", "expires_at": 9999999999000},
-        )
-
+    @pytest.mark.parametrize(
+        ("status_code", "message", "error", "match"),
+        [
+            (400, "Invalid request format", InvalidRequestError, "Bad request"),
+            (404, "Model not found", InvalidRequestError, "Invalid model"),
+            (422, "Validation error", InvalidRequestError, "Validation error"),
+            (429, "Rate limit exceeded", RateLimitError, "Rate limit exceeded"),
+            (500, "Internal server error", ProviderError, "Server error"),
+        ],
+        ids=["400", "404", "422", "429", "500"],
+    )
+    async def test_http_error_mapping(
+        self,
+        authed_provider: GigaChatProvider,
+        httpx_mock: pytest_httpx.HTTPXMock,
+        status_code: int,
+        message: str,
+        error: type[Exception],
+        match: str,
+    ) -> None:
+        """Test that HTTP error statuses map to the matching provider errors."""
         httpx_mock.add_response(
             url="https://gigachat.devices.sberbank.ru/api/v1/chat/completions",
             method="POST",
-            status_code=400,
-            json={"message": "Invalid request format"},
+            status_code=status_code,
+            json={"message": message},
         )
 
-        config = ProviderConfig(name="gigachat", api_key="test_key")
-        provider = GigaChatProvider(config)
-
-        with pytest.raises(InvalidRequestError, match="Bad request"):
-            await provider.generate("test")
+        with pytest.raises(error, match=match):
+            await authed_provider.generate("test")
 
     @pytest.mark.asyncio
-    async def test_error_401_authentication(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
+    async def test_error_401_authentication(
+        self,
+        http_client: httpx.AsyncClient,
+        oauth_stub: None,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
         """Test handling of 401 Authentication error after retry."""
-        httpx_mock.add_response(
-            url="https://ngw.devices.sberbank.ru:9443/api/v2/oauth",
-            method="POST",
-            json={"access_token": "token", "expires_at": 9999999999000},
-        )
-
-        # First 401 triggers refresh
+        # First 401 (with the stubbed token) triggers refresh
         httpx_mock.add_response(
             url="https://gigachat.devices.sberbank.ru/api/v1/chat/completions",
             method="POST",
+            match_headers={"Authorization": "Bearer test_token"},
             status_code=401,
             json={"message": "Token expired"},
         )
@@ -301,228 +582,290 @@ class TestGigaChatProviderErrors:
         httpx_mock.add_response(
             url="https://ngw.devices.sberbank.ru:9443/api/v2/oauth",
             method="POST",
-            json={"access_token": "new_token", "expires_at": 9999999999000},
+            json=_oauth_ok("new_token"),
         )
 
-        # Retry also returns 401
+        # Retry with the refreshed token also returns 401
         httpx_mock.add_response(
             url="https://gigachat.devices.sberbank.ru/api/v1/chat/completions",
             method="POST",
+            match_headers={"Authorization": "Bearer new_token"},
             status_code=401,
             json={"message": "Authentication failed"},
         )
 
         config = ProviderConfig(name="gigachat", api_key="test_key")
-        provider = GigaChatProvider(config)
+        provider = GigaChatProvider(config, http_client=http_client)
 
         with pytest.raises(AuthenticationError, match="Authentication failed"):
             await provider.generate("test")
 
     @pytest.mark.asyncio
-    async def test_error_404_invalid_model(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
-        """Test handling of 404 Not Found error."""
-        httpx_mock.add_response(
-            url="https://ngw.devices.sberbank.ru:9443/api/v2/oauth",
-            method="POST",
-            json={"access_token": "token", "expires_at": 9999999999000},
-        )
-
+    async def test_error_502_html_body(
+        self,
+        authed_provider: GigaChatProvider,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test that non-JSON error bodies are used verbatim as the message."""
         httpx_mock.add_response(
             url="https://gigachat.devices.sberbank.ru/api/v1/chat/completions",
             method="POST",
-            status_code=404,
-            json={"message": "Model not found"},
+            status_code=502,
+            headers={"Content-Type": "text/html"},
+            text="<html>Bad Gateway</html>",
         )
 
-        config = ProviderConfig(name="gigachat", api_key="test_key")
-        provider = GigaChatProvider(config)
-
-        with pytest.raises(InvalidRequestError, match="Invalid model"):
-            await provider.generate("test")
+        with pytest.raises(ProviderError, match="Server error: <html>Bad Gateway</html>"):
+            await authed_provider.generate("test")
 
     @pytest.mark.asyncio
-    async def test_error_422_validation(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
-        """Test handling of 422 Validation Error."""
-        httpx_mock.add_response(
-            url="https://ngw.devices.sberbank.ru:9443/api/v2/oauth",
-            method="POST",
-            json={"access_token": "token", "expires_at": 9999999999000},
-        )
-
+    @pytest.mark.parametrize(
+        "headers",
+        [{}, {"Content-Type": "application/problem+json"}],
+        ids=["no-content-type", "problem-json"],
+    )
+    async def test_error_json_body_without_json_content_type(
+        self,
+        authed_provider: GigaChatProvider,
+        httpx_mock: pytest_httpx.HTTPXMock,
+        headers: dict[str, str],
+    ) -> None:
+        """Test that a JSON error message is used whatever the content-type."""
         httpx_mock.add_response(
             url="https://gigachat.devices.sberbank.ru/api/v1/chat/completions",
             method="POST",
-            status_code=422,
-            json={"message": "Validation error"},
+            status_code=400,
+            headers=headers,
+            content=b'{"message": "Invalid model"}',
         )
 
-        config = ProviderConfig(name="gigachat", api_key="test_key")
-        provider = GigaChatProvider(config)
-
-        with pytest.raises(InvalidRequestError, match="Validation error"):
-            await provider.generate("test")
+        with pytest.raises(InvalidRequestError, match="Bad request: Invalid model$"):
+            await authed_provider.generate("test")
 
     @pytest.mark.asyncio
-    async def test_error_429_rate_limit(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
-        """Test handling of 429 Rate Limit error."""
-        httpx_mock.add_response(
-            url="https://ngw.devices.sberbank.ru:9443/api/v2/oauth",
-            method="POST",
-            json={"access_token": "token", "expires_at": 9999999999000},
-        )
-
-        httpx_mock.add_response(
-            url="https://gigachat.devices.sberbank.ru/api/v1/chat/completions",
-            method="POST",
-            status_code=429,
-            json={"message": "Rate limit exceeded"},
-        )
-
-        config = ProviderConfig(name="gigachat", api_key="test_key")
-        provider = GigaChatProvider(config)
-
-        with pytest.raises(RateLimitError, match="Rate limit exceeded"):
-            await provider.generate("test")
-
-    @pytest.mark.asyncio
-    async def test_error_500_server_error(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
-        """Test handling of 500 Server Error."""
-        httpx_mock.add_response(
-            url="https://ngw.devices.sberbank.ru:9443/api/v2/oauth",
-            method="POST",
-            json={"access_token": "token", "expires_at": 9999999999000},
-        )
-
+    async def test_error_unknown_status(
+        self,
+        authed_provider: GigaChatProvider,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test that unmapped status codes raise a generic ProviderError."""
         httpx_mock.add_response(
             url="https://gigachat.devices.sberbank.ru/api/v1/chat/completions",
             method="POST",
-            status_code=500,
-            json={"message": "Internal server error"},
+            status_code=418,
+            json={"message": "I'm a teapot"},
         )
 
-        config = ProviderConfig(name="gigachat", api_key="test_key")
-        provider = GigaChatProvider(config)
-
-        with pytest.raises(ProviderError, match="Server error"):
-            await provider.generate("test")
+        with pytest.raises(ProviderError, match=r"Unknown error \(HTTP 418\): I'm a teapot"):
+            await authed_provider.generate("test")
 
 
 class TestGigaChatProviderNetworkErrors:
     """Test network error handling."""
 
     @pytest.mark.asyncio
-    async def test_timeout_error(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
+    async def test_timeout_error(
+        self,
+        authed_provider: GigaChatProvider,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
         """Test handling of timeout errors."""
-        httpx_mock.add_response(
-            url="https://ngw.devices.sberbank.ru:9443/api/v2/oauth",
-            method="POST",
-            json={"access_token": "token", "expires_at": 9999999999000},
-        )
-
         # Simulate timeout
         httpx_mock.add_exception(
             httpx.TimeoutException("Request timed out"),
             url="https://gigachat.devices.sberbank.ru/api/v1/chat/completions",
         )
 
-        config = ProviderConfig(name="gigachat", api_key="test_key")
-        provider = GigaChatProvider(config)
-
         with pytest.raises(TimeoutError, match="timed out"):
-            await provider.generate("test")
+            await authed_provider.generate("test")
 
     @pytest.mark.asyncio
-    async def test_connection_error(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
+    async def test_connection_error(
+        self,
+        authed_provider: GigaChatProvider,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
         """Test handling of connection errors."""
-        httpx_mock.add_response(
-            url="https://ngw.devices.sberbank.ru:9443/api/v2/oauth",
-            method="POST",
-            json={"access_token": "token", "expires_at": 9999999999000},
-        )
-
         # Simulate connection error
         httpx_mock.add_exception(
             httpx.ConnectError("Connection failed"),
             url="https://gigachat.devices.sberbank.ru/api/v1/chat/completions",
         )
 
-        config = ProviderConfig(name="gigachat", api_key="test_key")
-        provider = GigaChatProvider(config)
-
         with pytest.raises(ProviderError, match="Connection error"):
-            await provider.generate("test")
+            await authed_provider.generate("test")
+
+    @pytest.mark.asyncio
+    async def test_non_json_success_body(
+        self,
+        authed_provider: GigaChatProvider,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test handling of a 200 response whose body is not JSON."""
+        httpx_mock.add_response(
+            url="https://gigachat.devices.sberbank.ru/api/v1/chat/completions",
+            method="POST",
+            text="<html>maintenance</html>",
+        )
+
+        with pytest.raises(ProviderError, match="Invalid response format"):
+            await authed_provider.generate("test")
 
 
 class TestGigaChatProviderHealthCheck:
     """Test health check functionality."""
 
     @pytest.mark.asyncio
-    async def test_health_check_success(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
-        """Test successful health check.
+    @pytest.mark.parametrize(
+        ("status_code", "expected"),
+        [(200, True), (401, False), (500, False)],
+        ids=["ok", "invalid-key", "server-error"],
+    )
+    async def test_health_check_status(
+        self,
+        http_client: httpx.AsyncClient,
+        httpx_mock: pytest_httpx.HTTPXMock,
+        status_code: int,
+        expected: bool,
+    ) -> None:
+        """Test that health_check() reflects whether an OAuth2 token is obtained."""
+        httpx_mock.add_response(
+            url="https://ngw.devices.sberbank.ru:9443/api/v2/oauth",
+            method="POST",
+            status_code=status_code,
+            json=_oauth_ok() if status_code == 200 else {"message": "Error"},
+        )
+
+        config = ProviderConfig(name="gigachat", api_key="test_key")
+        provider = GigaChatProvider(config, http_client=http_client)
+
+        assert await provider.health_check() is expected
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "body",
+        [["x"], {"access_token": "t", "expires_at": "soon"}],
+        ids=["list-body", "string-expires-at"],
+    )
+    async def test_health_check_malformed_token_response(
+        self,
+        http_client: httpx.AsyncClient,
+        httpx_mock: pytest_httpx.HTTPXMock,
+        body: object,
+    ) -> None:
+        """Test that a 200 OAuth2 response of the wrong shape is unhealthy.
 
-        Verifies that health_check() returns True when OAuth2 token can be obtained.
+        Verifies that health_check() returns False instead of raising and
+        that no token is cached.
         """
         httpx_mock.add_response(
             url="https://ngw.devices.sberbank.ru:9443/api/v2/oauth",
             method="POST",
-            json={"access_token": "token", "expires_at": 9999999999000},
+            json=body,
         )
 
         config = ProviderConfig(name="gigachat", api_key="test_key")
+        provider = GigaChatProvider(config, http_client=http_client)
+
+        assert await provider.health_check() is False
+        assert provider._access_token is None
+
+    @pytest.mark.asyncio
+    async def test_health_check_reuses_valid_token(
+        self,
+        authed_provider: GigaChatProvider,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test that health_check() makes no OAuth2 request while the token is valid."""
+        assert await authed_provider.health_check() is True
+        assert await authed_provider.health_check() is True
+        assert httpx_mock.get_requests() == []
+
+    @pytest.mark.asyncio
+    async def test_health_check_restores_timeout(
+        self, httpx_mock: pytest_httpx.HTTPXMock
+    ) -> None:
+        """Test that health_check() restores the client timeout after failing."""
+        httpx_mock.add_exception(
+            httpx.ConnectError("Connection failed"),
+            url="https://ngw.devices.sberbank.ru:9443/api/v2/oauth",
+        )
+
+        config = ProviderConfig(name="gigachat", api_key="test_key", timeout=60)
         provider = GigaChatProvider(config)
 
-        is_healthy = await provider.health_check()
-        assert is_healthy is True
+        assert await provider.health_check() is False
+        assert provider._client.timeout == httpx.Timeout(60)
 
     @pytest.mark.asyncio
-    async def test_health_check_failure(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
-        """Test failed health check.
+    async def test_health_check_uses_short_timeout_on_shared_client(
+        self,
+        http_client: httpx.AsyncClient,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test that health_check() sets its timeout per request.
 
-        Verifies that health_check() returns False when OAuth2 fails.
+        Verifies that a shared client's timeout is never modified.
         """
         httpx_mock.add_response(
             url="https://ngw.devices.sberbank.ru:9443/api/v2/oauth",
             method="POST",
-            status_code=401,
-            json={"message": "Invalid key"},
+            content=OAUTH_OK_BYTES,
+            headers=JSON_HEADERS,
         )
+        client_timeout = http_client.timeout
 
-        config = ProviderConfig(name="gigachat", api_key="invalid_key")
-        provider = GigaChatProvider(config)
+        config = ProviderConfig(name="gigachat", api_key="test_key", timeout=60)
+        provider = GigaChatProvider(config, http_client=http_client)
 
-        is_healthy = await provider.health_check()
-        assert is_healthy is False
+        assert await provider.health_check() is True
+        request = httpx_mock.get_request()
+        assert request is not None
+        assert request.extensions["timeout"] == httpx.Timeout(5.0).as_dict()
+        assert http_client.timeout == client_timeout
 
 
 class TestGigaChatProviderConfig:
     """Test configuration handling."""
 
-    def test_missing_api_key_raises_error(self) -> None:
+    def test_missing_api_key_raises_error(self, http_client: httpx.AsyncClient) -> None:
         """Test that missing api_key raises ValueError."""
         config = ProviderConfig(name="gigachat", api_key=None)
 
         with pytest.raises(ValueError, match="api_key is required"):
-            GigaChatProvider(config)
+            GigaChatProvider(config, http_client=http_client)
 
-    def test_custom_scope(self) -> None:
+    def test_custom_scope(self, http_client: httpx.AsyncClient) -> None:
         """Test that custom scope is used."""
         config = ProviderConfig(
             name="gigachat", api_key="test_key", scope="GIGACHAT_API_CORP"
         )
-        provider = GigaChatProvider(config)
+        provider = GigaChatProvider(config, http_client=http_client)
 
         # Scope is stored in config, will be used in OAuth2 request
         assert provider.config.scope == "GIGACHAT_API_CORP"
 
-    def test_default_scope(self) -> None:
+    def test_default_scope(self, http_client: httpx.AsyncClient) -> None:
         """Test that default scope is used when not specified."""
         config = ProviderConfig(name="gigachat", api_key="test_key")
-        provider = GigaChatProvider(config)
+        provider = GigaChatProvider(config, http_client=http_client)
 
         # Should use DEFAULT_SCOPE when config.scope is None
         assert provider.config.scope is None
         assert provider.DEFAULT_SCOPE == "GIGACHAT_API_PERS"
 
+    def test_providers_share_http_client(self, http_client: httpx.AsyncClient) -> None:
+        """Test that providers given the same http_client share it."""
+        provider1 = GigaChatProvider(
+            ProviderConfig(name="gigachat-1", api_key="key_1"), http_client=http_client
+        )
+        provider2 = GigaChatProvider(
+            ProviderConfig(name="gigachat-2", api_key="key_2"), http_client=http_client
+        )
+
+        assert provider1._client is http_client
+        assert provider2._client is http_client
+
     def test_gigachat_provider_with_verify_ssl_true(self) -> None:
         """Test GigaChatProvider with SSL verification enabled (default)."""
         config = ProviderConfig(
@@ -551,7 +894,9 @@ class TestGigaChatProviderStreaming:
 
     @pytest.mark.asyncio
     async def test_gigachat_streaming_normal_flow(
-        self, httpx_mock: pytest_httpx.HTTPXMock
+        self,
+        http_client: httpx.AsyncClient,
+        httpx_mock: pytest_httpx.HTTPXMock,
     ) -> None:
         """Test normal streaming flow with SSE format.
 
@@ -562,7 +907,8 @@ class TestGigaChatProviderStreaming:
         httpx_mock.add_response(
             url="https://ngw.devices.sberbank.ru:9443/api/v2/oauth",
             method="POST",
-            json={"access_token": "test_token", "expires_at": 9999999999000},
+            content=OAUTH_OK_BYTES,
+            headers=JSON_HEADERS,
         )
 
         # Mock SSE streaming response
@@ -602,12 +948,10 @@ class TestGigaChatProviderStreaming:
         )
 
         config = ProviderConfig(name="gigachat", api_key="test_key")
-        provider = GigaChatProvider(config)
+        provider = GigaChatProvider(config, http_client=http_client)
 
         # Stream and collect chunks
-        chunks = []
-        async for chunk in provider.generate_stream("Hello"):
-            chunks.append(chunk)
+        chunks = [chunk async for chunk in provider.generate_stream("Hello")]
 
         # Verify chunks were received
         assert len(chunks) == 3
@@ -615,7 +959,9 @@ class TestGigaChatProviderStreaming:
 
     @pytest.mark.asyncio
     async def test_gigachat_streaming_401_retry(
-        self, httpx_mock: pytest_httpx.HTTPXMock
+        self,
+        http_client: httpx.AsyncClient,
+        httpx_mock: pytest_httpx.HTTPXMock,
     ) -> None:
         """Test that 401 before streaming starts triggers retry.
 
@@ -626,7 +972,7 @@ class TestGigaChatProviderStreaming:
         httpx_mock.add_response(
             url="https://ngw.devices.sberbank.ru:9443/api/v2/oauth",
             method="POST",
-            json={"access_token": "token1", "expires_at": 9999999999000},
+            json=_oauth_ok("token1"),
         )
 
         # First request returns 401 (token expired)
@@ -641,7 +987,7 @@ class TestGigaChatProviderStreaming:
         httpx_mock.add_response(
             url="https://ngw.devices.sberbank.ru:9443/api/v2/oauth",
             method="POST",
-            json={"access_token": "token2", "expires_at": 9999999999000},
+            json=_oauth_ok("token2"),
         )
 
         # Retry request succeeds with streaming
@@ -660,29 +1006,63 @@ class TestGigaChatProviderStreaming:
         )
 
         config = ProviderConfig(name="gigachat", api_key="test_key")
-        provider = GigaChatProvider(config)
+        provider = GigaChatProvider(config, http_client=http_client)
 
         # Stream should succeed after retry
-        chunks = []
-        async for chunk in provider.generate_stream("test"):
-            chunks.append(chunk)
+        chunks = [chunk async for chunk in provider.generate_stream("test")]
 
         assert "".join(chunks) == "Retry success"
 
     @pytest.mark.asyncio
+    async def test_gigachat_streaming_error_status(
+        self,
+        http_client: httpx.AsyncClient,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test that an error status before streaming maps to a typed exception."""
+        httpx_mock.add_response(
+            url="https://ngw.devices.sberbank.ru:9443/api/v2/oauth",
+            method="POST",
+            json=_oauth_ok("token"),
+        )
+        httpx_mock.add_response(
+            url="https://gigachat.devices.sberbank.ru/api/v1/chat/completions",
+            method="POST",
+            status_code=429,
+            json={"message": "Too many requests"},
+        )
+
+        config = ProviderConfig(name="gigachat", api_key="test_key")
+        provider = GigaChatProvider(config, http_client=http_client)
+
+        with pytest.raises(RateLimitError, match="Too many requests"):
+            async for _ in provider.generate_stream("test"):
+                pass
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib-json"])
     async def test_gigachat_streaming_parse_error_handling(
-        self, httpx_mock: pytest_httpx.HTTPXMock
+        self,
+        http_client: httpx.AsyncClient,
+        httpx_mock: pytest_httpx.HTTPXMock,
+        monkeypatch: pytest.MonkeyPatch,
+        use_orjson: bool,
     ) -> None:
         """Test that malformed SSE chunks are handled gracefully.
 
         Verifies that if a chunk cannot be parsed (invalid JSON or missing structure),
-        it logs a warning and continues processing the next chunk.
+        it logs a warning and continues processing the next chunk, with and
+        without the optional orjson decoder.
         """
+        if not use_orjson:
+            monkeypatch.setattr(gigachat_module, "orjson", None)
+
         # Mock OAuth2 endpoint
         httpx_mock.add_response(
             url="https://ngw.devices.sberbank.ru:9443/api/v2/oauth",
             method="POST",
-            json={"access_token": "test_token", "expires_at": 9999999999000},
+            content=OAUTH_OK_BYTES,
+            headers=JSON_HEADERS,
         )
 
         # SSE stream with one malformed chunk
@@ -702,20 +1082,39 @@ class TestGigaChatProviderStreaming:
         )
 
         config = ProviderConfig(name="gigachat", api_key="test_key")
-        provider = GigaChatProvider(config)
+        provider = GigaChatProvider(config, http_client=http_client)
 
         # Stream should skip malformed chunk and continue
-        chunks = []
-        async for chunk in provider.generate_stream("test"):
-            chunks.append(chunk)
+        chunks = [chunk async for chunk in provider.generate_stream("test")]
 
         # Should have received valid chunks (Hello and world)
         assert len(chunks) == 2
         assert "".join(chunks) == "Hello world"
 
+    @pytest.mark.asyncio
+    async def test_gigachat_streaming_non_object_chunk(
+        self,
+        authed_provider: GigaChatProvider,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test that a JSON chunk that is not an object raises ProviderError."""
+        content = 'data: ["x"]\ndata: [DONE]\n'
+        httpx_mock.add_response(
+            url="https://gigachat.devices.sberbank.ru/api/v1/chat/completions",
+            method="POST",
+            headers={"Content-Type": "text/event-stream"},
+            content=content.encode(),
+        )
+
+        with pytest.raises(ProviderError, match="Invalid response format"):
+            async for _ in authed_provider.generate_stream("test"):
+                pass
+
     @pytest.mark.asyncio
     async def test_gigachat_streaming_empty_content_chunks(
-        self, httpx_mock: pytest_httpx.HTTPXMock
+        self,
+        http_client: httpx.AsyncClient,
+        httpx_mock: pytest_httpx.HTTPXMock,
     ) -> None:
         """Test that chunks with empty content are skipped.
 
@@ -725,7 +1124,8 @@ class TestGigaChatProviderStreaming:
         httpx_mock.add_response(
             url="https://ngw.devices.sberbank.ru:9443/api/v2/oauth",
             method="POST",
-            json={"access_token": "test_token", "expires_at": 9999999999000},
+            content=OAUTH_OK_BYTES,
+            headers=JSON_HEADERS,
         )
 
         # SSE stream with empty content chunks
@@ -745,12 +1145,10 @@ class TestGigaChatProviderStreaming:
         )
 
         config = ProviderConfig(name="gigachat", api_key="test_key")
-        provider = GigaChatProvider(config)
+        provider = GigaChatProvider(config, http_client=http_client)
 
         # Stream should skip empty chunks
-        chunks = []
-        async for chunk in provider.generate_stream("test"):
-            chunks.append(chunk)
+        chunks = [chunk async for chunk in provider.generate_stream("test")]
 
         # Should only have non-empty chunks
         assert len(chunks) == 2
@@ -4,6 +4,9 @@ This module contains end-to-end integration tests that verify
 Router and MockProvider work together correctly in realistic scenarios.
 """
 
+import asyncio
+from collections.abc import Callable
+
 import pytest
 
 from orchestrator import Router
@@ -12,51 +15,72 @@ from orchestrator.providers.mock import MockProvider
 from orchestrator.providers.base import ProviderConfig
 
 
+@pytest.fixture
+def all_timeout_router(make_config: Callable[..., ProviderConfig]) -> Router:
+    """Create a round-robin Router whose 3 providers all time out.
+
+    Function-scoped: each route() advances the round-robin cursor and
+    records metrics and circuit-breaker state, so every test gets a fresh
+    router.
+    """
+    router = Router(strategy="round-robin")
+    for i in range(3):
+        router.add_provider(MockProvider(make_config(name=f"p{i+1}", model="mock-timeout")))
+    return router
+
+
 class TestIntegrationHappyPath:
     """Test happy path scenarios with Router and MockProvider."""
 
     @pytest.mark.asyncio
-    async def test_integration_happy_path(self) -> None:
+    async def test_integration_happy_path(
+        self,
+        router_round_robin: Router,
+        make_config: Callable[..., ProviderConfig],
+    ) -> None:
         """Test happy path: Router with 3 normal providers, 5 successful requests.
         
         Verifies that Router correctly routes requests to MockProvider instances
         and all requests complete successfully in a normal operation scenario.
         """
-        router = Router(strategy="round-robin")
+        router = router_round_robin
         
         # Add 3 normal providers
         for i in range(3):
-            config = ProviderConfig(name=f"provider-{i+1}", model="mock-normal")
-            router.add_provider(MockProvider(config))
+            router.add_provider(MockProvider(make_config(name=f"provider-{i+1}", model="mock-normal")))
+        
+        # Make 5 concurrent requests - all should succeed
+        responses = await asyncio.gather(
+            *(router.route(f"Request {i+1}") for i in range(5))
+        )
         
-        # Make 5 requests - all should succeed
-        responses = []
-        for i in range(5):
-            response = await router.route(f"Request {i+1}")
-            responses.append(response)
+        # Verify all responses are valid (gather preserves input order)
+        assert responses == [f"Mock response to: Request {i+1}" for i in range(5)]
         
-        # Verify all responses are valid
-        assert len(responses) == 5
-        assert all(r.startswith("Mock response to:") for r in responses)
-        assert all("Request" in r for i, r in enumerate(responses))
+        # Round-robin spreads the requests over all providers
+        assert [router.metrics[f"provider-{i+1}"].total_requests for i in range(3)] == [2, 2, 1]
 
 
 class TestIntegrationFallback:
     """Test fallback scenarios with Router and MockProvider."""
 
     @pytest.mark.asyncio
-    async def test_integration_fallback_scenario(self) -> None:
+    async def test_integration_fallback_scenario(
+        self,
+        router_round_robin: Router,
+        make_config: Callable[..., ProviderConfig],
+    ) -> None:
         """Test fallback: Router with [timeout, normal, normal], fallback to second.
         
         Verifies that Router correctly handles fallback when the first provider
         fails (timeout) and automatically switches to the next available provider.
         """
-        router = Router(strategy="round-robin")
+        router = router_round_robin
         
         # Add: timeout, normal, normal
-        router.add_provider(MockProvider(ProviderConfig(name="p1", model="mock-timeout")))
-        router.add_provider(MockProvider(ProviderConfig(name="p2", model="mock-normal")))
-        router.add_provider(MockProvider(ProviderConfig(name="p3", model="mock-normal")))
+        router.add_provider(MockProvider(make_config(name="p1", model="mock-timeout")))
+        router.add_provider(MockProvider(make_config(name="p2", model="mock-normal")))
+        router.add_provider(MockProvider(make_config(name="p3", model="mock-normal")))
         
         # Make 1 request - should fallback from p1 (timeout) to p2 (success)
         response = await router.route("test prompt")
@@ -70,21 +94,12 @@ class TestIntegrationAllFailed:
     """Test error handling when all providers fail."""
 
     @pytest.mark.asyncio
-    async def test_integration_all_failed(self) -> None:
+    async def test_integration_all_failed(self, all_timeout_router: Router) -> None:
         """Test error handling: Router with [timeout, timeout, timeout], raises error.
         
         Verifies that Router correctly handles the scenario when all providers fail
         and raises the last exception encountered (TimeoutError).
         """
-        router = Router(strategy="round-robin")
-        
-        # Add 3 timeout providers (all will fail)
-        for i in range(3):
-            router.add_provider(
-                MockProvider(ProviderConfig(name=f"p{i+1}", model="mock-timeout"))
-            )
-        
         # Should raise TimeoutError (last error from all failed providers)
         with pytest.raises(TimeoutError, match="Mock timeout simulation"):
-            await router.route("test prompt")
-
+            await all_timeout_router.route("test prompt")
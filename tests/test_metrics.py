@@ -8,13 +8,20 @@ This module tests ProviderMetrics functionality including:
 - Error timestamp cleanup
 """
 
+import math
+from collections.abc import Sequence
+
 import pytest
-from datetime import datetime, timedelta, timezone
+from datetime import UTC, datetime, timedelta
 
 from orchestrator.metrics import (
     ERROR_RATE_THRESHOLD_DEGRADED,
     ERROR_RATE_THRESHOLD_UNHEALTHY,
+    EWMA_ALPHA,
+    EWMA_ERROR_PENALTY_FACTOR,
+    EWMA_MAX_LATENCY_MS,
     LATENCY_THRESHOLD_FACTOR_DEGRADED,
+    LATENCY_WINDOW_SIZE,
     MIN_REQUESTS_FOR_HEALTH,
     MIN_REQUESTS_FOR_LATENCY_CHECK,
     ProviderMetrics,
@@ -72,13 +79,85 @@ class TestProviderMetricsRecordSuccess:
         assert metrics._latency_window[-1] == 149.0
 
 
+class TestProviderMetricsSlots:
+    """Test the fixed attribute layout of ProviderMetrics."""
+
+    def test_no_instance_dict(self) -> None:
+        """Test that ad-hoc attributes are rejected."""
+        metrics = ProviderMetrics()
+
+        assert not hasattr(metrics, "__dict__")
+        with pytest.raises(AttributeError):
+            metrics.unknown_attribute = 1  # type: ignore[attr-defined]
+
+
+class TestProviderMetricsRecordSuccessBatch:
+    """Test record_success_batch() method."""
+
+    def test_batch_matches_individual_records(self) -> None:
+        """Test that a batch gives the same metrics as per-request records."""
+        latencies = [float(100 + i % 37) for i in range(LATENCY_WINDOW_SIZE + 20)]
+        prompt_tokens = [10] * len(latencies)
+        completion_tokens = [5] * len(latencies)
+        costs = [0.01] * len(latencies)
+
+        single = ProviderMetrics()
+        for latency, prompt, completion, cost in zip(
+            latencies, prompt_tokens, completion_tokens, costs, strict=True
+        ):
+            single.record_success(latency, prompt, completion, cost)
+
+        batch = ProviderMetrics()
+        batch.record_success_batch(latencies, prompt_tokens, completion_tokens, costs)
+
+        assert batch.total_requests == single.total_requests
+        assert batch.successful_requests == single.successful_requests
+        assert batch.total_latency_ms == pytest.approx(single.total_latency_ms)
+        assert list(batch._latency_window) == list(single._latency_window)
+        assert batch.rolling_avg_latency_ms == pytest.approx(single.rolling_avg_latency_ms)
+        assert batch.ewma_latency_ms == pytest.approx(single.ewma_latency_ms)
+        assert batch.total_prompt_tokens == single.total_prompt_tokens
+        assert batch.total_completion_tokens == single.total_completion_tokens
+        assert batch.total_cost == pytest.approx(single.total_cost)
+
+    def test_batch_accepts_unsliceable_sequence(self) -> None:
+        """Test that a Sequence without slice support is recorded correctly."""
+
+        class IndexOnly(Sequence[float]):
+            def __init__(self, values: list[float]) -> None:
+                self._values = values
+
+            def __len__(self) -> int:
+                return len(self._values)
+
+            def __getitem__(self, index: int) -> float:  # type: ignore[override]
+                if not isinstance(index, int):
+                    raise TypeError("slicing not supported")
+                return self._values[index]
+
+        latencies = [float(i) for i in range(LATENCY_WINDOW_SIZE + 5)]
+        metrics = ProviderMetrics()
+        metrics.record_success_batch(IndexOnly(latencies))
+
+        assert metrics.total_requests == len(latencies)
+        assert list(metrics._latency_window) == latencies[-LATENCY_WINDOW_SIZE:]
+
+    def test_batch_empty_is_noop(self) -> None:
+        """Test that an empty batch leaves metrics unchanged."""
+        metrics = ProviderMetrics()
+        metrics.record_success_batch([])
+
+        assert metrics.total_requests == 0
+        assert metrics.ewma_latency_ms is None
+
+
 class TestProviderMetricsRecordError:
     """Test record_error() method."""
 
     def test_record_error(self) -> None:
         """Test that record_error() updates counters and adds timestamp."""
         metrics = ProviderMetrics()
-        now = datetime.now(timezone.utc)
+        now = datetime.now(UTC)
 
         metrics.record_error(50.0, now)
         assert metrics.total_requests == 1
@@ -86,12 +165,12 @@ class TestProviderMetricsRecordError:
         assert metrics.failed_requests == 1
         assert metrics.total_latency_ms == 0.0  # Not updated for errors
         assert len(metrics._error_timestamps) == 1
-        assert metrics._error_timestamps[0] == now
+        assert metrics._error_timestamps[0] == now.timestamp()
 
     def test_record_error_cleanup_old_timestamps(self) -> None:
         """Test that record_error() cleans up old error timestamps."""
         metrics = ProviderMetrics()
-        now = datetime.now(timezone.utc)
+        now = datetime.now(UTC)
 
         # Add old error (more than 60 seconds ago)
         old_timestamp = now - timedelta(seconds=70)
@@ -103,7 +182,21 @@ class TestProviderMetricsRecordError:
 
         # Old error should be cleaned up
         assert len(metrics._error_timestamps) == 1
-        assert metrics._error_timestamps[0] == recent_timestamp
+        assert metrics._error_timestamps[0] == recent_timestamp.timestamp()
+
+    def test_record_error_default_timestamp(self) -> None:
+        """Test that record_error() without a timestamp uses the current time."""
+        metrics = ProviderMetrics()
+        old_timestamp = datetime.now(UTC) - timedelta(seconds=70)
+        metrics.record_error(50.0, old_timestamp)
+
+        before = datetime.now(UTC).timestamp()
+        metrics.record_error(50.0)
+        after = datetime.now(UTC).timestamp()
+
+        # The explicit old error is pruned against the default "now"
+        assert len(metrics._error_timestamps) == 1
+        assert before <= metrics._error_timestamps[0] <= after
 
 
 class TestProviderMetricsComputedProperties:
@@ -122,7 +215,7 @@ class TestProviderMetricsComputedProperties:
         assert metrics.success_rate == 1.0
 
         # Mixed
-        metrics.record_error(50.0, datetime.now(timezone.utc))
+        metrics.record_error(50.0, datetime.now(UTC))
         assert metrics.success_rate == pytest.approx(2.0 / 3.0)
 
     def test_avg_latency_ms(self) -> None:
@@ -138,7 +231,7 @@ class TestProviderMetricsComputedProperties:
         assert metrics.avg_latency_ms == 150.0
 
         # Errors don't affect avg_latency_ms
-        metrics.record_error(50.0, datetime.now(timezone.utc))
+        metrics.record_error(50.0, datetime.now(UTC))
         assert metrics.avg_latency_ms == 150.0  # Still 150.0
 
     def test_rolling_avg_latency_ms(self) -> None:
@@ -157,6 +250,16 @@ class TestProviderMetricsComputedProperties:
         metrics.record_success(300.0)
         assert metrics.rolling_avg_latency_ms == 200.0  # (100+200+300)/3
 
+    def test_rolling_avg_latency_ms_after_eviction(self) -> None:
+        """Test that the rolling average only covers the last window of samples."""
+        metrics = ProviderMetrics()
+
+        for i in range(LATENCY_WINDOW_SIZE + 50):
+            metrics.record_success(float(i))
+
+        expected = sum(range(50, LATENCY_WINDOW_SIZE + 50)) / LATENCY_WINDOW_SIZE
+        assert metrics.rolling_avg_latency_ms == pytest.approx(expected)
+
     def test_recent_error_rate(self) -> None:
         """Test recent_error_rate calculation (simplified formula)."""
         metrics = ProviderMetrics()
@@ -170,16 +273,78 @@ class TestProviderMetricsComputedProperties:
         assert metrics.recent_error_rate == 0.0
 
         # With errors
-        now = datetime.now(timezone.utc)
+        now = datetime.now(UTC)
         metrics.record_error(50.0, now)
         metrics.record_error(50.0, now)
         # 2 errors out of 4 total requests
         assert metrics.recent_error_rate == pytest.approx(0.5)
 
 
+    def test_ewma_latency_ms(self) -> None:
+        """Test that ewma_latency_ms smooths successes and jumps on errors."""
+        metrics = ProviderMetrics()
+        assert metrics.ewma_latency_ms is None
+
+        metrics.record_success(100.0)
+        assert metrics.ewma_latency_ms == 100.0
+
+        metrics.record_success(200.0)
+        expected = EWMA_ALPHA * 200.0 + (1 - EWMA_ALPHA) * 100.0
+        assert metrics.ewma_latency_ms == pytest.approx(expected)
+
+        metrics.record_error(5000.0, datetime.now(UTC))
+        assert metrics.ewma_latency_ms == pytest.approx(
+            EWMA_ERROR_PENALTY_FACTOR * 5000.0
+        )
+
+    def test_ewma_error_penalty_does_not_compound(self) -> None:
+        """Test that consecutive errors keep the EWMA finite and recoverable."""
+        metrics = ProviderMetrics()
+        now = datetime.now(UTC)
+
+        for _ in range(2000):
+            metrics.record_error(1000.0, now)
+        assert metrics.ewma_latency_ms == pytest.approx(
+            EWMA_ERROR_PENALTY_FACTOR * 1000.0
+        )
+
+        for _ in range(100):
+            metrics.record_success(100.0)
+        assert metrics.ewma_latency_ms is not None
+        assert math.isfinite(metrics.ewma_latency_ms)
+        assert metrics.ewma_latency_ms == pytest.approx(100.0, rel=0.01)
+
+    def test_ewma_error_penalty_is_clamped(self) -> None:
+        """Test that a huge failed latency cannot push the EWMA past the cap."""
+        metrics = ProviderMetrics()
+
+        metrics.record_error(1e12, datetime.now(UTC))
+
+        assert metrics.ewma_latency_ms == EWMA_MAX_LATENCY_MS
+
+
 class TestProviderMetricsHealthStatus:
     """Test health_status property."""
 
+    def test_health_status_cache_invalidated_by_records(
+        self, primed_metrics: ProviderMetrics
+    ) -> None:
+        """Test that a cached health_status is refreshed after new records."""
+        metrics = primed_metrics
+        now = datetime.now(UTC)
+
+        assert metrics.health_status == "healthy"
+        assert metrics.health_status == "healthy"
+
+        for _ in range(2 * MIN_REQUESTS_FOR_HEALTH):
+            metrics.record_error(50.0, now)
+
+        assert metrics.health_status == "unhealthy"
+
+        metrics.record_success_batch([100.0] * 10 * MIN_REQUESTS_FOR_HEALTH)
+
+        assert metrics.health_status == "healthy"
+
     def test_health_status_insufficient_data(self) -> None:
         """Test that health_status returns 'healthy' when insufficient data."""
         metrics = ProviderMetrics()
@@ -190,14 +355,12 @@ class TestProviderMetricsHealthStatus:
 
         assert metrics.health_status == "healthy"
 
-    def test_health_status_unhealthy_by_error_rate(self) -> None:
+    def test_health_status_unhealthy_by_error_rate(
+        self, primed_metrics: ProviderMetrics
+    ) -> None:
         """Test that health_status returns 'unhealthy' for high error rate."""
-        metrics = ProviderMetrics()
-        now = datetime.now(timezone.utc)
-
-        # Create enough requests
-        for _ in range(MIN_REQUESTS_FOR_HEALTH):
-            metrics.record_success(100.0)
+        metrics = primed_metrics
+        now = datetime.now(UTC)
 
         # Add enough errors to exceed UNHEALTHY threshold
         # recent_error_rate = len(_error_timestamps) / total_requests
@@ -221,14 +384,12 @@ class TestProviderMetricsHealthStatus:
         assert error_rate >= ERROR_RATE_THRESHOLD_UNHEALTHY, f"Error rate {error_rate} should be >= {ERROR_RATE_THRESHOLD_UNHEALTHY}"
         assert metrics.health_status == "unhealthy"
 
-    def test_health_status_degraded_by_error_rate(self) -> None:
+    def test_health_status_degraded_by_error_rate(
+        self, primed_metrics: ProviderMetrics
+    ) -> None:
         """Test that health_status returns 'degraded' for medium error rate."""
-        metrics = ProviderMetrics()
-        now = datetime.now(timezone.utc)
-
-        # Create enough requests
-        for _ in range(MIN_REQUESTS_FOR_HEALTH):
-            metrics.record_success(100.0)
+        metrics = primed_metrics
+        now = datetime.now(UTC)
 
         # Add errors to exceed DEGRADED threshold but not UNHEALTHY
         # We want: 0.3 <= error_rate < 0.6
@@ -298,18 +459,14 @@ class TestProviderMetricsHealthStatus:
         assert metrics.rolling_avg_latency_ms > LATENCY_THRESHOLD_FACTOR_DEGRADED * metrics.avg_latency_ms
         assert metrics.health_status == "degraded"
 
-    def test_health_status_healthy(self) -> None:
+    def test_health_status_healthy(self, primed_metrics: ProviderMetrics) -> None:
         """Test that health_status returns 'healthy' in normal conditions."""
-        metrics = ProviderMetrics()
-
-        # Create enough requests with normal latency and no errors
-        for _ in range(MIN_REQUESTS_FOR_HEALTH):
-            metrics.record_success(100.0)
+        metrics = primed_metrics
 
         assert metrics.health_status == "healthy"
 
         # Add a few errors but below threshold
-        now = datetime.now(timezone.utc)
+        now = datetime.now(UTC)
         for _ in range(2):  # Less than threshold
             metrics.record_error(50.0, now)
 
@@ -367,10 +524,20 @@ class TestProviderMetricsTokenTracking:
         assert metrics.total_tokens == 70
         assert metrics.total_cost == pytest.approx(0.13)
 
+    def test_total_cost_compensated_summation(self) -> None:
+        """Test that many small costs accumulate without float drift."""
+        metrics = ProviderMetrics()
+        costs = [0.1] * 10_000
+
+        for cost in costs:
+            metrics.record_success(100.0, cost=cost)
+
+        assert metrics.total_cost == math.fsum(costs)
+
     def test_record_error_does_not_affect_tokens(self) -> None:
         """Test that failed requests do not affect token counts."""
         metrics = ProviderMetrics()
-        now = datetime.now(timezone.utc)
+        now = datetime.now(UTC)
 
         # Successful request with tokens
         metrics.record_success(100.0, prompt_tokens=50, completion_tokens=30, cost=0.16)
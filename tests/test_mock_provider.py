@@ -1,17 +1,21 @@
 """Unit tests for MockProvider.
 
 This module tests all MockProvider functionality including:
-- All 5 simulation modes (normal, timeout, ratelimit, auth-error, invalid-request)
+- All 6 simulation modes (normal, instant, timeout, ratelimit, auth-error,
+  invalid-request)
 - Health check behavior (healthy vs unhealthy)
 - Response truncation based on max_tokens
 - Response delay in normal mode
 """
 
-import time
+import asyncio
+from collections.abc import Callable
+from types import SimpleNamespace
 
 import pytest
 
 from orchestrator.providers.base import GenerationParams, ProviderConfig
+from orchestrator.providers import mock as mock_module
 from orchestrator.providers.mock import MockProvider
 from orchestrator.providers.base import (
     AuthenticationError,
@@ -20,76 +24,73 @@ from orchestrator.providers.base import (
     TimeoutError,
 )
 
+# Deterministic mock-normal response to the prompt "test"
+FULL_TEST_RESPONSE = "Mock response to: test"
+
+# (model, error, match) for the modes whose generate() always raises
+ERROR_MODE_CASES = [
+    pytest.param("mock-timeout", TimeoutError, "Mock timeout simulation", id="timeout"),
+    pytest.param(
+        "mock-ratelimit", RateLimitError, "Mock rate limit simulation", id="ratelimit"
+    ),
+    pytest.param(
+        "mock-auth-error", AuthenticationError, "Mock authentication failure", id="auth"
+    ),
+    pytest.param(
+        "mock-invalid-request", InvalidRequestError, "Mock invalid request", id="invalid"
+    ),
+]
+
+# (model, expected health_check() result)
+HEALTH_CHECK_CASES = [
+    pytest.param("mock-normal", True, id="normal"),
+    # Healthy but will fail on generate
+    pytest.param("mock-timeout", True, id="timeout"),
+    # None model defaults to mock-normal
+    pytest.param(None, True, id="default-model"),
+    pytest.param("mock-unhealthy", False, id="unhealthy"),
+    # Partial match (contains "unhealthy")
+    pytest.param("mock-normal-unhealthy", False, id="partial-match"),
+    pytest.param("mock-UNHEALTHY", False, id="case-insensitive"),
+]
+
 
 class TestMockProviderModes:
     """Test all MockProvider simulation modes."""
 
     @pytest.mark.asyncio
-    async def test_mock_normal_mode_returns_response(self) -> None:
+    async def test_mock_normal_mode_returns_response(
+        self, mock_provider_normal: MockProvider
+    ) -> None:
         """Test that mock-normal mode returns a valid response.
         
         Verifies that normal mode generates a response with the expected format
         and includes the prompt in the response.
         """
-        config = ProviderConfig(name="test", model="mock-normal")
-        provider = MockProvider(config)
-        
-        response = await provider.generate("Hello, world!")
+        response = await mock_provider_normal.generate("Hello, world!")
         
         assert response == "Mock response to: Hello, world!"
         assert isinstance(response, str)
         assert len(response) > 0
 
     @pytest.mark.asyncio
-    async def test_mock_timeout_mode_raises_timeout_error(self) -> None:
-        """Test that mock-timeout mode raises TimeoutError.
-        
-        Verifies that timeout simulation mode correctly raises TimeoutError
-        when generate() is called.
+    @pytest.mark.parametrize(("model", "error", "match"), ERROR_MODE_CASES)
+    async def test_mock_error_mode_raises(
+        self,
+        make_config: Callable[..., ProviderConfig],
+        model: str,
+        error: type[Exception],
+        match: str,
+    ) -> None:
+        """Test that each error simulation mode raises its exception.
+        
+        Verifies that timeout, ratelimit, auth-error and invalid-request
+        modes raise the matching ProviderError subclass when generate()
+        is called.
         """
-        config = ProviderConfig(name="test", model="mock-timeout")
-        provider = MockProvider(config)
+        provider = MockProvider(make_config(name="test", model=model))
         
-        with pytest.raises(TimeoutError, match="Mock timeout simulation"):
-            await provider.generate("test prompt")
-
-    @pytest.mark.asyncio
-    async def test_mock_ratelimit_mode_raises_ratelimit_error(self) -> None:
-        """Test that mock-ratelimit mode raises RateLimitError.
-        
-        Verifies that rate limit simulation mode correctly raises RateLimitError
-        when generate() is called.
-        """
-        config = ProviderConfig(name="test", model="mock-ratelimit")
-        provider = MockProvider(config)
-        
-        with pytest.raises(RateLimitError, match="Mock rate limit simulation"):
-            await provider.generate("test prompt")
-
-    @pytest.mark.asyncio
-    async def test_mock_auth_error_mode_raises_auth_error(self) -> None:
-        """Test that mock-auth-error mode raises AuthenticationError.
-        
-        Verifies that authentication error simulation mode correctly raises
-        AuthenticationError when generate() is called.
-        """
-        config = ProviderConfig(name="test", model="mock-auth-error")
-        provider = MockProvider(config)
-        
-        with pytest.raises(AuthenticationError, match="Mock authentication failure"):
-            await provider.generate("test prompt")
-
-    @pytest.mark.asyncio
-    async def test_mock_invalid_request_mode_raises_invalid_request_error(self) -> None:
-        """Test that mock-invalid-request mode raises InvalidRequestError.
-        
-        Verifies that invalid request simulation mode correctly raises
-        InvalidRequestError when generate() is called.
-        """
-        config = ProviderConfig(name="test", model="mock-invalid-request")
-        provider = MockProvider(config)
-        
-        with pytest.raises(InvalidRequestError, match="Mock invalid request"):
+        with pytest.raises(error, match=match):
             await provider.generate("test prompt")
 
 
@@ -97,62 +98,36 @@ class TestMockProviderHealthCheck:
     """Test MockProvider health_check() behavior."""
 
     @pytest.mark.asyncio
-    async def test_health_check_returns_true_for_healthy(self) -> None:
-        """Test that health_check() returns True for healthy providers.
-        
-        Verifies that providers without "unhealthy" in their model name
-        return True from health_check().
-        """
-        # Test normal mode
-        config_normal = ProviderConfig(name="test", model="mock-normal")
-        provider_normal = MockProvider(config_normal)
-        assert await provider_normal.health_check() is True
-        
-        # Test timeout mode (healthy but will fail on generate)
-        config_timeout = ProviderConfig(name="test", model="mock-timeout")
-        provider_timeout = MockProvider(config_timeout)
-        assert await provider_timeout.health_check() is True
-        
-        # Test with None model (defaults to mock-normal)
-        config_none = ProviderConfig(name="test", model=None)
-        provider_none = MockProvider(config_none)
-        assert await provider_none.health_check() is True
-
-    @pytest.mark.asyncio
-    async def test_health_check_returns_false_for_unhealthy(self) -> None:
-        """Test that health_check() returns False for unhealthy providers.
+    @pytest.mark.parametrize(("model", "expected"), HEALTH_CHECK_CASES)
+    async def test_health_check(
+        self,
+        make_config: Callable[..., ProviderConfig],
+        model: str | None,
+        expected: bool,
+    ) -> None:
+        """Test that health_check() reflects "unhealthy" in the model name.
         
         Verifies that providers with "unhealthy" in their model name
-        (case-insensitive) return False from health_check().
+        (case-insensitive) return False and all others return True.
         """
-        # Test explicit unhealthy mode
-        config_unhealthy = ProviderConfig(name="test", model="mock-unhealthy")
-        provider_unhealthy = MockProvider(config_unhealthy)
-        assert await provider_unhealthy.health_check() is False
+        provider = MockProvider(make_config(name="test", model=model))
         
-        # Test partial match (contains "unhealthy")
-        config_partial = ProviderConfig(name="test", model="mock-normal-unhealthy")
-        provider_partial = MockProvider(config_partial)
-        assert await provider_partial.health_check() is False
-        
-        # Test case-insensitive
-        config_upper = ProviderConfig(name="test", model="mock-UNHEALTHY")
-        provider_upper = MockProvider(config_upper)
-        assert await provider_upper.health_check() is False
+        assert await provider.health_check() is expected
 
 
 class TestMockProviderMaxTokens:
     """Test MockProvider response truncation based on max_tokens."""
 
     @pytest.mark.asyncio
-    async def test_max_tokens_truncates_response(self) -> None:
+    async def test_max_tokens_truncates_response(
+        self, mock_provider_normal: MockProvider
+    ) -> None:
         """Test that max_tokens truncates response when smaller than response length.
         
         Verifies that when max_tokens is less than the response length,
         the response is truncated to exactly max_tokens characters.
         """
-        config = ProviderConfig(name="test", model="mock-normal")
-        provider = MockProvider(config)
+        provider = mock_provider_normal
         params = GenerationParams(max_tokens=10)
         
         response = await provider.generate("Hello, world!", params=params)
@@ -161,85 +136,122 @@ class TestMockProviderMaxTokens:
         assert response == "Mock respo"  # First 10 chars of "Mock response to: Hello, world!"
 
     @pytest.mark.asyncio
-    async def test_max_tokens_no_truncation_when_equal(self) -> None:
+    async def test_max_tokens_no_truncation_when_equal(
+        self, mock_provider_normal: MockProvider
+    ) -> None:
         """Test that max_tokens doesn't truncate when equal to response length.
         
         Verifies that when max_tokens equals the response length,
         the full response is returned.
         """
-        config = ProviderConfig(name="test", model="mock-normal")
-        provider = MockProvider(config)
-        
-        # Generate response first to know its length
-        full_response = await provider.generate("test")
-        response_length = len(full_response)
+        params = GenerationParams(max_tokens=len(FULL_TEST_RESPONSE))
+        response = await mock_provider_normal.generate("test", params=params)
         
-        # Now test with max_tokens equal to response length
-        params = GenerationParams(max_tokens=response_length)
-        response = await provider.generate("test", params=params)
-        
-        assert len(response) == response_length
-        assert response == full_response
+        assert response == FULL_TEST_RESPONSE
 
     @pytest.mark.asyncio
-    async def test_max_tokens_no_truncation_when_larger(self) -> None:
+    async def test_max_tokens_no_truncation_when_larger(
+        self, mock_provider_normal: MockProvider
+    ) -> None:
         """Test that max_tokens doesn't truncate when larger than response length.
         
         Verifies that when max_tokens is greater than the response length,
         the full response is returned (no padding or truncation).
         """
-        config = ProviderConfig(name="test", model="mock-normal")
-        provider = MockProvider(config)
-        
-        # Generate response first to know its length
-        full_response = await provider.generate("test")
-        response_length = len(full_response)
-        
         # Test with max_tokens much larger than response length
         params = GenerationParams(max_tokens=1000)
-        response = await provider.generate("test", params=params)
+        response = await mock_provider_normal.generate("test", params=params)
         
-        assert len(response) == response_length
-        assert response == full_response
+        assert response == FULL_TEST_RESPONSE
 
     @pytest.mark.asyncio
-    async def test_max_tokens_not_specified_returns_full_response(self) -> None:
+    async def test_max_tokens_not_specified_returns_full_response(
+        self, mock_provider_normal: MockProvider
+    ) -> None:
         """Test that when max_tokens is not specified, full response is returned.
         
         Verifies that when GenerationParams is None or max_tokens is not set,
         the complete response is returned without truncation.
         """
-        config = ProviderConfig(name="test", model="mock-normal")
-        provider = MockProvider(config)
-        
-        # Test with None params
-        response_none = await provider.generate("test")
-        assert len(response_none) > 0
-        assert response_none.startswith("Mock response to:")
-        
-        # Test with params but max_tokens=None (shouldn't happen with Pydantic, but test anyway)
-        params = GenerationParams(max_tokens=1000)
-        response_with_params = await provider.generate("test", params=params)
-        assert len(response_with_params) > 0
+        # Test with None params (default max_tokens covered by the "larger" test)
+        response_none = await mock_provider_normal.generate("test")
+        assert response_none == FULL_TEST_RESPONSE
 
 
 class TestMockProviderDelay:
     """Test MockProvider delay in normal mode."""
 
     @pytest.mark.asyncio
-    async def test_mock_normal_has_correct_delay(self) -> None:
-        """Test that mock-normal mode has approximately 0.1s delay.
-        
-        Verifies that the delay in normal mode is within acceptable range
-        (90-200ms) to account for system overhead while ensuring the delay exists.
+    async def test_mock_normal_has_correct_delay(
+        self,
+        mock_provider_normal: MockProvider,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that mock-normal mode waits 0.1s before responding.
+        
+        Verifies the requested delay by recording asyncio.sleep() calls
+        instead of measuring wall-clock time, so the test neither waits
+        nor depends on scheduler overhead.
         """
-        config = ProviderConfig(name="test", model="mock-normal")
-        provider = MockProvider(config)
-        
-        start = time.perf_counter()
-        await provider.generate("test")
-        elapsed = time.perf_counter() - start
-        
-        # Check that delay is approximately 0.1s (90-200ms range)
-        assert 0.09 <= elapsed <= 0.2, f"Expected delay ~0.1s, got {elapsed:.3f}s"
+        delays: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            delays.append(delay)
+
+        monkeypatch.setattr(mock_module, "asyncio", SimpleNamespace(sleep=fake_sleep))
+
+        await mock_provider_normal.generate("test")
 
+        assert delays == [pytest.approx(0.1)]
+
+    @pytest.mark.asyncio
+    async def test_mock_normal_stream_delays_only_between_chunks(
+        self,
+        mock_provider_normal: MockProvider,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that streaming waits 0.05s between chunks but not after the last."""
+        delays: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            delays.append(delay)
+
+        monkeypatch.setattr(mock_module, "asyncio", SimpleNamespace(sleep=fake_sleep))
+
+        chunks = [chunk async for chunk in mock_provider_normal.generate_stream("test")]
+
+        # 0.1s generation delay, then one delay between each pair of chunks
+        assert "".join(chunks) == FULL_TEST_RESPONSE
+        assert delays == [pytest.approx(0.1)] + [pytest.approx(0.05)] * (len(chunks) - 1)
+
+    @pytest.mark.asyncio
+    async def test_mock_instant_does_not_sleep(
+        self,
+        make_config: Callable[..., ProviderConfig],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that mock-instant mode responds and streams without any delay."""
+        delays: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            delays.append(delay)
+
+        monkeypatch.setattr(mock_module, "asyncio", SimpleNamespace(sleep=fake_sleep))
+        provider = MockProvider(make_config(name="instant", model="mock-instant"))
+
+        response = await provider.generate("test")
+        chunks = [chunk async for chunk in provider.generate_stream("test")]
+
+        assert response == FULL_TEST_RESPONSE
+        assert "".join(chunks) == FULL_TEST_RESPONSE
+        assert delays == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("frozen_clock")
+    async def test_frozen_clock_leaves_asyncio_sleep_alone(
+        self, mock_provider_normal: MockProvider
+    ) -> None:
+        """Test that frozen_clock only stubs the sleep seen by the mock module."""
+        assert await mock_provider_normal.generate("test") == FULL_TEST_RESPONSE
+        assert mock_module.asyncio is not asyncio
+        assert asyncio.sleep.__module__ == "asyncio.tasks"
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+from collections.abc import Callable, Iterator
 from typing import Any
 
 import httpx
@@ -23,6 +25,38 @@ GENERATE_URL = f"{OLLAMA_URL}/api/generate"
 TAGS_URL = f"{OLLAMA_URL}/api/tags"
 
 
+@pytest.fixture(scope="module")
+def ollama_provider(
+    event_loop: asyncio.AbstractEventLoop,
+    make_config: Callable[..., ProviderConfig],
+) -> Iterator[OllamaProvider]:
+    """Share one default OllamaProvider (model "llama3") across the module.
+
+    The provider holds no per-request state and httpx_mock intercepts its
+    client in every test, so one instance (and client) is enough.
+    """
+    provider = OllamaProvider(make_config(name="ollama", model="llama3"))
+    yield provider
+    event_loop.run_until_complete(provider._client.aclose())  # noqa: SLF001
+
+
+@pytest.fixture
+def captured_payload(httpx_mock: HTTPXMock) -> dict[str, Any]:
+    """Answer generate requests with "ok" and capture their JSON payload.
+
+    Returns:
+        Dict filled with the last request body sent to GENERATE_URL
+    """
+    payload: dict[str, Any] = {}
+
+    def _capture(request: httpx.Request) -> httpx.Response:
+        payload.update(json.loads(request.content))
+        return httpx.Response(200, json={"model": "llama3", "response": "ok"})
+
+    httpx_mock.add_callback(_capture, method="POST", url=GENERATE_URL)
+    return payload
+
+
 class TestOllamaProviderConfig:
     """Configuration validation tests."""
 
@@ -50,142 +84,82 @@ class TestOllamaParameterMapping:
     """Ensure GenerationParams are properly mapped to options."""
 
     @pytest.mark.asyncio
-    async def test_parameter_mapping_temperature(
-        self,
-        httpx_mock: HTTPXMock,
-    ) -> None:
-        captured_payload: dict[str, Any] = {}
-
-        def _capture(request: httpx.Request) -> httpx.Response:
-            captured_payload.update(json.loads(request.content))
-            return httpx.Response(200, json={"model": "llama3", "response": "ok"})
-
-        httpx_mock.add_callback(_capture, method="POST", url=GENERATE_URL)
-
-        config = ProviderConfig(name="ollama", model="llama3")
-        provider = OllamaProvider(config)
-        params = GenerationParams(temperature=0.42)
-
-        await provider.generate("test", params=params)
-
-        assert captured_payload["options"]["temperature"] == 0.42
-
-    @pytest.mark.asyncio
-    async def test_parameter_mapping_max_tokens(
-        self,
-        httpx_mock: HTTPXMock,
-    ) -> None:
-        captured_payload: dict[str, Any] = {}
-
-        def _capture(request: httpx.Request) -> httpx.Response:
-            captured_payload.update(json.loads(request.content))
-            return httpx.Response(200, json={"model": "llama3", "response": "ok"})
-
-        httpx_mock.add_callback(_capture, method="POST", url=GENERATE_URL)
-
-        config = ProviderConfig(name="ollama", model="llama3")
-        provider = OllamaProvider(config)
-        params = GenerationParams(max_tokens=256)
-
-        await provider.generate("test", params=params)
-
-        assert captured_payload["options"]["num_predict"] == 256
-
-    @pytest.mark.asyncio
-    async def test_parameter_mapping_top_p(
+    @pytest.mark.parametrize(
+        ("params", "option", "expected"),
+        [
+            pytest.param(
+                GenerationParams(temperature=0.42), "temperature", 0.42, id="temperature"
+            ),
+            pytest.param(
+                GenerationParams(max_tokens=256), "num_predict", 256, id="max_tokens"
+            ),
+            pytest.param(GenerationParams(top_p=0.5), "top_p", 0.5, id="top_p"),
+            # Ollama has no stop option; None means the key must be absent
+            pytest.param(
+                GenerationParams(stop=["END"]), "stop", None, id="stop-ignored"
+            ),
+        ],
+    )
+    async def test_parameter_mapping(
         self,
-        httpx_mock: HTTPXMock,
+        captured_payload: dict[str, Any],
+        ollama_provider: OllamaProvider,
+        params: GenerationParams,
+        option: str,
+        expected: float | None,
     ) -> None:
-        captured_payload: dict[str, Any] = {}
-
-        def _capture(request: httpx.Request) -> httpx.Response:
-            captured_payload.update(json.loads(request.content))
-            return httpx.Response(200, json={"model": "llama3", "response": "ok"})
+        await ollama_provider.generate("test", params=params)
 
-        httpx_mock.add_callback(_capture, method="POST", url=GENERATE_URL)
-
-        config = ProviderConfig(name="ollama", model="llama3")
-        provider = OllamaProvider(config)
-        params = GenerationParams(top_p=0.5)
+        options = captured_payload.get("options") or {}
+        assert options.get(option) == expected
 
-        await provider.generate("test", params=params)
 
-        assert captured_payload["options"]["top_p"] == 0.5
+class TestOllamaGenerateSuccess:
+    """Successful generation scenarios."""
 
     @pytest.mark.asyncio
-    async def test_parameter_mapping_ignore_stop(
+    async def test_generate_success(
         self,
         httpx_mock: HTTPXMock,
+        ollama_provider: OllamaProvider,
     ) -> None:
-        captured_payload: dict[str, Any] = {}
-
-        def _capture(request: httpx.Request) -> httpx.Response:
-            captured_payload.update(json.loads(request.content))
-            return httpx.Response(200, json={"model": "llama3", "response": "ok"})
-
-        httpx_mock.add_callback(_capture, method="POST", url=GENERATE_URL)
-
-        config = ProviderConfig(name="ollama", model="llama3")
-        provider = OllamaProvider(config)
-        params = GenerationParams(stop=["END"])
-
-        await provider.generate("test", params=params)
-
-        assert "options" not in captured_payload or "stop" not in (
-            captured_payload.get("options") or {}
-        )
-
-
-class TestOllamaGenerateSuccess:
-    """Successful generation scenarios."""
-
-    @pytest.mark.asyncio
-    async def test_generate_success(self, httpx_mock: HTTPXMock) -> None:
         httpx_mock.add_response(
             method="POST",
             url=GENERATE_URL,
             json={"model": "llama3", "response": "Because molecules scatter blue light."},
         )
 
-        config = ProviderConfig(name="ollama", model="llama3")
-        provider = OllamaProvider(config)
-
-        result = await provider.generate("Why is the sky blue?")
+        result = await ollama_provider.generate("Why is the sky blue?")
 
         assert result.startswith("Because")
 
     @pytest.mark.asyncio
-    async def test_generate_with_parameters(self, httpx_mock: HTTPXMock) -> None:
+    async def test_generate_with_parameters(
+        self,
+        httpx_mock: HTTPXMock,
+        ollama_provider: OllamaProvider,
+    ) -> None:
         httpx_mock.add_response(
             method="POST",
             url=GENERATE_URL,
             json={"model": "llama3", "response": "Parametrized answer"},
         )
 
-        config = ProviderConfig(name="ollama", model="llama3")
-        provider = OllamaProvider(config)
         params = GenerationParams(temperature=0.1, max_tokens=64, top_p=0.9)
 
-        response = await provider.generate("test", params=params)
+        response = await ollama_provider.generate("test", params=params)
 
         assert response == "Parametrized answer"
 
     @pytest.mark.asyncio
-    async def test_generate_without_parameters(self, httpx_mock: HTTPXMock) -> None:
-        captured_payload: dict[str, Any] = {}
-
-        def _capture(request: httpx.Request) -> httpx.Response:
-            captured_payload.update(json.loads(request.content))
-            return httpx.Response(200, json={"model": "llama3", "response": "No params"})
-
-        httpx_mock.add_callback(_capture, method="POST", url=GENERATE_URL)
-
-        config = ProviderConfig(name="ollama", model="llama3")
-        provider = OllamaProvider(config)
-
-        response = await provider.generate("test")
+    async def test_generate_without_parameters(
+        self,
+        captured_payload: dict[str, Any],
+        ollama_provider: OllamaProvider,
+    ) -> None:
+        response = await ollama_provider.generate("test")
 
-        assert response == "No params"
+        assert response == "ok"
         assert "options" not in captured_payload
 
 
@@ -193,76 +167,65 @@ class TestOllamaGenerateErrors:
     """Error handling for Ollama generate endpoint."""
 
     @pytest.mark.asyncio
-    async def test_generate_model_not_found(self, httpx_mock: HTTPXMock) -> None:
-        httpx_mock.add_response(
-            method="POST",
-            url=GENERATE_URL,
-            status_code=404,
-            json={"error": "model not found"},
-        )
-
-        config = ProviderConfig(name="ollama", model="missing-model")
-        provider = OllamaProvider(config)
-
-        with pytest.raises(InvalidRequestError, match="missing-model"):
-            await provider.generate("test")
-
-    @pytest.mark.asyncio
-    async def test_generate_server_error(self, httpx_mock: HTTPXMock) -> None:
-        httpx_mock.add_response(
-            method="POST",
-            url=GENERATE_URL,
-            status_code=500,
-            json={"error": "internal error"},
-        )
-
-        config = ProviderConfig(name="ollama", model="llama3")
-
-        provider = OllamaProvider(config)
-
-        with pytest.raises(ProviderError, match="server error"):
-            await provider.generate("test")
-
-    @pytest.mark.asyncio
-    async def test_generate_connection_error(self, httpx_mock: HTTPXMock) -> None:
-        httpx_mock.add_exception(
-            exception=httpx.ConnectError("connection refused"),
-            method="POST",
-            url=GENERATE_URL,
-        )
-
-        config = ProviderConfig(name="ollama", model="llama3")
-        provider = OllamaProvider(config)
-
-        with pytest.raises(ProviderError, match="Cannot connect to Ollama"):
-            await provider.generate("test")
-
-    @pytest.mark.asyncio
-    async def test_generate_timeout(self, httpx_mock: HTTPXMock) -> None:
-        httpx_mock.add_exception(
-            exception=httpx.TimeoutException("timed out"),
-            method="POST",
-            url=GENERATE_URL,
-        )
-
-        config = ProviderConfig(name="ollama", model="llama3", timeout=5)
-        provider = OllamaProvider(config)
-
-        with pytest.raises(TimeoutError, match="timed out after 5"):
-            await provider.generate("test")
-
-    @pytest.mark.asyncio
-    async def test_generate_invalid_response(self, httpx_mock: HTTPXMock) -> None:
-        httpx_mock.add_response(
-            method="POST",
-            url=GENERATE_URL,
-            json={"model": "llama3"},
-        )
+    @pytest.mark.parametrize(
+        ("config_overrides", "failure", "error", "match"),
+        [
+            pytest.param(
+                {"model": "missing-model"},
+                {"status_code": 404, "json": {"error": "model not found"}},
+                InvalidRequestError,
+                "missing-model",
+                id="model-not-found",
+            ),
+            pytest.param(
+                {},
+                {"status_code": 500, "json": {"error": "internal error"}},
+                ProviderError,
+                "server error",
+                id="server-error",
+            ),
+            pytest.param(
+                {},
+                httpx.ConnectError("connection refused"),
+                ProviderError,
+                "Cannot connect to Ollama",
+                id="connection-error",
+            ),
+            pytest.param(
+                {"timeout": 5},
+                httpx.TimeoutException("timed out"),
+                TimeoutError,
+                "timed out after 5",
+                id="timeout",
+            ),
+            pytest.param(
+                {},
+                {"json": {"model": "llama3"}},
+                ProviderError,
+                "Invalid response format",
+                id="invalid-response",
+            ),
+        ],
+    )
+    async def test_generate_error(
+        self,
+        httpx_mock: HTTPXMock,
+        make_config: Callable[..., ProviderConfig],
+        config_overrides: dict[str, Any],
+        failure: dict[str, Any] | Exception,
+        error: type[Exception],
+        match: str,
+    ) -> None:
+        # failure is either add_response() kwargs or an exception to raise
+        if isinstance(failure, Exception):
+            httpx_mock.add_exception(exception=failure, method="POST", url=GENERATE_URL)
+        else:
+            httpx_mock.add_response(method="POST", url=GENERATE_URL, **failure)
 
-        config = ProviderConfig(name="ollama", model="llama3")
+        config = make_config(**{"name": "ollama", "model": "llama3", **config_overrides})
         provider = OllamaProvider(config)
 
-        with pytest.raises(ProviderError, match="Invalid response format"):
+        with pytest.raises(error, match=match):
             await provider.generate("test")
 
 
@@ -270,43 +233,34 @@ class TestOllamaHealthCheck:
     """Health check coverage."""
 
     @pytest.mark.asyncio
-    async def test_health_check_success(self, httpx_mock: HTTPXMock) -> None:
-        httpx_mock.add_response(
-            method="GET",
-            url=TAGS_URL,
-            status_code=200,
-            json={"models": []},
-        )
-
-        config = ProviderConfig(name="ollama", model="llama3")
-        provider = OllamaProvider(config)
-
-        assert await provider.health_check() is True
-
-    @pytest.mark.asyncio
-    async def test_health_check_failure(self, httpx_mock: HTTPXMock) -> None:
-        httpx_mock.add_response(
-            method="GET",
-            url=TAGS_URL,
-            status_code=500,
-            json={"error": "server down"},
-        )
-
-        config = ProviderConfig(name="ollama", model="llama3")
-        provider = OllamaProvider(config)
-
-        assert await provider.health_check() is False
-
-    @pytest.mark.asyncio
-    async def test_health_check_connection_error(self, httpx_mock: HTTPXMock) -> None:
-        httpx_mock.add_exception(
-            exception=httpx.ConnectError("connection refused"),
-            method="GET",
-            url=TAGS_URL,
-        )
-
-        config = ProviderConfig(name="ollama", model="llama3")
-        provider = OllamaProvider(config)
-
-        assert await provider.health_check() is False
-
+    @pytest.mark.parametrize(
+        ("status_code", "expected"),
+        [
+            pytest.param(200, True, id="success"),
+            pytest.param(500, False, id="server-error"),
+            # None simulates a refused connection instead of a response
+            pytest.param(None, False, id="connection-error"),
+        ],
+    )
+    async def test_health_check(
+        self,
+        httpx_mock: HTTPXMock,
+        ollama_provider: OllamaProvider,
+        status_code: int | None,
+        expected: bool,
+    ) -> None:
+        if status_code is None:
+            httpx_mock.add_exception(
+                exception=httpx.ConnectError("connection refused"),
+                method="GET",
+                url=TAGS_URL,
+            )
+        else:
+            httpx_mock.add_response(
+                method="GET",
+                url=TAGS_URL,
+                status_code=status_code,
+                json={"models": []},
+            )
+
+        assert await ollama_provider.health_check() is expected
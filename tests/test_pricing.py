@@ -11,139 +11,97 @@ import pytest
 from orchestrator.pricing import calculate_cost, get_price_per_1k, PRICING
 
 
+# (provider, model, tokens, expected cost in RUB)
+COST_CASES = [
+    pytest.param("gigachat", "GigaChat", 1000, 1.00, id="gigachat-base"),
+    pytest.param("gigachat", "GigaChat-Pro", 1000, 2.00, id="gigachat-pro"),
+    pytest.param("gigachat", "GigaChat-Plus", 1000, 1.50, id="gigachat-plus"),
+    pytest.param("yandexgpt", "yandexgpt/latest", 1000, 1.50, id="yandexgpt-latest"),
+    pytest.param(
+        "yandexgpt", "yandexgpt-lite/latest", 1000, 0.75, id="yandexgpt-lite"
+    ),
+    pytest.param("unknown-provider", "unknown-model", 1000, 0.0, id="unknown-provider"),
+    # Unknown or missing model falls back to the provider default
+    pytest.param(
+        "gigachat", "GigaChat-Ultra-New", 1000, 1.50, id="unknown-model-gigachat"
+    ),
+    pytest.param(
+        "yandexgpt", "yandexgpt-experimental", 1000, 1.50, id="unknown-model-yandexgpt"
+    ),
+    pytest.param("gigachat", None, 1000, 1.50, id="none-model"),
+    # Fractional, zero and large token counts
+    pytest.param("gigachat", "GigaChat-Pro", 1500, 3.0, id="fractional-pro"),
+    pytest.param(
+        "yandexgpt", "yandexgpt-lite/latest", 750, 0.5625, id="fractional-lite"
+    ),
+    pytest.param("gigachat", "GigaChat-Pro", 0, 0.0, id="zero-tokens"),
+    pytest.param("gigachat", "GigaChat-Pro", 100000, 200.0, id="large-token-count"),
+]
+
+# (provider, model, expected price per 1K tokens in RUB)
+PRICE_PER_1K_CASES = [
+    pytest.param("gigachat", "GigaChat-Pro", 2.00, id="gigachat-pro"),
+    pytest.param("yandexgpt", "yandexgpt-lite/latest", 0.75, id="yandexgpt-lite"),
+    pytest.param("gigachat", None, 1.50, id="default-with-none-model"),
+    pytest.param("unknown-provider", "some-model", 0.0, id="unknown-provider"),
+    pytest.param("gigachat", "unknown-model", 1.50, id="unknown-model-default"),
+    pytest.param("ollama", "llama2", 0.0, id="free-provider"),
+    # Provider variants resolve by prefix, as in calculate_cost()
+    pytest.param("gigachat-prod", "GigaChat-Pro", 2.00, id="variant-prefix"),
+    pytest.param("YandexGPT-main", None, 1.50, id="variant-case-insensitive"),
+]
+
+
+# Pricing table entries, one test node per provider / (provider, model)
+PRICING_PROVIDERS = sorted(PRICING)
+PRICING_ENTRIES = [
+    (provider, model) for provider, pricing in PRICING.items() for model in pricing
+]
+
+
 class TestCalculateCost:
     """Test calculate_cost() function."""
 
-    def test_calculate_cost_gigachat_base(self) -> None:
-        """Test cost calculation for GigaChat base model."""
-        cost = calculate_cost("gigachat", "GigaChat", 1000)
-        assert cost == pytest.approx(1.00)
-
-    def test_calculate_cost_gigachat_pro(self) -> None:
-        """Test cost calculation for GigaChat-Pro model."""
-        cost = calculate_cost("gigachat", "GigaChat-Pro", 1000)
-        assert cost == pytest.approx(2.00)
-
-    def test_calculate_cost_gigachat_plus(self) -> None:
-        """Test cost calculation for GigaChat-Plus model."""
-        cost = calculate_cost("gigachat", "GigaChat-Plus", 1000)
-        assert cost == pytest.approx(1.50)
-
-    def test_calculate_cost_yandexgpt_latest(self) -> None:
-        """Test cost calculation for YandexGPT latest model."""
-        cost = calculate_cost("yandexgpt", "yandexgpt/latest", 1000)
-        assert cost == pytest.approx(1.50)
-
-    def test_calculate_cost_yandexgpt_lite(self) -> None:
-        """Test cost calculation for YandexGPT lite model."""
-        cost = calculate_cost("yandexgpt", "yandexgpt-lite/latest", 1000)
-        assert cost == pytest.approx(0.75)
-
-    def test_calculate_cost_free_providers_ollama(self) -> None:
-        """Test cost calculation for free provider (Ollama)."""
-        cost = calculate_cost("ollama", "llama2", 1000)
-        assert cost == 0.0
-
-    def test_calculate_cost_free_providers_mock(self) -> None:
-        """Test cost calculation for free provider (Mock)."""
-        cost = calculate_cost("mock", "mock-normal", 1000)
-        assert cost == 0.0
-
-    def test_calculate_cost_unknown_provider(self) -> None:
-        """Test cost calculation for unknown provider returns 0.0."""
-        cost = calculate_cost("unknown-provider", "unknown-model", 1000)
-        assert cost == 0.0
-
-    def test_calculate_cost_unknown_model_uses_default_gigachat(self) -> None:
-        """Test that unknown GigaChat model uses default price."""
-        cost = calculate_cost("gigachat", "GigaChat-Ultra-New", 1000)
-        assert cost == pytest.approx(1.50)  # default for gigachat
-
-    def test_calculate_cost_unknown_model_uses_default_yandexgpt(self) -> None:
-        """Test that unknown YandexGPT model uses default price."""
-        cost = calculate_cost("yandexgpt", "yandexgpt-experimental", 1000)
-        assert cost == pytest.approx(1.50)  # default for yandexgpt
-
-    def test_calculate_cost_fractional_tokens(self) -> None:
-        """Test cost calculation with fractional token counts."""
-        # 1500 tokens * 2.00 RUB/1K = 3.0 RUB
-        cost = calculate_cost("gigachat", "GigaChat-Pro", 1500)
-        assert cost == pytest.approx(3.0)
-
-        # 750 tokens * 0.75 RUB/1K = 0.5625 RUB
-        cost = calculate_cost("yandexgpt", "yandexgpt-lite/latest", 750)
-        assert cost == pytest.approx(0.5625)
-
-    def test_calculate_cost_zero_tokens(self) -> None:
-        """Test cost calculation with zero tokens."""
-        cost = calculate_cost("gigachat", "GigaChat-Pro", 0)
-        assert cost == 0.0
-
-    def test_calculate_cost_large_token_count(self) -> None:
-        """Test cost calculation with large token count."""
-        # 100,000 tokens * 2.00 RUB/1K = 200.0 RUB
-        cost = calculate_cost("gigachat", "GigaChat-Pro", 100000)
-        assert cost == pytest.approx(200.0)
-
-    def test_calculate_cost_case_insensitive_provider(self) -> None:
-        """Test that provider name is case-insensitive."""
-        cost1 = calculate_cost("gigachat", "GigaChat", 1000)
-        cost2 = calculate_cost("GigaChat", "GigaChat", 1000)
-        cost3 = calculate_cost("GIGACHAT", "GigaChat", 1000)
-        assert cost1 == cost2 == cost3 == pytest.approx(1.00)
-
-    def test_calculate_cost_none_model_uses_default(self) -> None:
-        """Test that None model uses default price."""
-        cost = calculate_cost("gigachat", None, 1000)
-        assert cost == pytest.approx(1.50)  # default for gigachat
-
-    def test_calculate_cost_provider_with_suffix(self) -> None:
-        """Test that provider variants (e.g., mock-1, mock-2) match base provider."""
-        # Test mock-1, mock-2, mock-3 all use "mock" pricing
-        cost1 = calculate_cost("mock-1", "mock-normal", 1000)
-        cost2 = calculate_cost("mock-2", "mock-normal", 1000)
-        cost3 = calculate_cost("mock-3", "mock-normal", 1000)
-        assert cost1 == 0.0  # mock is free
-        assert cost2 == 0.0
-        assert cost3 == 0.0
-
-        # Test gigachat-dev uses gigachat pricing
-        cost_dev = calculate_cost("gigachat-dev", "GigaChat-Pro", 1000)
-        assert cost_dev == pytest.approx(2.00)  # GigaChat-Pro pricing
+    @pytest.mark.parametrize(("provider", "model", "tokens", "expected"), COST_CASES)
+    def test_calculate_cost(
+        self, provider: str, model: str | None, tokens: int, expected: float
+    ) -> None:
+        """Test cost calculation for each provider, model and token count."""
+        assert calculate_cost(provider, model, tokens) == pytest.approx(expected)
+
+    @pytest.mark.parametrize(
+        ("provider", "model", "expected"),
+        [
+            # Free providers
+            ("ollama", "llama2", 0.0),
+            ("mock", "mock-normal", 0.0),
+            # Provider variants (e.g., mock-1, mock-2) match the base provider
+            ("mock-1", "mock-normal", 0.0),
+            ("mock-2", "mock-normal", 0.0),
+            ("mock-3", "mock-normal", 0.0),
+            ("gigachat-dev", "GigaChat-Pro", 2.00),
+            # Provider name is case-insensitive
+            ("gigachat", "GigaChat", 1.00),
+            ("GigaChat", "GigaChat", 1.00),
+            ("GIGACHAT", "GigaChat", 1.00),
+        ],
+    )
+    def test_calculate_cost_alias_resolution(
+        self, provider: str, model: str, expected: float
+    ) -> None:
+        """Test that provider aliases resolve to the base provider's pricing."""
+        assert calculate_cost(provider, model, 1000) == pytest.approx(expected)
 
 
 class TestGetPricePer1k:
     """Test get_price_per_1k() function."""
 
-    def test_get_price_gigachat_pro(self) -> None:
-        """Test getting price for GigaChat-Pro."""
-        price = get_price_per_1k("gigachat", "GigaChat-Pro")
-        assert price == pytest.approx(2.00)
-
-    def test_get_price_yandexgpt_lite(self) -> None:
-        """Test getting price for YandexGPT lite."""
-        price = get_price_per_1k("yandexgpt", "yandexgpt-lite/latest")
-        assert price == pytest.approx(0.75)
-
-    def test_get_price_default_with_none_model(self) -> None:
-        """Test getting default price when model is None."""
-        price = get_price_per_1k("gigachat", None)
-        assert price == pytest.approx(1.50)  # default for gigachat
-
-    def test_get_price_unknown_provider(self) -> None:
-        """Test getting price for unknown provider returns 0.0."""
-        price = get_price_per_1k("unknown-provider", "some-model")
-        assert price == 0.0
-
-    def test_get_price_unknown_model_returns_default(self) -> None:
-        """Test that unknown model returns provider default."""
-        price = get_price_per_1k("gigachat", "unknown-model")
-        assert price == pytest.approx(1.50)  # default for gigachat
-
-    def test_get_price_free_provider(self) -> None:
-        """Test getting price for free provider."""
-        price = get_price_per_1k("ollama", "llama2")
-        assert price == 0.0
+    @pytest.mark.parametrize(("provider", "model", "expected"), PRICE_PER_1K_CASES)
+    def test_get_price(
+        self, provider: str, model: str | None, expected: float
+    ) -> None:
+        """Test getting the per-1K price for each provider and model."""
+        assert get_price_per_1k(provider, model) == pytest.approx(expected)
 
 
 class TestPricingTable:
@@ -157,19 +115,14 @@ class TestPricingTable:
         assert "ollama" in PRICING
         assert "mock" in PRICING
 
-    def test_pricing_all_providers_have_default(self) -> None:
-        """Test that all providers have default price."""
-        for provider, pricing in PRICING.items():
-            assert "default" in pricing, f"Provider {provider} missing 'default' price"
-
-    def test_pricing_all_values_are_numeric(self) -> None:
-        """Test that all pricing values are numeric."""
-        for provider, pricing in PRICING.items():
-            for model, price in pricing.items():
-                assert isinstance(
-                    price, (int, float)
-                ), f"Price for {provider}/{model} is not numeric: {price}"
-                assert (
-                    price >= 0.0
-                ), f"Price for {provider}/{model} is negative: {price}"
-
+    @pytest.mark.parametrize("provider", PRICING_PROVIDERS)
+    def test_pricing_provider_has_default(self, provider: str) -> None:
+        """Test that every provider has a default price."""
+        assert "default" in PRICING[provider]
+
+    @pytest.mark.parametrize(("provider", "model"), PRICING_ENTRIES)
+    def test_pricing_value_is_numeric(self, provider: str, model: str) -> None:
+        """Test that every pricing value is a non-negative number."""
+        price = PRICING[provider][model]
+        assert isinstance(price, (int, float))
+        assert price >= 0.0
@@ -8,6 +8,8 @@ This module tests streaming support across all components:
 - Parameter handling in streaming
 """
 
+from collections.abc import Callable
+
 import pytest
 
 from orchestrator import Router
@@ -22,27 +24,44 @@ from orchestrator.providers.base import (
 )
 from orchestrator.providers.mock import MockProvider
 
+# Deterministic mock-normal response (what _call/_acall return) to "test prompt"
+TEST_PROMPT_RESPONSE = "Mock response to: test prompt"
+
+
+class MidStreamFailureProvider(MockProvider):
+    """MockProvider that yields one chunk and then raises TimeoutError."""
+
+    def __init__(self, config: ProviderConfig) -> None:
+        super().__init__(config)
+        self.closed = False
+
+    async def generate_stream(self, prompt: str, params=None):
+        try:
+            yield "partial "
+            raise TimeoutError("Mid-stream timeout")
+        finally:
+            self.closed = True
+
 
 class TestMockProviderStreaming:
     """Test MockProvider.generate_stream() functionality."""
 
     @pytest.mark.asyncio
-    async def test_mock_provider_streaming_normal_mode(self) -> None:
+    async def test_mock_provider_streaming_normal_mode(
+        self, make_mock_provider: Callable[[str, str], MockProvider]
+    ) -> None:
         """Test that mock-normal mode streams response word by word.
 
         Verifies that generate_stream() yields chunks that, when concatenated,
         match the result of generate() exactly.
         """
-        config = ProviderConfig(name="test", model="mock-normal")
-        provider = MockProvider(config)
+        provider = make_mock_provider("test", "mock-normal")
 
         # Get non-streaming result for comparison
         expected_response = await provider.generate("Hello, world!")
 
         # Stream and collect chunks
-        chunks = []
-        async for chunk in provider.generate_stream("Hello, world!"):
-            chunks.append(chunk)
+        chunks = [chunk async for chunk in provider.generate_stream("Hello, world!")]
 
         # Concatenate chunks and compare
         streamed_response = "".join(chunks)
@@ -50,14 +69,15 @@ class TestMockProviderStreaming:
         assert len(chunks) > 0  # Should have multiple chunks (words)
 
     @pytest.mark.asyncio
-    async def test_mock_provider_streaming_timeout_mode(self) -> None:
+    async def test_mock_provider_streaming_timeout_mode(
+        self, make_mock_provider: Callable[[str, str], MockProvider]
+    ) -> None:
         """Test that mock-timeout mode raises TimeoutError immediately.
 
         Verifies that error modes raise exceptions before any chunks are yielded,
         allowing Router to fallback to another provider.
         """
-        config = ProviderConfig(name="test", model="mock-timeout")
-        provider = MockProvider(config)
+        provider = make_mock_provider("test", "mock-timeout")
 
         with pytest.raises(TimeoutError, match="Mock timeout simulation"):
             async for _ in provider.generate_stream("test"):
@@ -65,44 +85,48 @@ class TestMockProviderStreaming:
                 pytest.fail("Should have raised TimeoutError before yielding chunks")
 
     @pytest.mark.asyncio
-    async def test_mock_provider_streaming_ratelimit_mode(self) -> None:
+    async def test_mock_provider_streaming_ratelimit_mode(
+        self, make_mock_provider: Callable[[str, str], MockProvider]
+    ) -> None:
         """Test that mock-ratelimit mode raises RateLimitError immediately."""
-        config = ProviderConfig(name="test", model="mock-ratelimit")
-        provider = MockProvider(config)
+        provider = make_mock_provider("test", "mock-ratelimit")
 
         with pytest.raises(RateLimitError, match="Mock rate limit simulation"):
             async for _ in provider.generate_stream("test"):
                 pytest.fail("Should have raised RateLimitError")
 
     @pytest.mark.asyncio
-    async def test_mock_provider_streaming_auth_error_mode(self) -> None:
+    async def test_mock_provider_streaming_auth_error_mode(
+        self, make_mock_provider: Callable[[str, str], MockProvider]
+    ) -> None:
         """Test that mock-auth-error mode raises AuthenticationError immediately."""
-        config = ProviderConfig(name="test", model="mock-auth-error")
-        provider = MockProvider(config)
+        provider = make_mock_provider("test", "mock-auth-error")
 
         with pytest.raises(AuthenticationError, match="Mock authentication failure"):
             async for _ in provider.generate_stream("test"):
                 pytest.fail("Should have raised AuthenticationError")
 
     @pytest.mark.asyncio
-    async def test_mock_provider_streaming_invalid_request_mode(self) -> None:
+    async def test_mock_provider_streaming_invalid_request_mode(
+        self, make_mock_provider: Callable[[str, str], MockProvider]
+    ) -> None:
         """Test that mock-invalid-request mode raises InvalidRequestError immediately."""
-        config = ProviderConfig(name="test", model="mock-invalid-request")
-        provider = MockProvider(config)
+        provider = make_mock_provider("test", "mock-invalid-request")
 
         with pytest.raises(InvalidRequestError, match="Mock invalid request"):
             async for _ in provider.generate_stream("test"):
                 pytest.fail("Should have raised InvalidRequestError")
 
     @pytest.mark.asyncio
-    async def test_mock_provider_streaming_with_max_tokens(self) -> None:
+    async def test_mock_provider_streaming_with_max_tokens(
+        self, make_mock_provider: Callable[[str, str], MockProvider]
+    ) -> None:
         """Test that max_tokens is respected in streaming mode.
 
         Verifies that when max_tokens is specified, the concatenated streamed
         response matches the truncated result from generate().
         """
-        config = ProviderConfig(name="test", model="mock-normal")
-        provider = MockProvider(config)
+        provider = make_mock_provider("test", "mock-normal")
 
         params = GenerationParams(max_tokens=10)
 
@@ -110,9 +134,9 @@ class TestMockProviderStreaming:
         expected_response = await provider.generate("Hello, world!", params=params)
 
         # Stream and collect chunks
-        chunks = []
-        async for chunk in provider.generate_stream("Hello, world!", params=params):
-            chunks.append(chunk)
+        chunks = [
+            chunk async for chunk in provider.generate_stream("Hello, world!", params=params)
+        ]
 
         # Concatenate chunks and compare
         streamed_response = "".join(chunks)
@@ -124,30 +148,31 @@ class TestRouterStreaming:
     """Test Router.route_stream() functionality."""
 
     @pytest.mark.asyncio
-    async def test_router_streaming_single_provider(self) -> None:
+    async def test_router_streaming_single_provider(
+        self, make_mock_provider: Callable[[str, str], MockProvider]
+    ) -> None:
         """Test that route_stream() works with a single provider.
 
         Verifies that route_stream() yields chunks that, when concatenated,
         match the result of route().
         """
         router = Router(strategy="round-robin")
-        config = ProviderConfig(name="provider1", model="mock-normal")
-        router.add_provider(MockProvider(config))
+        router.add_provider(make_mock_provider("provider1", "mock-normal"))
 
         # Get non-streaming result for comparison
         expected_response = await router.route("test prompt")
 
         # Stream and collect chunks
-        chunks = []
-        async for chunk in router.route_stream("test prompt"):
-            chunks.append(chunk)
+        chunks = [chunk async for chunk in router.route_stream("test prompt")]
 
         # Concatenate chunks and compare
         streamed_response = "".join(chunks)
         assert streamed_response == expected_response
 
     @pytest.mark.asyncio
-    async def test_router_streaming_fallback_before_first_chunk(self) -> None:
+    async def test_router_streaming_fallback_before_first_chunk(
+        self, make_mock_provider: Callable[[str, str], MockProvider]
+    ) -> None:
         """Test that fallback works when error occurs before first chunk.
 
         Verifies that when the first provider fails (before yielding any chunks),
@@ -156,17 +181,11 @@ class TestRouterStreaming:
         router = Router(strategy="round-robin")
 
         # Add: timeout provider (will fail), then normal provider (will succeed)
-        router.add_provider(
-            MockProvider(ProviderConfig(name="p1", model="mock-timeout"))
-        )
-        router.add_provider(
-            MockProvider(ProviderConfig(name="p2", model="mock-normal"))
-        )
+        router.add_provider(make_mock_provider("p1", "mock-timeout"))
+        router.add_provider(make_mock_provider("p2", "mock-normal"))
 
         # Should fallback from p1 (timeout) to p2 (success) and stream successfully
-        chunks = []
-        async for chunk in router.route_stream("test"):
-            chunks.append(chunk)
+        chunks = [chunk async for chunk in router.route_stream("test")]
 
         # Should have received chunks from p2
         assert len(chunks) > 0
@@ -174,7 +193,9 @@ class TestRouterStreaming:
         assert streamed_response.startswith("Mock response to:")
 
     @pytest.mark.asyncio
-    async def test_router_streaming_fallback_tries_all_providers(self) -> None:
+    async def test_router_streaming_fallback_tries_all_providers(
+        self, make_mock_provider: Callable[[str, str], MockProvider]
+    ) -> None:
         """Test that fallback tries all providers in circular order.
 
         Verifies that when multiple providers fail, Router tries all providers
@@ -183,20 +204,12 @@ class TestRouterStreaming:
         router = Router(strategy="round-robin")
 
         # Add: timeout, timeout, normal
-        router.add_provider(
-            MockProvider(ProviderConfig(name="p1", model="mock-timeout"))
-        )
-        router.add_provider(
-            MockProvider(ProviderConfig(name="p2", model="mock-timeout"))
-        )
-        router.add_provider(
-            MockProvider(ProviderConfig(name="p3", model="mock-normal"))
-        )
+        router.add_provider(make_mock_provider("p1", "mock-timeout"))
+        router.add_provider(make_mock_provider("p2", "mock-timeout"))
+        router.add_provider(make_mock_provider("p3", "mock-normal"))
 
         # Should try p1 (timeout) → p2 (timeout) → p3 (success)
-        chunks = []
-        async for chunk in router.route_stream("test"):
-            chunks.append(chunk)
+        chunks = [chunk async for chunk in router.route_stream("test")]
 
         # Should have received chunks from p3
         assert len(chunks) > 0
@@ -204,7 +217,9 @@ class TestRouterStreaming:
         assert streamed_response.startswith("Mock response to:")
 
     @pytest.mark.asyncio
-    async def test_router_streaming_all_providers_failed(self) -> None:
+    async def test_router_streaming_all_providers_failed(
+        self, make_mock_provider: Callable[[str, str], MockProvider]
+    ) -> None:
         """Test that route_stream() raises error when all providers fail.
 
         Verifies that when all providers fail before yielding any chunks,
@@ -214,15 +229,47 @@ class TestRouterStreaming:
 
         # Add 3 timeout providers (all will fail)
         for i in range(3):
-            router.add_provider(
-                MockProvider(ProviderConfig(name=f"p{i+1}", model="mock-timeout"))
-            )
+            router.add_provider(make_mock_provider(f"p{i+1}", "mock-timeout"))
 
         # Should raise TimeoutError (last error)
         with pytest.raises(TimeoutError, match="Mock timeout simulation"):
             async for _ in router.route_stream("test"):
                 pytest.fail("Should have raised TimeoutError")
 
+    @pytest.mark.asyncio
+    async def test_router_streaming_error_after_first_chunk_no_fallback(
+        self, make_mock_provider: Callable[[str, str], MockProvider]
+    ) -> None:
+        """Test that an error after the first chunk is raised without fallback.
+
+        Verifies that chunks from different providers are never mixed.
+        """
+        router = Router(strategy="round-robin")
+        router.add_provider(MidStreamFailureProvider(ProviderConfig(name="p1", model="mock-normal")))
+        router.add_provider(make_mock_provider("p2", "mock-normal"))
+
+        chunks = []
+        with pytest.raises(TimeoutError, match="Mid-stream timeout"):
+            async for chunk in router.route_stream("test"):
+                chunks.append(chunk)
+
+        assert chunks == ["partial "]
+        assert router.metrics["p1"].failed_requests == 1
+        assert router.metrics["p2"].total_requests == 0
+
+    @pytest.mark.asyncio
+    async def test_router_streaming_closes_provider_stream_on_early_exit(self) -> None:
+        """Test that the provider stream is closed when the caller stops early."""
+        router = Router(strategy="round-robin")
+        provider = MidStreamFailureProvider(ProviderConfig(name="p1", model="mock-normal"))
+        router.add_provider(provider)
+
+        stream = router.route_stream("test")
+        assert await stream.__anext__() == "partial "
+        await stream.aclose()
+
+        assert provider.closed
+
     @pytest.mark.asyncio
     async def test_router_streaming_empty_providers_raises_error(self) -> None:
         """Test that route_stream() raises error when no providers registered."""
@@ -233,22 +280,22 @@ class TestRouterStreaming:
                 pytest.fail("Should have raised ProviderError")
 
     @pytest.mark.asyncio
-    async def test_router_streaming_with_params(self) -> None:
+    async def test_router_streaming_with_params(
+        self, make_mock_provider: Callable[[str, str], MockProvider]
+    ) -> None:
         """Test that GenerationParams are correctly passed through in streaming.
 
         Verifies that parameters like max_tokens are respected in streaming mode.
         """
         router = Router(strategy="round-robin")
-        router.add_provider(
-            MockProvider(ProviderConfig(name="p1", model="mock-normal"))
-        )
+        router.add_provider(make_mock_provider("p1", "mock-normal"))
 
         params = GenerationParams(max_tokens=15, temperature=0.8)
 
         # Stream and collect chunks
-        chunks = []
-        async for chunk in router.route_stream("test prompt", params=params):
-            chunks.append(chunk)
+        chunks = [
+            chunk async for chunk in router.route_stream("test prompt", params=params)
+        ]
 
         # Concatenate and verify max_tokens limit
         streamed_response = "".join(chunks)
@@ -259,11 +306,13 @@ class TestLangChainStreaming:
     """Test LangChain streaming methods (_astream and _stream)."""
 
     @pytest.mark.asyncio
-    async def test_langchain_astream(self) -> None:
+    async def test_langchain_astream(
+        self, make_mock_provider: Callable[[str, str], MockProvider]
+    ) -> None:
         """Test that _astream() correctly streams responses.
 
         Verifies that _astream() yields chunks that, when concatenated,
-        match the result of _acall().
+        match the (deterministic) result of _acall().
         """
         pytest.importorskip("langchain_core")
 
@@ -273,28 +322,24 @@ class TestLangChainStreaming:
             pytest.skip("langchain-core is not available")
 
         router = Router(strategy="round-robin")
-        config = ProviderConfig(name="mock", model="mock-normal")
-        router.add_provider(MockProvider(config))
+        router.add_provider(make_mock_provider("mock", "mock-normal"))
 
         llm = MultiLLMOrchestrator(router=router)
 
-        # Get non-streaming result for comparison
-        expected_response = await llm._acall("test prompt")
-
         # Stream and collect chunks
-        chunks = []
-        async for chunk in llm._astream("test prompt"):
-            chunks.append(chunk)
+        chunks = [chunk async for chunk in llm._astream("test prompt")]
 
         # Concatenate chunks and compare
         streamed_response = "".join(chunks)
-        assert streamed_response == expected_response
+        assert streamed_response == TEST_PROMPT_RESPONSE
 
-    def test_langchain_stream_sync(self) -> None:
+    def test_langchain_stream_sync(
+        self, make_mock_provider: Callable[[str, str], MockProvider]
+    ) -> None:
         """Test that _stream() correctly streams responses synchronously.
 
         Verifies that _stream() yields chunks that, when concatenated,
-        match the result of _call().
+        match the (deterministic) result of _call().
         """
         pytest.importorskip("langchain_core")
 
@@ -304,25 +349,21 @@ class TestLangChainStreaming:
             pytest.skip("langchain-core is not available")
 
         router = Router(strategy="round-robin")
-        config = ProviderConfig(name="mock", model="mock-normal")
-        router.add_provider(MockProvider(config))
+        router.add_provider(make_mock_provider("mock", "mock-normal"))
 
         llm = MultiLLMOrchestrator(router=router)
 
-        # Get non-streaming result for comparison
-        expected_response = llm._call("test prompt")
-
         # Stream and collect chunks
-        chunks = []
-        for chunk in llm._stream("test prompt"):
-            chunks.append(chunk)
+        chunks = list(llm._stream("test prompt"))
 
         # Concatenate chunks and compare
         streamed_response = "".join(chunks)
-        assert streamed_response == expected_response
+        assert streamed_response == TEST_PROMPT_RESPONSE
 
     @pytest.mark.asyncio
-    async def test_langchain_astream_with_params(self) -> None:
+    async def test_langchain_astream_with_params(
+        self, make_mock_provider: Callable[[str, str], MockProvider]
+    ) -> None:
         """Test that _astream() correctly handles parameters."""
         pytest.importorskip("langchain_core")
 
@@ -332,21 +373,22 @@ class TestLangChainStreaming:
             pytest.skip("langchain-core is not available")
 
         router = Router(strategy="round-robin")
-        config = ProviderConfig(name="mock", model="mock-normal")
-        router.add_provider(MockProvider(config))
+        router.add_provider(make_mock_provider("mock", "mock-normal"))
 
         llm = MultiLLMOrchestrator(router=router)
 
         # Stream with parameters
-        chunks = []
-        async for chunk in llm._astream("test", max_tokens=12, temperature=0.9):
-            chunks.append(chunk)
+        chunks = [
+            chunk async for chunk in llm._astream("test", max_tokens=12, temperature=0.9)
+        ]
 
         # Verify max_tokens limit
         streamed_response = "".join(chunks)
         assert len(streamed_response) == 12
 
-    def test_langchain_stream_sync_with_params(self) -> None:
+    def test_langchain_stream_sync_with_params(
+        self, make_mock_provider: Callable[[str, str], MockProvider]
+    ) -> None:
         """Test that _stream() correctly handles parameters."""
         pytest.importorskip("langchain_core")
 
@@ -356,15 +398,12 @@ class TestLangChainStreaming:
             pytest.skip("langchain-core is not available")
 
         router = Router(strategy="round-robin")
-        config = ProviderConfig(name="mock", model="mock-normal")
-        router.add_provider(MockProvider(config))
+        router.add_provider(make_mock_provider("mock", "mock-normal"))
 
         llm = MultiLLMOrchestrator(router=router)
 
         # Stream with parameters
-        chunks = []
-        for chunk in llm._stream("test", max_tokens=12, temperature=0.9):
-            chunks.append(chunk)
+        chunks = list(llm._stream("test", max_tokens=12, temperature=0.9))
 
         # Verify max_tokens limit
         streamed_response = "".join(chunks)
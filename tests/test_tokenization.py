@@ -7,10 +7,25 @@ This module tests token counting functionality including:
 - Error handling when tiktoken fails
 """
 
+import sys
+from collections.abc import Iterator
+
 import pytest
 from unittest.mock import patch, MagicMock
 
-from orchestrator.tokenization import count_tokens, estimate_tokens_fallback
+from orchestrator.tokenization import (
+    _get_encoder,
+    count_tokens,
+    estimate_tokens_fallback,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_encoder_cache() -> Iterator[None]:
+    """Isolate tests from encoders (or cached failures) of other tests."""
+    _get_encoder.cache_clear()
+    yield
+    _get_encoder.cache_clear()
 
 
 class TestCountTokens:
@@ -27,6 +42,16 @@ class TestCountTokens:
         """Test token counting for empty string."""
         assert count_tokens("") == 0
 
+    def test_count_tokens_empty_string_skips_tiktoken(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that empty text returns 0 without resolving an encoder."""
+        _get_encoder.cache_clear()
+        monkeypatch.setitem(sys.modules, "tiktoken", None)
+
+        assert count_tokens("", model="gpt-4") == 0
+        assert _get_encoder.cache_info().misses == 0
+
     def test_count_tokens_long_text(self) -> None:
         """Test token counting for long text."""
         text = "This is a longer sentence with multiple words. " * 100
@@ -48,16 +73,21 @@ class TestCountTokens:
         # GPT-4 and GPT-3.5 should have similar token counts
         assert abs(tokens_35 - tokens_4) <= 2
 
-    def test_count_tokens_fallback_on_tiktoken_error(self) -> None:
-        """Test fallback to word count when tiktoken raises exception."""
-        # Mock the tiktoken import to raise exception during encoding
-        with patch("builtins.__import__", side_effect=ImportError("tiktoken not found")):
-            text = "Hello world test"  # 3 words
-            tokens = count_tokens(text)
+    def test_count_tokens_fallback_on_tiktoken_error(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test fallback to word count when tiktoken cannot be imported."""
+        # Drop cached encoders so count_tokens() has to import tiktoken again
+        _get_encoder.cache_clear()
+        # A None entry in sys.modules makes "import tiktoken" raise ImportError
+        monkeypatch.setitem(sys.modules, "tiktoken", None)
+
+        text = "Hello world test"  # 3 words
+        tokens = count_tokens(text)
 
-            # Should use fallback: 3 words * 1.3 = 3.9 ≈ 3
-            expected = int(3 * 1.3)
-            assert tokens == expected
+        # Should use fallback: 3 words * 1.3 = 3.9 ≈ 3
+        expected = int(3 * 1.3)
+        assert tokens == expected
 
     def test_count_tokens_fallback_on_encoding_error(self) -> None:
         """Test fallback when tiktoken encoding fails."""
@@ -68,6 +98,33 @@ class TestCountTokens:
         tokens = count_tokens(text)
         assert tokens >= 0  # Should return valid token count (either way)
 
+    def test_count_tokens_resolves_encoder_once_per_model(self) -> None:
+        """Test that the tiktoken encoder is looked up once per model."""
+        encoder = MagicMock()
+        encoder.encode.return_value = [1, 2, 3]
+        _get_encoder.cache_clear()
+
+        try:
+            with patch("tiktoken.encoding_for_model", return_value=encoder) as lookup:
+                assert count_tokens("a b c", model="gpt-4") == 3
+                assert count_tokens("d e f", model="gpt-4") == 3
+                assert count_tokens("g h i", model="gpt-3.5-turbo") == 3
+        finally:
+            # Don't leak the fake encoders into other tests
+            _get_encoder.cache_clear()
+
+        assert [c.args for c in lookup.call_args_list] == [("gpt-4",), ("gpt-3.5-turbo",)]
+
+    def test_count_tokens_caches_failed_encoder_lookup(self) -> None:
+        """Test that a failing encoder lookup is attempted only once per model."""
+        with patch(
+            "tiktoken.encoding_for_model", side_effect=KeyError("unknown model")
+        ) as lookup:
+            assert count_tokens("a b c", model="unknown") == 3
+            assert count_tokens("d e f g", model="unknown") == 5
+
+        assert lookup.call_count == 1
+
     def test_count_tokens_special_characters(self) -> None:
         """Test token counting with special characters."""
         text = "Hello! @#$% World?"
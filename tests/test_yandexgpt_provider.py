@@ -10,7 +10,12 @@ This module tests all YandexGPTProvider functionality including:
 - Configuration validation
 """
 
+import asyncio
+from collections.abc import Callable, Iterator
+from typing import Any
+
 import httpx
+import orjson
 import pytest
 import pytest_httpx
 
@@ -25,391 +30,376 @@ from orchestrator.providers.base import (
 )
 from orchestrator.providers.yandexgpt import YandexGPTProvider
 
+# Every request in this module is a POST to the completion endpoint, so
+# mocked responses are registered without url= or method= to match against
+COMPLETION_URL = "https://llm.api.cloud.yandex.net/foundationModels/v1/completion"
+
+# Pre-serialized completion bodies (sent with JSON_HEADERS)
+JSON_HEADERS = {"Content-Type": "application/json"}
+MINIMAL_RESPONSE_BYTES = orjson.dumps(
+    {
+        "result": {
+            "alternatives": [{"message": {"role": "assistant", "text": "Response"}}]
+        }
+    }
+)
+FULL_RESPONSE_BYTES = orjson.dumps(
+    {
+        "result": {
+            "alternatives": [
+                {
+                    "message": {"role": "assistant", "text": "Test response"},
+                    "status": "ALTERNATIVE_STATUS_FINAL",
+                }
+            ],
+            "usage": {
+                "inputTextTokens": "10",
+                "completionTokens": "50",
+                "totalTokens": "60",
+            },
+        }
+    }
+)
+
+# Keep the whole file on one xdist worker (--dist=loadgroup) so the
+# module-scoped yandex_provider is built once rather than once per worker
+pytestmark = pytest.mark.xdist_group(name="yandexgpt")
+
+
+@pytest.fixture(scope="module")
+def http_client(
+    event_loop: asyncio.AbstractEventLoop,
+) -> Iterator[httpx.AsyncClient]:
+    """Share one HTTPX client (and connection pool) across YandexGPT tests."""
+    client = httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=10, max_connections=10)
+    )
+    yield client
+    event_loop.run_until_complete(client.aclose())
+
+
+@pytest.fixture(scope="module")
+def yandex_provider(
+    http_client: httpx.AsyncClient,
+    make_config: Callable[..., ProviderConfig],
+) -> YandexGPTProvider:
+    """Share one default YandexGPTProvider across the module.
+
+    The provider holds no per-request state and httpx_mock intercepts the
+    shared client in every test, so one instance is enough. Tests that need
+    a custom model build their own provider on the same client.
+    """
+    return YandexGPTProvider(
+        make_config(
+            name="yandexgpt", api_key="test_iam_token", folder_id="test_folder_id"
+        ),
+        http_client=http_client,
+    )
+
+def _sent_payload(httpx_mock: pytest_httpx.HTTPXMock) -> dict[str, Any]:
+    """Return the decoded JSON body of the single request sent in a test."""
+    request = httpx_mock.get_request()
+    assert request is not None
+    payload: dict[str, Any] = orjson.loads(request.content)
+    return payload
+
 
 class TestYandexGPTProviderGenerate:
     """Test text generation functionality."""
 
     @pytest.mark.asyncio
-    async def test_generate_success(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
+    async def test_generate_success(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+        yandex_provider: YandexGPTProvider,
+    ) -> None:
         """Test successful text generation.
 
         Verifies that generate() correctly sends request and parses response.
         """
-        httpx_mock.add_response(
-            url="https://llm.api.cloud.yandex.net/foundationModels/v1/completion",
-            method="POST",
-            json={
-                "result": {
-                    "alternatives": [
-                        {
-                            "message": {
-                                "role": "assistant",
-                                "text": "Test response"
-                            },
-                            "status": "ALTERNATIVE_STATUS_FINAL"
-                        }
-                    ],
-                    "usage": {
-                        "inputTextTokens": "10",
-                        "completionTokens": "50",
-                        "totalTokens": "60"
-                    }
-                }
-            },
-        )
+        httpx_mock.add_response(content=FULL_RESPONSE_BYTES, headers=JSON_HEADERS)
 
-        config = ProviderConfig(
-            name="yandexgpt", api_key="test_iam_token", folder_id="test_folder_id"
-        )
-        provider = YandexGPTProvider(config)
-
-        response = await provider.generate("test prompt")
+        response = await yandex_provider.generate("test prompt")
         assert response == "Test response"
 
+        # Responses match any request, so check the endpoint once here
+        request = httpx_mock.get_request()
+        assert request is not None
+        assert request.method == "POST"
+        assert request.url == COMPLETION_URL
+
     @pytest.mark.asyncio
-    async def test_generate_with_params(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
+    async def test_generate_with_params(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+        yandex_provider: YandexGPTProvider,
+    ) -> None:
         """Test generation with custom GenerationParams.
 
         Verifies that temperature and max_tokens are correctly passed to API.
         """
-        httpx_mock.add_response(
-            url="https://llm.api.cloud.yandex.net/foundationModels/v1/completion",
-            method="POST",
-            json={
-                "result": {
-                    "alternatives": [
-                        {
-                            "message": {
-                                "role": "assistant",
-                                "text": "Response"
-                            }
-                        }
-                    ]
-                }
-            },
-        )
-
-        config = ProviderConfig(
-            name="yandexgpt", api_key="test_iam_token", folder_id="test_folder_id"
-        )
-        provider = YandexGPTProvider(config)
+        httpx_mock.add_response(content=MINIMAL_RESPONSE_BYTES, headers=JSON_HEADERS)
 
         params = GenerationParams(max_tokens=500, temperature=0.8)
-        response = await provider.generate("test", params=params)
+        response = await yandex_provider.generate("test", params=params)
         assert response == "Response"
 
         # Verify request payload
-        request = httpx_mock.get_request()
-        assert request is not None
-        import json
-        payload = json.loads(request.content)
+        payload = _sent_payload(httpx_mock)
         assert payload["completionOptions"]["temperature"] == 0.8
         assert payload["completionOptions"]["maxTokens"] == 500
 
     @pytest.mark.asyncio
-    async def test_generate_with_custom_model(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
+    async def test_generate_with_custom_model(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+        http_client: httpx.AsyncClient,
+        make_config: Callable[..., ProviderConfig],
+    ) -> None:
         """Test generation with custom model (yandexgpt-lite).
 
         Verifies that config.model is used in API request.
         """
-        httpx_mock.add_response(
-            url="https://llm.api.cloud.yandex.net/foundationModels/v1/completion",
-            method="POST",
-            json={
-                "result": {
-                    "alternatives": [
-                        {
-                            "message": {
-                                "role": "assistant",
-                                "text": "Response"
-                            }
-                        }
-                    ]
-                }
-            },
-        )
+        httpx_mock.add_response(content=MINIMAL_RESPONSE_BYTES, headers=JSON_HEADERS)
 
-        config = ProviderConfig(
+        config = make_config(
             name="yandexgpt",
             api_key="test_iam_token",
             folder_id="test_folder_id",
-            model="yandexgpt-lite/latest"
+            model="yandexgpt-lite/latest",
         )
-        provider = YandexGPTProvider(config)
+        provider = YandexGPTProvider(config, http_client=http_client)
 
         await provider.generate("test")
 
         # Verify modelUri in request
-        request = httpx_mock.get_request()
-        assert request is not None
-        import json
-        payload = json.loads(request.content)
+        payload = _sent_payload(httpx_mock)
         assert payload["modelUri"] == "gpt://test_folder_id/yandexgpt-lite/latest"
 
     @pytest.mark.asyncio
-    async def test_generate_with_full_model_uri(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
+    async def test_generate_with_full_model_uri(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+        http_client: httpx.AsyncClient,
+        make_config: Callable[..., ProviderConfig],
+    ) -> None:
         """Test generation with full model URI (gpt://...).
 
         Verifies that full URI in config.model is used as-is.
         """
-        httpx_mock.add_response(
-            url="https://llm.api.cloud.yandex.net/foundationModels/v1/completion",
-            method="POST",
-            json={
-                "result": {
-                    "alternatives": [
-                        {
-                            "message": {
-                                "role": "assistant",
-                                "text": "Response"
-                            }
-                        }
-                    ]
-                }
-            },
-        )
+        httpx_mock.add_response(content=MINIMAL_RESPONSE_BYTES, headers=JSON_HEADERS)
 
-        config = ProviderConfig(
+        config = make_config(
             name="yandexgpt",
             api_key="test_iam_token",
             folder_id="test_folder_id",
-            model="gpt://custom_folder/custom_model/latest"
+            model="gpt://custom_folder/custom_model/latest",
         )
-        provider = YandexGPTProvider(config)
+        provider = YandexGPTProvider(config, http_client=http_client)
 
         await provider.generate("test")
 
         # Verify full URI is used as-is
-        request = httpx_mock.get_request()
-        assert request is not None
-        import json
-        payload = json.loads(request.content)
+        payload = _sent_payload(httpx_mock)
         assert payload["modelUri"] == "gpt://custom_folder/custom_model/latest"
 
 
-class TestYandexGPTProviderErrors:
-    """Test error handling and status code mapping."""
-
-    @pytest.mark.asyncio
-    async def test_error_400_invalid_request(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
-        """Test handling of 400 Bad Request error."""
-        httpx_mock.add_response(
-            url="https://llm.api.cloud.yandex.net/foundationModels/v1/completion",
-            method="POST",
-            status_code=400,
-            json={"message": "Invalid request format"},
-        )
-
-        config = ProviderConfig(
-            name="yandexgpt", api_key="test_iam_token", folder_id="test_folder_id"
-        )
-        provider = YandexGPTProvider(config)
-
-        with pytest.raises(InvalidRequestError, match="Bad request"):
-            await provider.generate("test")
-
-    @pytest.mark.asyncio
-    async def test_error_401_authentication(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
-        """Test handling of 401 Authentication error."""
-        httpx_mock.add_response(
-            url="https://llm.api.cloud.yandex.net/foundationModels/v1/completion",
-            method="POST",
-            status_code=401,
-            json={"message": "Invalid or expired IAM token"},
-        )
-
-        config = ProviderConfig(
-            name="yandexgpt", api_key="invalid_token", folder_id="test_folder_id"
-        )
-        provider = YandexGPTProvider(config)
-
-        with pytest.raises(AuthenticationError, match="Invalid or expired IAM token"):
-            await provider.generate("test")
-
     @pytest.mark.asyncio
-    async def test_error_403_access_denied(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
-        """Test handling of 403 Access Denied error."""
-        httpx_mock.add_response(
-            url="https://llm.api.cloud.yandex.net/foundationModels/v1/completion",
-            method="POST",
-            status_code=403,
-            json={"message": "Access denied"},
-        )
-
-        config = ProviderConfig(
-            name="yandexgpt", api_key="test_iam_token", folder_id="invalid_folder_id"
-        )
-        provider = YandexGPTProvider(config)
-
-        with pytest.raises(AuthenticationError, match="Access denied"):
-            await provider.generate("test")
+    async def test_generate_with_custom_transport(
+        self,
+        make_config: Callable[..., ProviderConfig],
+    ) -> None:
+        """Test generation through an injected client with its own transport.
+
+        Verifies that the provider sends requests through the passed
+        http_client rather than an internally built one, so alternative
+        transports (e.g. aiohttp-based) can be plugged in.
+        """
+        sent: list[httpx.Request] = []
 
-    @pytest.mark.asyncio
-    async def test_error_404_model_not_found(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
-        """Test handling of 404 Not Found error."""
-        httpx_mock.add_response(
-            url="https://llm.api.cloud.yandex.net/foundationModels/v1/completion",
-            method="POST",
-            status_code=404,
-            json={"message": "Model not found"},
-        )
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            return httpx.Response(
+                200, content=MINIMAL_RESPONSE_BYTES, headers=JSON_HEADERS
+            )
 
-        config = ProviderConfig(
+        config = make_config(
             name="yandexgpt", api_key="test_iam_token", folder_id="test_folder_id"
         )
-        provider = YandexGPTProvider(config)
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            provider = YandexGPTProvider(config, http_client=client)
+            response = await provider.generate("test")
 
-        with pytest.raises(InvalidRequestError, match="Model not found"):
-            await provider.generate("test")
+        assert response == "Response"
+        assert [request.url for request in sent] == [COMPLETION_URL]
 
-    @pytest.mark.asyncio
-    async def test_error_429_rate_limit(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
-        """Test handling of 429 Rate Limit error."""
-        httpx_mock.add_response(
-            url="https://llm.api.cloud.yandex.net/foundationModels/v1/completion",
-            method="POST",
-            status_code=429,
-            json={"message": "Rate limit exceeded"},
-        )
 
-        config = ProviderConfig(
-            name="yandexgpt", api_key="test_iam_token", folder_id="test_folder_id"
-        )
-        provider = YandexGPTProvider(config)
-
-        with pytest.raises(RateLimitError, match="Rate limit exceeded"):
-            await provider.generate("test")
+class TestYandexGPTProviderErrors:
+    """Test error handling and status code mapping."""
 
     @pytest.mark.asyncio
-    async def test_error_500_server_error(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
-        """Test handling of 500 Server Error."""
+    @pytest.mark.parametrize(
+        ("status_code", "message", "error", "match"),
+        [
+            pytest.param(
+                400, "Invalid request format", InvalidRequestError, "Bad request",
+                id="400-invalid-request",
+            ),
+            pytest.param(
+                401,
+                "Invalid or expired IAM token",
+                AuthenticationError,
+                "Invalid or expired IAM token",
+                id="401-authentication",
+            ),
+            pytest.param(
+                403, "Access denied", AuthenticationError, "Access denied",
+                id="403-access-denied",
+            ),
+            pytest.param(
+                404, "Model not found", InvalidRequestError, "Model not found",
+                id="404-model-not-found",
+            ),
+            pytest.param(
+                429, "Rate limit exceeded", RateLimitError, "Rate limit exceeded",
+                id="429-rate-limit",
+            ),
+            pytest.param(
+                500, "Internal server error", ProviderError, "Server error",
+                id="500-server-error",
+            ),
+        ],
+    )
+    async def test_error_status(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+        yandex_provider: YandexGPTProvider,
+        status_code: int,
+        message: str,
+        error: type[ProviderError],
+        match: str,
+    ) -> None:
+        """Test that each HTTP error status maps to the right exception."""
         httpx_mock.add_response(
-            url="https://llm.api.cloud.yandex.net/foundationModels/v1/completion",
-            method="POST",
-            status_code=500,
-            json={"message": "Internal server error"},
+            status_code=status_code,
+            json={"message": message},
         )
 
-        config = ProviderConfig(
-            name="yandexgpt", api_key="test_iam_token", folder_id="test_folder_id"
-        )
-        provider = YandexGPTProvider(config)
-
-        with pytest.raises(ProviderError, match="Server error"):
-            await provider.generate("test")
+        with pytest.raises(error, match=match):
+            await yandex_provider.generate("test")
 
 
 class TestYandexGPTProviderNetworkErrors:
     """Test network error handling."""
 
     @pytest.mark.asyncio
-    async def test_timeout_error(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
-        """Test handling of timeout errors."""
-        httpx_mock.add_exception(
-            httpx.TimeoutException("Request timed out"),
-            url="https://llm.api.cloud.yandex.net/foundationModels/v1/completion",
-        )
-
-        config = ProviderConfig(
-            name="yandexgpt", api_key="test_iam_token", folder_id="test_folder_id"
-        )
-        provider = YandexGPTProvider(config)
-
-        with pytest.raises(TimeoutError, match="timed out"):
-            await provider.generate("test")
-
-    @pytest.mark.asyncio
-    async def test_connection_error(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
-        """Test handling of connection errors."""
-        httpx_mock.add_exception(
-            httpx.ConnectError("Connection failed"),
-            url="https://llm.api.cloud.yandex.net/foundationModels/v1/completion",
-        )
-
-        config = ProviderConfig(
-            name="yandexgpt", api_key="test_iam_token", folder_id="test_folder_id"
-        )
-        provider = YandexGPTProvider(config)
-
-        with pytest.raises(ProviderError, match="Connection error"):
-            await provider.generate("test")
-
-    @pytest.mark.asyncio
-    async def test_network_error(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
-        """Test handling of network errors."""
-        httpx_mock.add_exception(
-            httpx.NetworkError("Network error"),
-            url="https://llm.api.cloud.yandex.net/foundationModels/v1/completion",
-        )
-
-        config = ProviderConfig(
-            name="yandexgpt", api_key="test_iam_token", folder_id="test_folder_id"
-        )
-        provider = YandexGPTProvider(config)
-
-        with pytest.raises(ProviderError, match="Network error"):
-            await provider.generate("test")
+    @pytest.mark.parametrize(
+        ("exception", "error", "match"),
+        [
+            pytest.param(
+                httpx.TimeoutException("Request timed out"), TimeoutError, "timed out",
+                id="timeout",
+            ),
+            pytest.param(
+                httpx.ConnectError("Connection failed"), ProviderError, "Connection error",
+                id="connection-error",
+            ),
+            pytest.param(
+                httpx.NetworkError("Network error"), ProviderError, "Network error",
+                id="network-error",
+            ),
+        ],
+    )
+    async def test_network_error(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+        yandex_provider: YandexGPTProvider,
+        exception: Exception,
+        error: type[ProviderError],
+        match: str,
+    ) -> None:
+        """Test that httpx transport errors map to provider exceptions."""
+        httpx_mock.add_exception(exception)
+
+        with pytest.raises(error, match=match):
+            await yandex_provider.generate("test")
 
 
 class TestYandexGPTProviderHealthCheck:
     """Test health check functionality."""
 
     @pytest.mark.asyncio
-    async def test_health_check_success(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
+    async def test_health_check_success(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+        yandex_provider: YandexGPTProvider,
+    ) -> None:
         """Test successful health check.
 
         Verifies that health_check() returns True when API request succeeds.
         """
-        httpx_mock.add_response(
-            url="https://llm.api.cloud.yandex.net/foundationModels/v1/completion",
-            method="POST",
-            json={
-                "result": {
-                    "alternatives": [
-                        {
-                            "message": {
-                                "role": "assistant",
-                                "text": "Hi"
-                            }
-                        }
-                    ]
-                }
-            },
-        )
+        httpx_mock.add_response(content=MINIMAL_RESPONSE_BYTES, headers=JSON_HEADERS)
 
-        config = ProviderConfig(
-            name="yandexgpt", api_key="test_iam_token", folder_id="test_folder_id"
-        )
-        provider = YandexGPTProvider(config)
-
-        is_healthy = await provider.health_check()
+        is_healthy = await yandex_provider.health_check()
         assert is_healthy is True
 
     @pytest.mark.asyncio
-    async def test_health_check_failure(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
+    async def test_health_check_leaves_shared_client_timeout(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+        http_client: httpx.AsyncClient,
+        yandex_provider: YandexGPTProvider,
+    ) -> None:
+        """Test that the short health-check timeout is applied per request.
+
+        The client may be shared with other providers, so health_check()
+        must not change its timeout.
+        """
+        httpx_mock.add_response(content=MINIMAL_RESPONSE_BYTES, headers=JSON_HEADERS)
+        client_timeout = http_client.timeout
+
+        await yandex_provider.health_check()
+
+        request = httpx_mock.get_request()
+        assert request is not None
+        assert request.extensions["timeout"]["read"] == 5.0
+        assert http_client.timeout == client_timeout
+
+    @pytest.mark.asyncio
+    async def test_health_check_failure(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+        yandex_provider: YandexGPTProvider,
+    ) -> None:
         """Test failed health check.
 
         Verifies that health_check() returns False when API request fails.
         """
         httpx_mock.add_response(
-            url="https://llm.api.cloud.yandex.net/foundationModels/v1/completion",
-            method="POST",
             status_code=401,
             json={"message": "Invalid token"},
         )
 
-        config = ProviderConfig(
-            name="yandexgpt", api_key="invalid_token", folder_id="test_folder_id"
-        )
-        provider = YandexGPTProvider(config)
-
-        is_healthy = await provider.health_check()
+        is_healthy = await yandex_provider.health_check()
         assert is_healthy is False
 
 
 class TestYandexGPTProviderConfig:
     """Test configuration handling."""
 
+    def test_shared_http_client_is_used(
+        self,
+        http_client: httpx.AsyncClient,
+        make_config: Callable[..., ProviderConfig],
+    ) -> None:
+        """Test that a passed http_client is used instead of a new one."""
+        config = make_config(
+            name="yandexgpt", api_key="test_iam_token", folder_id="test_folder_id"
+        )
+        provider = YandexGPTProvider(config, http_client=http_client)
+
+        assert provider._client is http_client
+
     def test_missing_api_key_raises_error(self) -> None:
         """Test that missing api_key raises ValueError."""
         config = ProviderConfig(name="yandexgpt", api_key=None, folder_id="test_folder_id")
@@ -424,114 +414,85 @@ class TestYandexGPTProviderConfig:
         with pytest.raises(ValueError, match="folder_id is required"):
             YandexGPTProvider(config)
 
-    def test_build_model_uri_automatic(self) -> None:
-        """Test automatic modelUri building from config."""
-        config = ProviderConfig(
-            name="yandexgpt",
-            api_key="test_iam_token",
-            folder_id="test_folder_id",
-            model="yandexgpt/latest"
-        )
-        provider = YandexGPTProvider(config)
-
-        uri = provider._build_model_uri()
-        assert uri == "gpt://test_folder_id/yandexgpt/latest"
-
-    def test_build_model_uri_default(self) -> None:
-        """Test modelUri building with default model."""
-        config = ProviderConfig(
-            name="yandexgpt",
-            api_key="test_iam_token",
-            folder_id="test_folder_id"
-        )
-        provider = YandexGPTProvider(config)
-
-        uri = provider._build_model_uri()
-        assert uri == "gpt://test_folder_id/yandexgpt/latest"
-
-    def test_build_model_uri_full_uri(self) -> None:
-        """Test modelUri building with full URI (gpt://...)."""
-        config = ProviderConfig(
+    @pytest.mark.parametrize(
+        ("model", "expected"),
+        [
+            pytest.param(
+                "yandexgpt/latest", "gpt://test_folder_id/yandexgpt/latest",
+                id="automatic",
+            ),
+            pytest.param(None, "gpt://test_folder_id/yandexgpt/latest", id="default"),
+            pytest.param(
+                "gpt://custom_folder/custom_model/latest",
+                "gpt://custom_folder/custom_model/latest",
+                id="full-uri",
+            ),
+        ],
+    )
+    def test_build_model_uri(
+        self,
+        http_client: httpx.AsyncClient,
+        make_config: Callable[..., ProviderConfig],
+        model: str | None,
+        expected: str,
+    ) -> None:
+        """Test modelUri building from config.model (or the default model).
+
+        Uses the shared client, so no HTTPX client is built just to format
+        a string.
+        """
+        config = make_config(
             name="yandexgpt",
             api_key="test_iam_token",
             folder_id="test_folder_id",
-            model="gpt://custom_folder/custom_model/latest"
+            model=model,
         )
-        provider = YandexGPTProvider(config)
+        provider = YandexGPTProvider(config, http_client=http_client)
 
-        uri = provider._build_model_uri()
-        assert uri == "gpt://custom_folder/custom_model/latest"
+        assert provider._build_model_uri() == expected
 
 
 class TestYandexGPTProviderResponseParsing:
     """Test response parsing and edge cases."""
 
     @pytest.mark.asyncio
-    async def test_response_parsing_correct_structure(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
+    async def test_response_parsing_correct_structure(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+        yandex_provider: YandexGPTProvider,
+    ) -> None:
         """Test parsing of correct response structure."""
-        httpx_mock.add_response(
-            url="https://llm.api.cloud.yandex.net/foundationModels/v1/completion",
-            method="POST",
-            json={
-                "result": {
-                    "alternatives": [
-                        {
-                            "message": {
-                                "role": "assistant",
-                                "text": "Correct response"
-                            },
-                            "status": "ALTERNATIVE_STATUS_FINAL"
-                        }
-                    ],
-                    "usage": {
-                        "inputTextTokens": "10",
-                        "completionTokens": "50",
-                        "totalTokens": "60"
-                    }
-                }
-            },
-        )
-
-        config = ProviderConfig(
-            name="yandexgpt", api_key="test_iam_token", folder_id="test_folder_id"
-        )
-        provider = YandexGPTProvider(config)
+        httpx_mock.add_response(content=FULL_RESPONSE_BYTES, headers=JSON_HEADERS)
 
-        response = await provider.generate("test")
-        assert response == "Correct response"
+        response = await yandex_provider.generate("test")
+        assert response == "Test response"
 
     @pytest.mark.asyncio
-    async def test_response_parsing_invalid_json(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
+    async def test_response_parsing_invalid_json(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+        yandex_provider: YandexGPTProvider,
+    ) -> None:
         """Test handling of invalid JSON response."""
         httpx_mock.add_response(
-            url="https://llm.api.cloud.yandex.net/foundationModels/v1/completion",
-            method="POST",
             status_code=200,
             text="Invalid JSON response",
         )
 
-        config = ProviderConfig(
-            name="yandexgpt", api_key="test_iam_token", folder_id="test_folder_id"
-        )
-        provider = YandexGPTProvider(config)
-
         with pytest.raises(ProviderError, match="Invalid response format"):
-            await provider.generate("test")
+            await yandex_provider.generate("test")
 
     @pytest.mark.asyncio
-    async def test_response_parsing_missing_fields(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
+    async def test_response_parsing_missing_fields(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+        yandex_provider: YandexGPTProvider,
+    ) -> None:
         """Test handling of response with missing required fields."""
         httpx_mock.add_response(
-            url="https://llm.api.cloud.yandex.net/foundationModels/v1/completion",
-            method="POST",
             json={"result": {}},  # Missing alternatives
         )
 
-        config = ProviderConfig(
-            name="yandexgpt", api_key="test_iam_token", folder_id="test_folder_id"
-        )
-        provider = YandexGPTProvider(config)
-
         with pytest.raises(ProviderError, match="Invalid response format"):
-            await provider.generate("test")
+            await yandex_provider.generate("test")
 